@@ -2,6 +2,8 @@
 ASGI config for SsafyFinal project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
+The movie comment stream (/api/community/<movie_id>/comments/stream/) is an async
+view and only streams when served through this callable (e.g. uvicorn/daphne).
 
 For more information on this file, see
 https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
@@ -55,6 +55,7 @@ INSTALLED_APPS = [
 
 AUTH_USER_MODEL = 'account.Users' # 사용자 정의 User 모델 지정
 WSGI_APPLICATION = 'src.SsafyFinal.wsgi.application'
+ASGI_APPLICATION = 'src.SsafyFinal.asgi.application'
 
 MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',
@@ -143,8 +144,10 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 # Django REST framework 설정
 REST_FRAMEWORK = {
+    # 토큰 클레임만으로 request.user(AccountTokenUser)를 만들어 요청마다 Users 조회를 하지 않습니다.
+    # 실제 Users 모델이 필요한 뷰는 authentication_classes = [DatabaseUserJWTAuthentication]으로 지정합니다.
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'rest_framework_simplejwt.authentication.JWTStatelessUserAuthentication',
     ),
     # 'DEFAULT_PERMISSION_CLASSES': [ # API 전역 권한 설정 (필요시 주석 해제 및 수정)
     #     'rest_framework.permissions.IsAuthenticated',
@@ -157,7 +160,7 @@ SIMPLE_JWT = {
     'REFRESH_TOKEN_LIFETIME': timedelta(days=7),    # 리프레시 토큰 유효 기간 (예: 7일)
     'ROTATE_REFRESH_TOKENS': True,                 # 리프레시 토큰 사용 시 새 리프레시 토큰 발급 여부
     'BLACKLIST_AFTER_ROTATION': True,              # 회전 시 이전 리프레시 토큰을 블랙리스트에 추가할지 여부
-    'UPDATE_LAST_LOGIN': True,                     # 토큰 발급/갱신 시 사용자의 last_login 필드 업데이트 여부
+    'UPDATE_LAST_LOGIN': False,                    # 로그인 시각은 LastLoginBuffer가 last_login_at에 모아서 기록하므로 끈다.
 
     'ALGORITHM': 'HS256',                          # 서명 알고리즘
     'SIGNING_KEY': SECRET_KEY,                     # 서명 키 (settings.SECRET_KEY 사용)
@@ -175,7 +178,7 @@ SIMPLE_JWT = {
 
     'AUTH_TOKEN_CLASSES': ('rest_framework_simplejwt.tokens.AccessToken',), # 사용할 액세스 토큰 클래스
     'TOKEN_TYPE_CLAIM': 'token_type',              # 토큰 타입을 나타내는 클레임 이름
-    'TOKEN_USER_CLASS': 'rest_framework_simplejwt.models.TokenUser', # 토큰으로부터 생성될 사용자 클래스
+    'TOKEN_USER_CLASS': 'src.apps.account.infrastructure.authentication.AccountTokenUser', # 토큰으로부터 생성될 사용자 클래스 (nickname, is_staff 클레임 사용)
 
     'JTI_CLAIM': 'jti',                            # JWT ID 클레임 이름 (토큰 고유 식별자)
 
@@ -204,6 +207,8 @@ CORS_ALLOWED_ORIGINS = [
 GOOGLE_CLIENT_ID = "24120708973-o7fr06vmr3qdhvf6h6mb6mjp3gfhttim.apps.googleusercontent.com"
 # 위 값은 예시이므로, 실제 Google Cloud Console에서 발급받은 정확한 클라이언트 ID로 교체해야 합니다.
 # 환경 변수로 관리하는 것을 권장합니다. (예: os.environ.get('GOOGLE_CLIENT_ID'))
+# Google ID 토큰 서명 인증서 주소. 로컬 테스트용 키 서버로 바꿀 수 있습니다.
+GOOGLE_OAUTH2_CERTS_URL = "https://www.googleapis.com/oauth2/v1/certs"
 
 ACCOUNT_CONTAINER = "src.apps.account.containers.AccountContainer"
 INJECTOR_MODULES = [
@@ -246,4 +251,91 @@ LOGGING = {
             "propagate": False,
         },
     },
-}
\ No newline at end of file
+}
+
+# LoggingMiddleware가 요청마다 처리 시간, SQL 수, SQL 시간을 로그 필드와 Server-Timing 응답 헤더로 내보냅니다.
+# 응답 헤더로 내부 처리 시간이 노출되는 것이 싫다면 False로 끕니다. (로그는 계속 남습니다)
+SERVER_TIMING_HEADER_ENABLED = True
+# URL 이름별 성능 예산. 넘으면 경고 로그를 남깁니다. '*'는 따로 지정하지 않은 엔드포인트의 기본 예산입니다.
+REQUEST_PERFORMANCE_BUDGETS = {
+    '*': {'max_queries': 20, 'max_duration_ms': 500},
+    'social_login_register': {'max_queries': 10, 'max_duration_ms': 1000},  # Google 인증서 갱신 시간 포함
+    'nickname_availability': {'max_queries': 1, 'max_duration_ms': 100},
+}
+
+# 캐시 설정
+# movie_detail: 영화 상세 응답(MovieDetailDto) 캐시. TIMEOUT(초) 경과 또는 MAX_ENTRIES 초과 시 제거됩니다.
+# 여러 워커 프로세스 간 무효화를 공유하려면 Redis 등 공유 백엔드로 교체합니다.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'movie_detail': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'movie-detail',
+        'TIMEOUT': 300,
+        'OPTIONS': {
+            'MAX_ENTRIES': 2000,
+        },
+    },
+    'movie_search_count': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'movie-search-count',
+        'TIMEOUT': 60,
+        'OPTIONS': {
+            'MAX_ENTRIES': 5000,
+        },
+    },
+    # nickname_taken: 닉네임 사용 가능 여부 조회에서 사용 중으로 확인된 닉네임을 잠시 기억합니다.
+    'nickname_taken': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'nickname-taken',
+        'TIMEOUT': 30,
+        'OPTIONS': {
+            'MAX_ENTRIES': 10000,
+        },
+    },
+}
+MOVIE_DETAIL_CACHE_ALIAS = 'movie_detail'
+NICKNAME_TAKEN_CACHE_ALIAS = 'nickname_taken'
+MOVIE_SEARCH_COUNT_CACHE_ALIAS = 'movie_search_count'
+# count_mode=estimated 요청에서 이 개수를 넘으면 정확히 세지 않고 "상한+"으로 응답합니다.
+MOVIE_SEARCH_COUNT_ESTIMATE_CAP = 1000
+
+# True이면 DjangoMovieRepository의 애그리거트 매퍼가 SQL을 실행할 때 예외를 발생시킵니다. (N+1 탐지용, 테스트/개발 환경)
+MOVIE_STRICT_AGGREGATE_MAPPING = False
+
+# 자동완성 인덱스는 워커별 메모리에 있으므로, 다른 워커에서 일어난 변경은 이 주기(초)마다 백그라운드 스레드가 DB에서 전체 재구성해 반영합니다.
+MOVIE_AUTOCOMPLETE_REFRESH_SECONDS = 600
+# 한두 글자 접두어마다 미리 계산해 두는 인기순 상위 후보 수. 자동완성 API의 최대 limit 이상이어야 합니다.
+MOVIE_AUTOCOMPLETE_TOP_SIZE = 20
+
+# 한글 부분 문자열/초성 검색(n-gram 색인)이 돌려주는 최대 영화 수. 짧은 검색어가 카탈로그 전체와 일치하는 것을 막습니다.
+MOVIE_KOREAN_SEARCH_MAX_CANDIDATES = 300
+
+# 미리 계산하는 영화 순위 목록(목록 유형 x 장르)별 최대 영화 수
+MOVIE_RANKING_LIST_SIZE = 500
+# 설정하면 각 프로세스가 순위 목록을 처음 조회할 때부터 이 주기(초)마다 백그라운드 스레드에서 순위를 다시 계산합니다.
+# 여러 워커로 배포할 때는 None으로 두고 refresh_movie_rankings 명령을 주기적으로 실행하세요.
+MOVIE_RANKING_REFRESH_INTERVAL_SECONDS = None
+
+# 댓글 실시간 스트림(SSE). 기본 백엔드는 같은 프로세스의 구독자에게만 전달하므로,
+# ASGI 워커를 여러 개 띄울 때는 공유 pub/sub을 쓰는 CommentEventBackend 구현으로 교체합니다.
+COMMENT_EVENT_BACKEND = 'src.apps.review_community.infrastructure.comment_events.InProcessCommentEventBackend'
+COMMENT_STREAM_QUEUE_SIZE = 100
+COMMENT_STREAM_HEARTBEAT_SECONDS = 15
+COMMENT_STREAM_MAX_SECONDS = 300
+
+# 로그인 시각(last_login_at)은 분석용이므로 프로세스 메모리에 모았다가 이 주기(초)마다 한 번의 bulk UPDATE로 기록합니다.
+# 0이면 로그인 요청 안에서 바로 기록하는 동기 모드입니다. (테스트/디버깅용)
+LAST_LOGIN_FLUSH_INTERVAL_SECONDS = 30
+# 버퍼에 쌓을 최대 사용자 수. 가득 차면 주기를 기다리지 않고 바로 기록합니다.
+LAST_LOGIN_BUFFER_MAX_SIZE = 1000
+
+# 리프레시 토큰 블랙리스트 확인용 프로세스별 Bloom 필터. 필터에 걸린 토큰만 DB로 다시 확인합니다.
+# 다른 프로세스에서 블랙리스트에 올린 토큰은 최대 TOKEN_BLACKLIST_SYNC_SECONDS초 뒤에 반영됩니다. (0이면 확인할 때마다 반영)
+TOKEN_BLACKLIST_FILTER_CAPACITY = 100_000
+TOKEN_BLACKLIST_FILTER_ERROR_RATE = 0.001
+TOKEN_BLACKLIST_SYNC_SECONDS = 5
+# 이 주기(초)마다 백그라운드에서 필터를 다시 만들어, 증분 동기화가 놓친 행을 반영하고 만료된 JTI를 정리합니다. (0이면 용량 초과 시에만)
+TOKEN_BLACKLIST_FILTER_REBUILD_SECONDS = 600
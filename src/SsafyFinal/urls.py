@@ -3,8 +3,8 @@ from django.urls import path, include
 
 urlpatterns = [
     path('admin/', admin.site.urls),
-    # ✅ 'apps.'로 시작하는 올바른 경로 사용
-    path('api/accounts/', include('apps.account.interface.urls')),
-    path('api/movies/', include('apps.movie.interface.web.urls')),
-    path('api/community/', include('apps.review_community.interface.urls')),
+    # 앱 모듈은 INSTALLED_APPS와 같은 'src.apps.' 경로로 임포트해야 모듈 단위 싱글턴이 하나만 생긴다.
+    path('api/accounts/', include('src.apps.account.interface.urls')),
+    path('api/movies/', include('src.apps.movie.interface.web.urls')),
+    path('api/community/', include('src.apps.review_community.interface.urls')),
 ]
\ No newline at end of file
@@ -54,3 +54,10 @@ class LogoutRequestDto:
         if not refresh_token:
             raise ValueError("Refresh token은 필수입니다.")
         self.refresh_token = refresh_token
+
+
+class NicknameAvailabilityDto:
+    def __init__(self, nickname, available, reason=None):
+        self.nickname = nickname
+        self.available = available
+        self.reason = reason
@@ -6,6 +6,11 @@ class AuthTokenService(abc.ABC):
     def issue_for_user(self, user_account_id: int) -> Dict[str, str]:
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def issue_for_account(self, user_account) -> Dict[str, str]:
+        """이미 불러온 UserAccount 애그리거트로 토큰을 발급한다. (사용자를 다시 조회하지 않는다)"""
+        raise NotImplementedError
+
     @abc.abstractmethod
     def blacklist(self, refresh_token: str) -> None:
         raise NotImplementedError
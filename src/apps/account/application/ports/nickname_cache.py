@@ -0,0 +1,17 @@
+import abc
+
+
+class TakenNicknameCache(abc.ABC):
+    """최근 사용 중으로 확인된 닉네임(정규화 값)을 잠시 기억한다. 사용 가능한 닉네임은 기억하지 않는다."""
+
+    @abc.abstractmethod
+    def is_taken(self, normalized_nickname: str) -> bool:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def mark_taken(self, normalized_nickname: str) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def forget(self, normalized_nickname: str) -> None:
+        raise NotImplementedError
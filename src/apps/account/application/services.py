@@ -5,10 +5,11 @@ from django.utils import timezone
 from dependency_injector import providers
 
 from .ports.auth_token import AuthTokenService
+from .ports.nickname_cache import TakenNicknameCache
 from .ports.social_verifier import SocialTokenVerifier
 from .dtos import (
     UserAccountDto, UpdateNicknameRequestDto, UserSocialLinkDto,
-    AuthResponseDto, SocialLoginRequestDto, LogoutRequestDto
+    AuthResponseDto, SocialLoginRequestDto, LogoutRequestDto, NicknameAvailabilityDto
 )
 from ..domain.repositories import UserAccountRepository
 from ..domain.aggregates.user_account import UserAccount
@@ -42,7 +43,8 @@ class UserAuthAppService:
             last_login_at=user_account.last_login_at,
         )
 
-    @transaction.atomic
+    # 서비스 단위 트랜잭션을 열지 않는다. 쓰기는 repository.save 한 번뿐이고 save가 필요할 때만 트랜잭션을 연다.
+    # (재방문 로그인은 조회 1회 + last_login_at UPDATE 1회로 끝난다)
     def login_or_register(self, request_dto: SocialLoginRequestDto) -> AuthResponseDto:
         provider = request_dto.provider.lower()
         verifier_factory = self.social_verifier_map.get(provider)
@@ -74,7 +76,7 @@ class UserAuthAppService:
                 nickname_str = request_dto.nickname_suggestion or verified_info.nickname or email_vo.address.split('@')[
                     0]
                 suggested_nickname = NickName(nickname_str)
-                if self.user_account_repository.find_by_nickname(suggested_nickname):
+                if self.user_account_repository.exists_by_nickname(suggested_nickname):
                     raise ValueError(f"닉네임 '{suggested_nickname.name}'은 이미 사용 중입니다.")
 
                 user_account = UserAccount(
@@ -87,7 +89,7 @@ class UserAuthAppService:
                 )
 
         saved_user_account = self.user_account_repository.save(user_account)
-        tokens = self.token_service.issue_for_user(saved_user_account.account_id)
+        tokens = self.token_service.issue_for_account(saved_user_account)
         user_dto = self._map_domain_to_dto(saved_user_account)
 
         return AuthResponseDto(
@@ -102,8 +104,10 @@ class UserAuthAppService:
 
 
 class UserProfileAppService:
-    def __init__(self, user_account_repository: UserAccountRepository):
+    def __init__(self, user_account_repository: UserAccountRepository,
+                 taken_nickname_cache: TakenNicknameCache = None):
         self.user_account_repository = user_account_repository
+        self.taken_nickname_cache = taken_nickname_cache
 
     def _map_domain_to_dto(self, user_account: UserAccount) -> UserAccountDto:
         social_links_dto = [
@@ -133,16 +137,48 @@ class UserProfileAppService:
             raise ValueError("사용자를 찾을 수 없습니다.")
 
         new_nickname = NickName(request_dto.nickname)
+        previous_nickname = user_account.nickname
 
         def is_nickname_unique(nickname_to_check: NickName, current_account_id: int) -> bool:
-            existing_user = self.user_account_repository.find_by_nickname(nickname_to_check)
-            return not (existing_user and existing_user.account_id != current_account_id)
+            return not self.user_account_repository.exists_by_nickname(
+                nickname_to_check, exclude_account_id=current_account_id)
 
         user_account.update_nickname(new_nickname, is_nickname_unique)
         updated_user_account = self.user_account_repository.save(user_account)
+        if self.taken_nickname_cache and previous_nickname != new_nickname:
+            # 이전 닉네임은 곧바로 다른 사용자가 쓸 수 있어야 한다.
+            self.taken_nickname_cache.forget(previous_nickname.normalized)
+            self.taken_nickname_cache.mark_taken(new_nickname.normalized)
         return self._map_domain_to_dto(updated_user_account)
 
 
+class NicknameAvailabilityAppService:
+    """
+    가입/닉네임 변경 폼에서 입력할 때마다 호출하는 닉네임 사용 가능 여부 조회.
+    사용 중으로 확인된 닉네임은 잠시 캐시해 같은 닉네임의 반복 조회가 DB까지 가지 않게 한다.
+    """
+
+    def __init__(self, user_account_repository: UserAccountRepository,
+                 taken_nickname_cache: TakenNicknameCache = None):
+        self.user_account_repository = user_account_repository
+        self.taken_nickname_cache = taken_nickname_cache
+
+    def check_availability(self, nickname: str) -> NicknameAvailabilityDto:
+        try:
+            nickname_vo = NickName(nickname)
+        except ValueError as e:
+            return NicknameAvailabilityDto(nickname=nickname, available=False, reason=str(e))
+
+        normalized = nickname_vo.normalized
+        if self.taken_nickname_cache and self.taken_nickname_cache.is_taken(normalized):
+            return NicknameAvailabilityDto(nickname=nickname, available=False, reason="이미 사용 중인 닉네임입니다.")
+        if self.user_account_repository.exists_by_nickname(nickname_vo):
+            if self.taken_nickname_cache:
+                self.taken_nickname_cache.mark_taken(normalized)
+            return NicknameAvailabilityDto(nickname=nickname, available=False, reason="이미 사용 중인 닉네임입니다.")
+        return NicknameAvailabilityDto(nickname=nickname, available=True)
+
+
 class UserAccountDeactivationAppService:
     def __init__(self, user_account_repository: UserAccountRepository):
         self.user_account_repository = user_account_repository
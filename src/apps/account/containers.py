@@ -1,17 +1,23 @@
 from dependency_injector import containers, providers
 
 from src.apps.account.application.services import UserAuthAppService, UserProfileAppService, \
-    UserAccountDeactivationAppService
+    UserAccountDeactivationAppService, NicknameAvailabilityAppService
+from src.apps.account.infrastructure.adapters.google_certs import GoogleCertificateStore
 from src.apps.account.infrastructure.adapters.google_verifier import GoogleTokenVerifier
+from src.apps.account.infrastructure.last_login_buffer import LastLoginBuffer
+from src.apps.account.infrastructure.nickname_cache import DjangoTakenNicknameCache
 from src.apps.account.infrastructure.repositories import DjangoUserAccountRepository
 from src.apps.account.infrastructure.token_services import SimpleJwtTokenService
 
 
 class AccountContainer(containers.DeclarativeContainer):
-    repository = providers.Factory(DjangoUserAccountRepository)
+    last_login_buffer = providers.Singleton(LastLoginBuffer)
+    repository = providers.Factory(DjangoUserAccountRepository, last_login_buffer=last_login_buffer)
     auth_token_service = providers.Factory(SimpleJwtTokenService)
+    taken_nickname_cache = providers.Singleton(DjangoTakenNicknameCache)
 
-    google_verifier = providers.Factory(GoogleTokenVerifier)
+    google_certificate_store = providers.Singleton(GoogleCertificateStore)
+    google_verifier = providers.Factory(GoogleTokenVerifier, cert_store=google_certificate_store)
 
     social_verifier_map = providers.Dict(
         google=google_verifier
@@ -26,6 +32,12 @@ class AccountContainer(containers.DeclarativeContainer):
     user_profile_service = providers.Factory(
         UserProfileAppService,
         user_account_repository=repository,
+        taken_nickname_cache=taken_nickname_cache,
+    )
+    nickname_availability_service = providers.Factory(
+        NicknameAvailabilityAppService,
+        user_account_repository=repository,
+        taken_nickname_cache=taken_nickname_cache,
     )
     user_deactivation_service = providers.Factory(
         UserAccountDeactivationAppService,
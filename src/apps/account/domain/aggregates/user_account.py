@@ -1,6 +1,15 @@
 from datetime import datetime
 import uuid
 
+
+class UserAccountPart:
+    """저장 시 변경 여부를 추적하는 애그리거트의 영속 단위."""
+    PROFILE = 'profile'  # 이메일, 닉네임 (users 행)
+    LAST_LOGIN = 'last_login'  # 마지막 로그인 시각 (users 행의 last_login_at만)
+    SOCIAL_LINKS = 'social_links'
+    ALL = frozenset({PROFILE, LAST_LOGIN, SOCIAL_LINKS})
+
+
 class UserAccount:
     def __init__(self,
                  account_id,
@@ -8,7 +17,8 @@ class UserAccount:
                  nickname,
                  social_links, 
                  created_at,
-                 last_login_at=None): 
+                 last_login_at=None,
+                 is_staff=False):
         
         
         self._account_id = account_id
@@ -17,11 +27,19 @@ class UserAccount:
         self._social_links = list(social_links) 
         self._created_at = created_at
         self._last_login_at = last_login_at
+        self._is_staff = is_staff
+
+        # 새로 만든 애그리거트는 저장소 상태를 알 수 없으므로 모든 부분이 변경된 것으로 본다.
+        # 저장소가 불러오거나 저장한 뒤에는 mark_clean()으로 초기화된다.
+        self._changed_parts = set(UserAccountPart.ALL)
+        self._persisted_social_links = frozenset()
+        self._is_persisted = False
     
 
     def add_social_link(self, new_social_link):
         if new_social_link not in self._social_links:
             self._social_links.append(new_social_link)
+            self._changed_parts.add(UserAccountPart.SOCIAL_LINKS)
 
     def update_nickname(self, new_nickname, is_nickname_unique_checker):
         if self._nickname == new_nickname:
@@ -29,9 +47,41 @@ class UserAccount:
         if not is_nickname_unique_checker(new_nickname, self.account_id):
             raise ValueError(f"닉네임 '{new_nickname.name}'은 이미 사용 중입니다.")
         self._nickname = new_nickname
+        self._changed_parts.add(UserAccountPart.PROFILE)
 
     def record_login(self, login_time: datetime):
         self._last_login_at = login_time
+        self._changed_parts.add(UserAccountPart.LAST_LOGIN)
+
+    @property
+    def changed_parts(self):
+        return frozenset(self._changed_parts)
+
+    @property
+    def has_changes(self):
+        return bool(self._changed_parts)
+
+    @property
+    def is_persisted(self):
+        return self._is_persisted
+
+    @property
+    def added_social_links(self):
+        """마지막으로 저장소와 맞춘 뒤 새로 생긴 소셜 링크."""
+        return [link for link in self._social_links if link not in self._persisted_social_links]
+
+    @property
+    def removed_social_links(self):
+        """마지막으로 저장소와 맞춘 뒤 없어진 소셜 링크."""
+        return [link for link in self._persisted_social_links if link not in self._social_links]
+
+    def mark_clean(self, account_id=None):
+        """저장소와 상태가 같아졌음을 기록한다. (저장소 구현에서 조회/저장 직후 호출, 신규 저장 시 발급된 ID를 받는다)"""
+        if account_id is not None:
+            self._account_id = account_id
+        self._changed_parts.clear()
+        self._persisted_social_links = frozenset(self._social_links)
+        self._is_persisted = True
     
     def __eq__(self, other):
         return isinstance(other, UserAccount) and self._account_id == other._account_id
@@ -61,4 +111,8 @@ class UserAccount:
 
     @property
     def last_login_at(self):
-        return self._last_login_at
\ No newline at end of file
+        return self._last_login_at
+
+    @property
+    def is_staff(self):
+        return self._is_staff
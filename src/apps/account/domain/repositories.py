@@ -26,6 +26,10 @@ class UserAccountRepository(abc.ABC):
     def find_by_nickname(self, nickname):
         raise NotImplementedError
     
+    @abc.abstractmethod
+    def exists_by_nickname(self, nickname, exclude_account_id=None):
+        raise NotImplementedError
+
     @abc.abstractmethod
     def find_by_social_link(self, social_link):
         raise NotImplementedError
\ No newline at end of file
@@ -1,3 +1,6 @@
+import unicodedata
+
+
 class NickName:
     def __init__(self, name):
         if not name:
@@ -9,6 +12,15 @@ class NickName:
     @property
     def name(self):
         return self.__name
+
+    @property
+    def normalized(self):
+        return self.normalize(self.__name)
+
+    @staticmethod
+    def normalize(name):
+        """중복 판단용 형태. 유니코드 표기(NFC)와 대소문자 차이를 무시한다. (예: 'Nick'과 'nick'은 같은 닉네임)"""
+        return unicodedata.normalize('NFC', unicodedata.normalize('NFC', name).casefold())
     
     def __eq__(self, other):
         if not isinstance(other, NickName):
@@ -0,0 +1,101 @@
+import base64
+import json
+import logging
+import re
+import threading
+import time
+
+import requests
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+GOOGLE_OAUTH2_CERTS_URL = "https://www.googleapis.com/oauth2/v1/certs"
+_MAX_AGE_PATTERN = re.compile(r"max-age=(\d+)")
+
+
+def fetch_certs_with_requests(url, timeout=5):
+    """인증서 JSON({kid: PEM})과 Cache-Control max-age(초, 없으면 None)를 반환한다."""
+    response = requests.get(url, timeout=timeout)
+    response.raise_for_status()
+    match = _MAX_AGE_PATTERN.search(response.headers.get("Cache-Control", ""))
+    return response.json(), int(match.group(1)) if match else None
+
+
+def unverified_key_id(token):
+    """서명 검증 전에 JWT 헤더의 kid만 읽는다. 형식이 잘못되었으면 None."""
+    try:
+        header_segment = token.split(".", 1)[0]
+        header = json.loads(base64.urlsafe_b64decode(header_segment + "=" * (-len(header_segment) % 4)))
+        return header.get("kid")
+    except (ValueError, AttributeError):
+        return None
+
+
+class GoogleCertificateStore:
+    """
+    Google ID 토큰 서명 인증서를 프로세스 단위로 캐시한다.
+    - 응답의 Cache-Control max-age 동안 재사용하고, 만료 refresh_margin_seconds 전부터는 백그라운드 스레드가 미리 갱신한다.
+      갱신에 실패해도 만료 전까지는 기존 인증서로 검증을 계속한다.
+    - 캐시에 없는 kid(키 교체)가 오면 min_refresh_interval_seconds 간격 안에서 한 번 동기로 다시 받는다.
+    fetcher(url) -> (certs, max_age)와 clock을 주입해 로컬 키 서버나 고정 키로 테스트할 수 있다.
+    """
+
+    def __init__(self, certs_url=None, fetcher=None, clock=time.monotonic,
+                 refresh_margin_seconds=300, default_max_age_seconds=3600, min_refresh_interval_seconds=60):
+        self.certs_url = certs_url or getattr(settings, "GOOGLE_OAUTH2_CERTS_URL", GOOGLE_OAUTH2_CERTS_URL)
+        self.fetcher = fetcher or fetch_certs_with_requests
+        self.clock = clock
+        self.refresh_margin_seconds = refresh_margin_seconds
+        self.default_max_age_seconds = default_max_age_seconds
+        self.min_refresh_interval_seconds = min_refresh_interval_seconds
+        self._certs = None
+        self._expires_at = 0.0
+        self._fetched_at = None
+        self._lock = threading.Lock()  # 인증서 갱신(네트워크 요청)을 직렬화한다.
+        self._thread_lock = threading.Lock()  # 백그라운드 스레드 생성만 보호한다. (요청 스레드가 갱신을 기다리지 않도록)
+        self._refresh_thread = None
+
+    def get_certs(self, key_id=None):
+        now = self.clock()
+        certs = self._certs
+        if certs is None or now >= self._expires_at:
+            return self._refresh_now(stale_certs=certs)
+        if key_id and key_id not in certs and now - self._fetched_at >= self.min_refresh_interval_seconds:
+            logger.info(f"캐시에 없는 Google 인증서 키입니다. 인증서를 다시 받습니다. kid: {key_id}")
+            return self._refresh_now(stale_certs=certs)
+        if now >= self._expires_at - self.refresh_margin_seconds:
+            self._refresh_in_background()
+        return certs
+
+    def _fetch(self):
+        certs, max_age = self.fetcher(self.certs_url)
+        fetched_at = self.clock()
+        self._certs = certs
+        self._fetched_at = fetched_at
+        self._expires_at = fetched_at + (max_age if max_age is not None else self.default_max_age_seconds)
+        logger.info(f"Google 인증서를 갱신했습니다. 키 수: {len(certs)}, 유효 시간: {self._expires_at - fetched_at:.0f}초")
+        return certs
+
+    def _refresh_now(self, stale_certs):
+        with self._lock:
+            # 기다리는 동안 다른 스레드가 이미 갱신했다면 그 결과를 쓴다.
+            if self._certs is not stale_certs and self.clock() < self._expires_at:
+                return self._certs
+            return self._fetch()
+
+    def _refresh_in_background(self):
+        with self._thread_lock:
+            if self._refresh_thread and self._refresh_thread.is_alive():
+                return
+            self._refresh_thread = threading.Thread(
+                target=self._background_refresh, name="google-cert-refresh", daemon=True
+            )
+            self._refresh_thread.start()
+
+    def _background_refresh(self):
+        try:
+            with self._lock:
+                self._fetch()
+        except Exception:
+            logger.warning("Google 인증서 백그라운드 갱신 실패. 만료 전까지 기존 인증서를 사용합니다.", exc_info=True)
@@ -1,25 +1,33 @@
 from django.conf import settings
-from google.oauth2 import id_token
-from google.auth.transport import requests
+from google.auth import jwt
 from src.apps.account.application.ports.social_verifier import SocialTokenVerifier, SocialUserInfo
+from src.apps.account.infrastructure.adapters.google_certs import GoogleCertificateStore, unverified_key_id
 
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+GOOGLE_ISSUERS = ("accounts.google.com", "https://accounts.google.com")
+
+
 class GoogleTokenVerifier(SocialTokenVerifier):
+    def __init__(self, cert_store=None):
+        # 인증서는 프로세스 단위 캐시(컨테이너의 Singleton)에서 받으므로, 검증은 보통 네트워크 없이 끝난다.
+        self.cert_store = cert_store or GoogleCertificateStore()
+
     def verify(self, token) -> SocialUserInfo:
-        logger.info("Google 토큰 검증 API 호출을 시작합니다.")
+        logger.info("Google 토큰 검증을 시작합니다.")
         try:
             client_id = getattr(settings, "GOOGLE_CLIENT_ID", None)
             if not client_id:
                 logger.critical("CRITICAL: GOOGLE_CLIENT_ID가 서버에 설정되어 있지 않습니다.")
                 raise ValueError("GOOGLE_CLIENT_ID가 서버에 설정되어 있지 않습니다.")
 
-            id_info = id_token.verify_oauth2_token(
-                token, requests.Request(), client_id, clock_skew_in_seconds=5
-            )
+            certs = self.cert_store.get_certs(key_id=unverified_key_id(token))
+            id_info = jwt.decode(token, certs=certs, audience=client_id, clock_skew_in_seconds=5)
+            if id_info.get('iss') not in GOOGLE_ISSUERS:
+                raise ValueError(f"잘못된 토큰 발급자입니다: {id_info.get('iss')}")
 
             verified_google_user_id = id_info.get('sub')
             verified_email = id_info.get('email')
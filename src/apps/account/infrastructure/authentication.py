@@ -0,0 +1,92 @@
+from django.utils.functional import cached_property
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.tokens import BlacklistMixin, RefreshToken
+from rest_framework_simplejwt.utils import datetime_from_epoch
+
+from src.apps.account.infrastructure.token_blacklist import get_blacklisted_token_filter
+from src.apps.account.models import Users
+
+
+class AccountRefreshToken(RefreshToken):
+    """
+    발급 시 nickname, is_staff 클레임을 넣는다. 여기서 파생된 액세스 토큰도 같은 클레임을 가진다.
+    갱신(AccountTokenRefreshSerializer) 때는 DB의 현재 값으로 다시 기록한다.
+    블랙리스트 확인은 프로세스 단위 Bloom 필터(BlacklistedTokenFilter)를 먼저 거치고,
+    블랙리스트 등록/발급 기록은 토큰의 user_id를 쓰며, 발급 기록을 새로 만들 때만 그 사용자가 남아 있는지 확인한다.
+    """
+
+    @classmethod
+    def for_user(cls, user):
+        # BlacklistMixin.for_user는 클레임을 넣기 전의 토큰을 OutstandingToken.token에 저장하므로,
+        # 그 단계를 건너뛰고 클레임을 넣은 뒤 발급 기록을 남긴다.
+        token = super(BlacklistMixin, cls).for_user(user)
+        cls.stamp_profile_claims(token, user)
+        OutstandingToken.objects.create(
+            jti=token[api_settings.JTI_CLAIM], **{**token._outstanding_defaults(), 'user_id': user.pk}
+        )
+        return token
+
+    @staticmethod
+    def stamp_profile_claims(token, user):
+        """사용자의 현재 nickname, is_staff를 클레임에 기록한다. (발급과 갱신 때 호출)"""
+        token['nickname'] = user.nickname
+        token['is_staff'] = user.is_staff
+
+    def check_blacklist(self):
+        if get_blacklisted_token_filter().is_blacklisted(self.payload[api_settings.JTI_CLAIM]):
+            raise TokenError(_("Token is blacklisted"))
+
+    def _outstanding_defaults(self):
+        return {
+            # get_or_create는 행을 새로 만들 때만 callable 값을 평가하므로, 기록이 이미 있으면 사용자 조회도 하지 않는다.
+            'user_id': self._existing_user_id,
+            'created_at': self.current_time,
+            'token': str(self),
+            'expires_at': datetime_from_epoch(self.payload['exp']),
+        }
+
+    def _existing_user_id(self):
+        # 발급 기록이 없는 토큰의 사용자가 이미 탈퇴했다면 FK 위반(500) 대신 사용자 없는 기록으로 남긴다.
+        user_id = self.payload.get(api_settings.USER_ID_CLAIM)
+        if user_id is not None and not Users.objects.filter(id=user_id).exists():
+            return None
+        return user_id
+
+    def blacklist(self):
+        jti = self.payload[api_settings.JTI_CLAIM]
+        token, _created = OutstandingToken.objects.get_or_create(jti=jti, defaults=self._outstanding_defaults())
+        result = BlacklistedToken.objects.get_or_create(token=token)
+        # 트랜잭션이 롤백되더라도 필터에는 오탐 하나가 남을 뿐이다. (양성은 DB로 다시 확인한다)
+        get_blacklisted_token_filter().add(jti)
+        return result
+
+    def outstand(self):
+        return OutstandingToken.objects.get_or_create(
+            jti=self.payload[api_settings.JTI_CLAIM], defaults=self._outstanding_defaults()
+        )
+
+
+class AccountTokenUser(TokenUser):
+    """
+    검증된 액세스 토큰의 클레임(user_id, nickname, is_staff)으로 만든 사용자. Users 테이블을 조회하지 않는다.
+    SIMPLE_JWT['TOKEN_USER_CLASS']로 지정되어 JWTStatelessUserAuthentication이 request.user로 사용한다.
+    nickname 클레임이 없는 이전 토큰은 닉네임을 처음 읽을 때만 DB에서 가져온다.
+    """
+
+    @cached_property
+    def nickname(self):
+        if 'nickname' in self.token:
+            return self.token['nickname']
+        return Users.objects.filter(id=self.id).values_list('nickname', flat=True).first() or ''
+
+
+class DatabaseUserJWTAuthentication(JWTAuthentication):
+    """
+    요청마다 Users 행을 조회해 request.user를 실제 모델로 만든다. (is_active 검사 포함)
+    계정 상태가 중요한 뷰에서만 authentication_classes로 지정한다.
+    """
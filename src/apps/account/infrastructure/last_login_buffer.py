@@ -0,0 +1,115 @@
+import atexit
+import logging
+import os
+import threading
+
+from django.conf import settings
+from django.db import close_old_connections
+
+from src.apps.account.models import Users
+
+logger = logging.getLogger(__name__)
+
+
+class LastLoginBuffer:
+    """
+    로그인 시각(last_login_at)을 메모리에 모았다가 bulk UPDATE 한 번으로 기록하는 write-behind 버퍼.
+    - 사용자별로 가장 최근 시각만 남기므로 크기는 max_size(서로 다른 사용자 수)를 넘지 않는다. 가득 차면 호출한 스레드에서 바로 비운다.
+    - 백그라운드 스레드가 flush_interval_seconds마다 비우고, 프로세스 종료(atexit/stop) 시 남은 값을 기록한다.
+      스레드는 프로세스마다 첫 record에서 시작한다. (migrate/shell 같은 명령에서는 뜨지 않고, fork된 워커는 자기 스레드를 띄운다)
+    - flush_interval_seconds가 0 또는 None이면 동기 모드: record가 즉시 기록한다. (테스트/디버깅용)
+    분석용 값이므로 프로세스가 비정상 종료되면 마지막 주기 동안의 로그인 시각은 유실될 수 있다.
+    """
+
+    def __init__(self, flush_interval_seconds=None, max_size=None, batch_size=500):
+        if flush_interval_seconds is None:
+            flush_interval_seconds = getattr(settings, 'LAST_LOGIN_FLUSH_INTERVAL_SECONDS', 0)
+        self.flush_interval_seconds = flush_interval_seconds
+        self.max_size = max_size or getattr(settings, 'LAST_LOGIN_BUFFER_MAX_SIZE', 1000)
+        self.batch_size = batch_size
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._pid = None
+        self._atexit_registered = False
+
+    @property
+    def is_sync(self):
+        return not self.flush_interval_seconds
+
+    def record(self, user_id, login_time):
+        with self._lock:
+            current = self._pending.get(user_id)
+            if current is None or login_time > current:
+                self._pending[user_id] = login_time
+            is_full = len(self._pending) >= self.max_size
+        if self.is_sync or is_full:
+            self.flush()
+        else:
+            self.start()
+
+    def pending_for(self, user_id):
+        """아직 기록되지 않은 로그인 시각. (조회 결과에 덧씌워 최신 값을 보여주기 위함)"""
+        with self._lock:
+            return self._pending.get(user_id)
+
+    def __len__(self):
+        with self._lock:
+            return len(self._pending)
+
+    def flush(self):
+        """쌓인 값을 기록하고 기록한 사용자 수를 반환한다. 실패하면 값을 버퍼로 되돌린다."""
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, {}
+            if not pending:
+                return 0
+            try:
+                Users.objects.bulk_update(
+                    [Users(id=user_id, last_login_at=login_time) for user_id, login_time in pending.items()],
+                    ['last_login_at'], batch_size=self.batch_size,
+                )
+            except Exception:
+                logger.exception(f"로그인 시각 일괄 기록 실패. {len(pending)}건을 버퍼로 되돌립니다.")
+                with self._lock:
+                    for user_id, login_time in pending.items():
+                        current = self._pending.get(user_id)
+                        if current is None or login_time > current:
+                            self._pending[user_id] = login_time
+                return 0
+            logger.debug(f"로그인 시각을 일괄 기록했습니다. 사용자 수: {len(pending)}")
+            return len(pending)
+
+    def start(self):
+        """현재 프로세스의 기록 스레드를 시작한다. 이미 이 프로세스에서 시작했다면 아무 일도 하지 않는다."""
+        pid = os.getpid()
+        if self.is_sync or self._pid == pid:
+            return
+        with self._start_lock:
+            if self._pid == pid:
+                return
+            # fork 이전에 부모가 띄운 스레드는 자식 프로세스에 없으므로 pid가 바뀌면 새로 띄운다.
+            self._stop_event = threading.Event()
+            self._thread = threading.Thread(target=self._run, name="last-login-flusher", daemon=True)
+            self._thread.start()
+            self._pid = pid
+            if not self._atexit_registered:
+                atexit.register(self.stop)
+                self._atexit_registered = True
+        logger.info(f"로그인 시각 write-behind 버퍼를 시작합니다. 주기: {self.flush_interval_seconds}초, pid: {pid}")
+
+    def stop(self, timeout=None):
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout)
+        self.flush()
+
+    def _run(self):
+        while not self._stop_event.wait(self.flush_interval_seconds):
+            try:
+                self.flush()
+            finally:
+                close_old_connections()
@@ -0,0 +1,35 @@
+import hashlib
+
+from django.conf import settings
+from django.core.cache import caches
+
+from src.apps.account.application.ports.nickname_cache import TakenNicknameCache
+
+
+class DjangoTakenNicknameCache(TakenNicknameCache):
+    """
+    사용 중인 닉네임을 Django 캐시 프레임워크에 기억하는 부정(negative) 캐시.
+    TTL은 settings.CACHES의 해당 alias 설정(TIMEOUT)을 따르며, 닉네임을 바꾼 사용자의 이전 닉네임은 forget으로 지운다.
+    탈퇴 등으로 풀린 닉네임은 TTL이 지나야 다시 사용 가능으로 보인다. (가입 시 최종 중복 판단은 DB 유일 인덱스가 한다)
+    """
+    KEY_PREFIX = "account:nickname-taken"
+
+    def __init__(self, cache_alias=None):
+        self._cache_alias = cache_alias or getattr(settings, 'NICKNAME_TAKEN_CACHE_ALIAS', 'nickname_taken')
+
+    @property
+    def _cache(self):
+        return caches[self._cache_alias]
+
+    def _key(self, normalized_nickname):
+        # 닉네임에는 캐시 키로 쓸 수 없는 문자가 있을 수 있으므로 해시한다.
+        return f"{self.KEY_PREFIX}:{hashlib.sha1(normalized_nickname.encode()).hexdigest()}"
+
+    def is_taken(self, normalized_nickname):
+        return self._cache.get(self._key(normalized_nickname)) is not None
+
+    def mark_taken(self, normalized_nickname):
+        self._cache.set(self._key(normalized_nickname), True)
+
+    def forget(self, normalized_nickname):
+        self._cache.delete(self._key(normalized_nickname))
@@ -1,6 +1,6 @@
 from sqlite3 import DatabaseError
 
-from src.apps.account.domain.aggregates.user_account import UserAccount
+from src.apps.account.domain.aggregates.user_account import UserAccount, UserAccountPart
 from src.apps.account.domain.value_objects.email import Email
 from src.apps.account.domain.value_objects.nickname import NickName
 from src.apps.account.domain.value_objects.social_link import SocialLink
@@ -9,67 +9,84 @@ from src.apps.account.models import Users, UserSocialAccounts
 
 from typing import Optional
 from django.db import transaction, IntegrityError
+from django.db.models import Q
 
 import logging
 
 logger = logging.getLogger(__name__)
 
 class DjangoUserAccountRepository(UserAccountRepository):
+    def __init__(self, last_login_buffer=None):
+        # 지정하면 기존 사용자의 로그인 시각은 즉시 UPDATE하지 않고 write-behind 버퍼(LastLoginBuffer)에 맡긴다.
+        self.last_login_buffer = last_login_buffer
 
     def generate_next_id(self) -> int:
         raise NotImplementedError("ID is auto-generated by the database.")
 
-    def _to_domain_object(self, user_model: Users) -> UserAccount:
-        social_links_vo_list = []
-        if user_model and hasattr(user_model, 'social_accounts'):  # Check if user_model is not None
-            for link_model in user_model.social_accounts.all():
-                social_links_vo_list.append(
-                    SocialLink(provider_name=link_model.provider, social_id=link_model.provider_account_id)
-                )
+    def _to_domain_object(self, user_model: Users, link_models=None) -> UserAccount:
+        if link_models is None:
+            link_models = user_model.social_accounts.all()
+        social_links_vo_list = [
+            SocialLink(provider_name=link_model.provider, social_id=link_model.provider_account_id)
+            for link_model in link_models
+        ]
 
-        return UserAccount(
+        user_account = UserAccount(
             account_id=user_model.id,
             email=Email(user_model.email_address),
             nickname=NickName(user_model.nickname),
             social_links=social_links_vo_list,
             created_at=user_model.created_at,
-            last_login_at=user_model.last_login_at
+            last_login_at=self._latest_login_at(user_model),
+            is_staff=user_model.is_staff,
         )
+        user_account.mark_clean()
+        return user_account
+
+    def _latest_login_at(self, user_model: Users):
+        if self.last_login_buffer is None:
+            return user_model.last_login_at
+        pending = self.last_login_buffer.pending_for(user_model.id)
+        if pending is not None and (user_model.last_login_at is None or pending > user_model.last_login_at):
+            return pending
+        return user_model.last_login_at
 
-    @transaction.atomic
     def save(self, user_account: UserAccount) -> UserAccount:
-        user_model = None
+        """
+        변경된 부분만 저장하고 같은 애그리거트를 반환한다. 변경이 없으면 쿼리를 보내지 않는다.
+        로그인 시각만 바뀐 경우는 last_login_at 한 컬럼의 UPDATE 한 번(버퍼가 있으면 쿼리 없음)으로 끝난다.
+        """
+        changed_parts = set(user_account.changed_parts)
+        if user_account.is_persisted and self.last_login_buffer is not None \
+                and UserAccountPart.LAST_LOGIN in changed_parts:
+            self.last_login_buffer.record(user_account.account_id, user_account.last_login_at)
+            changed_parts.discard(UserAccountPart.LAST_LOGIN)
+        if user_account.is_persisted and not changed_parts:
+            user_account.mark_clean()
+            return user_account
+        if user_account.is_persisted and changed_parts == {UserAccountPart.LAST_LOGIN}:
+            # 재방문 로그인 경로: 문장 하나뿐이므로 트랜잭션을 따로 열지 않는다.
+            self._update_user_row(user_account, changed_parts)
+            user_account.mark_clean()
+            return user_account
         try:
-            if user_account.account_id and user_account.account_id > 0:
-                try:
-                    user_model = Users.objects.get(id=user_account.account_id)
-                    user_model.email_address = user_account.email.address
-                    user_model.nickname = user_account.nickname.name
-                    user_model.last_login_at = user_account.last_login_at
-                    user_model.save(update_fields=['email_address', 'nickname', 'last_login_at'])
-                    logger.info(f"사용자 정보를 업데이트했습니다. account_id: {user_model.id}")
-                except Users.DoesNotExist:
-                    logger.error(f"ID({user_account.account_id}) 사용자를 찾을 수 없어 업데이트에 실패했습니다.", exc_info=True)
-                    raise ValueError(f"ID {user_account.account_id}를 가진 사용자가 존재하지 않아 업데이트할 수 없습니다.")
-            else:
-                user_model = Users.objects.create(
-                    email_address=user_account.email.address,
-                    nickname=user_account.nickname.name,
-                    created_at=user_account.created_at,
-                    last_login_at=user_account.last_login_at
-                )
-                logger.info(f"새로운 사용자를 생성했습니다. account_id: {user_model.id}")
-
-            user_model.social_accounts.all().delete()
-            for sl_vo_item in user_account.social_links:
-                UserSocialAccounts.objects.create(
-                    user=user_model,
-                    provider=sl_vo_item.provider_name,
-                    provider_account_id=sl_vo_item.social_id
-                )
-            logger.info(f"사용자의 소셜 링크 정보를 동기화했습니다. account_id: {user_model.id}")
-
-            return self._to_domain_object(user_model)
+            with transaction.atomic():
+                if user_account.is_persisted:
+                    self._update_user_row(user_account, changed_parts)
+                    user_id = user_account.account_id
+                else:
+                    user_model = Users.objects.create(
+                        email_address=user_account.email.address,
+                        nickname=user_account.nickname.name,
+                        created_at=user_account.created_at,
+                        last_login_at=user_account.last_login_at,
+                        is_staff=user_account.is_staff,
+                    )
+                    user_id = user_model.id
+                    logger.info(f"새로운 사용자를 생성했습니다. account_id: {user_id}")
+
+                if UserAccountPart.SOCIAL_LINKS in changed_parts:
+                    self._sync_social_links(user_id, user_account)
         except IntegrityError as e:
             logger.error(f"사용자 저장 중 무결성 제약 조건 위반 발생: {e}", exc_info=True)
             raise ValueError("이미 존재하는 이메일 또는 닉네임입니다.")
@@ -77,7 +94,38 @@ class DjangoUserAccountRepository(UserAccountRepository):
             logger.critical(f"사용자 저장 중 심각한 데이터베이스 오류 발생", exc_info=True)
             raise Exception("데이터베이스 처리 중 오류가 발생했습니다.")
 
-
+        user_account.mark_clean(account_id=user_id)
+        return user_account
+
+    def _update_user_row(self, user_account: UserAccount, changed_parts) -> None:
+        fields = {}
+        if UserAccountPart.PROFILE in changed_parts:
+            fields.update(email_address=user_account.email.address, nickname=user_account.nickname.name,
+                          nickname_normalized=user_account.nickname.normalized)
+        if UserAccountPart.LAST_LOGIN in changed_parts:
+            fields['last_login_at'] = user_account.last_login_at
+        if not fields:
+            return
+        if not Users.objects.filter(id=user_account.account_id).update(**fields):
+            logger.error(f"ID({user_account.account_id}) 사용자를 찾을 수 없어 업데이트에 실패했습니다.")
+            raise ValueError(f"ID {user_account.account_id}를 가진 사용자가 존재하지 않아 업데이트할 수 없습니다.")
+        logger.info(f"사용자 정보를 업데이트했습니다. account_id: {user_account.account_id}, 필드: {sorted(fields)}")
+
+    def _sync_social_links(self, user_id: int, user_account: UserAccount) -> None:
+        """마지막으로 불러온 상태와 비교해 없어진 링크는 지우고 새 링크만 추가한다."""
+        removed = user_account.removed_social_links
+        if removed:
+            condition = Q()
+            for link in removed:
+                condition |= Q(provider=link.provider_name, provider_account_id=link.social_id)
+            UserSocialAccounts.objects.filter(condition, user_id=user_id).delete()
+        added = user_account.added_social_links
+        if added:
+            UserSocialAccounts.objects.bulk_create([
+                UserSocialAccounts(user_id=user_id, provider=link.provider_name, provider_account_id=link.social_id)
+                for link in added
+            ])
+        logger.info(f"사용자의 소셜 링크 정보를 동기화했습니다. account_id: {user_id}, 추가: {len(added)}, 삭제: {len(removed)}")
 
     @transaction.atomic
     def delete(self, account_id: int) -> None:
@@ -125,16 +173,28 @@ class DjangoUserAccountRepository(UserAccountRepository):
             logger.error(f"Nickname으로 사용자 조회 중 데이터베이스 오류 발생: {e}", exc_info=True)
             raise Exception("데이터베이스 조회 중 오류가 발생했습니다.")
 
+    def exists_by_nickname(self, nickname: NickName, exclude_account_id: Optional[int] = None) -> bool:
+        """정규화한 닉네임(유일 인덱스)으로 사용 여부만 확인한다. 애그리거트를 만들지 않는다."""
+        try:
+            queryset = Users.objects.filter(nickname_normalized=nickname.normalized)
+            if exclude_account_id is not None:
+                queryset = queryset.exclude(id=exclude_account_id)
+            return queryset.exists()
+        except DatabaseError as e:
+            logger.error(f"닉네임 사용 여부 조회 중 데이터베이스 오류 발생: {e}", exc_info=True)
+            raise Exception("데이터베이스 조회 중 오류가 발생했습니다.")
+
     def find_by_social_link(self, social_link: SocialLink) -> Optional[UserAccount]:
         try:
-            link_model = UserSocialAccounts.objects.select_related('user').get(
-                provider=social_link.provider_name,
-                provider_account_id=social_link.social_id
-            )
-            return self._to_domain_object(link_model.user)
-        except UserSocialAccounts.DoesNotExist:
-            logger.debug(f"Social Link({social_link.provider_name}: {social_link.social_id})에 해당하는 사용자를 찾을 수 없습니다.")
-            return None
+            # 링크로 찾은 사용자의 모든 소셜 링크 행을 사용자와 조인해 한 번에 읽는다. (prefetch 쿼리 없음)
+            link_models = list(UserSocialAccounts.objects.select_related('user').filter(
+                user__social_accounts__provider=social_link.provider_name,
+                user__social_accounts__provider_account_id=social_link.social_id,
+            ))
+            if not link_models:
+                logger.debug(f"Social Link({social_link.provider_name}: {social_link.social_id})에 해당하는 사용자를 찾을 수 없습니다.")
+                return None
+            return self._to_domain_object(link_models[0].user, link_models)
         except DatabaseError as e:
             logger.error(f"Social Link로 사용자 조회 중 데이터베이스 오류 발생: {e}", exc_info=True)
-            raise Exception("데이터베이스 조회 중 오류가 발생했습니다.")
\ No newline at end of file
+            raise Exception("데이터베이스 조회 중 오류가 발생했습니다.")
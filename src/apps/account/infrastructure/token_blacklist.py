@@ -0,0 +1,161 @@
+import functools
+import hashlib
+import logging
+import math
+import threading
+import time
+
+from django.conf import settings
+from django.db import close_old_connections
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+
+logger = logging.getLogger(__name__)
+
+
+class BloomFilter:
+    """고정 크기 비트 배열 Bloom 필터. 없는 키를 있다고 할 수는 있지만(오탐), 있는 키를 없다고 하지는 않는다."""
+
+    def __init__(self, capacity, error_rate=0.001):
+        self.capacity = capacity
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key):
+        # 해시 한 번으로 두 값을 얻어 k개의 위치를 만든다. (double hashing)
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'big')
+        h2 = int.from_bytes(digest[8:], 'big') | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hash_count)]
+
+    def add(self, key):
+        """키를 넣고, 새로 켜진 비트가 있었는지(처음 보는 키인지) 반환한다. count는 새 키만 센다."""
+        is_new = False
+        for position in self._positions(key):
+            mask = 1 << (position & 7)
+            if not self._bits[position >> 3] & mask:
+                self._bits[position >> 3] |= mask
+                is_new = True
+        if is_new:
+            self.count += 1
+        return is_new
+
+    def __contains__(self, key):
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+
+class BlacklistedTokenFilter:
+    """
+    블랙리스트에 오른 리프레시 토큰 JTI의 프로세스 단위 Bloom 필터.
+    필터에 없으면 DB를 조회하지 않고 통과시키고, 있을 때만 DB로 정확히 확인한다.
+    - 처음 사용할 때 만료되지 않은 블랙리스트 행으로 필터를 만들고, 이후에는 sync_interval_seconds마다
+      마지막으로 읽은 id 이후의 행만 읽어 다른 프로세스의 블랙리스트를 반영한다. (0이면 확인할 때마다)
+    - 이 프로세스에서 블랙리스트에 올린 JTI는 add로 즉시 반영한다.
+    - rebuild_interval_seconds마다, 또는 새로 들어간 JTI 수가 용량을 넘으면(오탐률 상승) 백그라운드 스레드가
+      현재 블랙리스트로 새 필터를 만들어 교체한다. 증분 동기화가 놓친 행(늦게 커밋된 행)과 만료된 행도 이때 정리된다.
+      교체 전까지는 기존 필터로 응답하므로 요청 스레드는 재구성을 기다리지 않는다.
+    """
+    # id는 커밋 순서대로 보이지 않을 수 있으므로, 증분 동기화는 마지막 id보다 조금 앞에서부터 다시 읽는다.
+    SYNC_OVERLAP_IDS = 100
+
+    def __init__(self, capacity=None, error_rate=None, sync_interval_seconds=None, rebuild_interval_seconds=None,
+                 clock=time.monotonic):
+        self.capacity = capacity or getattr(settings, 'TOKEN_BLACKLIST_FILTER_CAPACITY', 100_000)
+        self.error_rate = error_rate or getattr(settings, 'TOKEN_BLACKLIST_FILTER_ERROR_RATE', 0.001)
+        if sync_interval_seconds is None:
+            sync_interval_seconds = getattr(settings, 'TOKEN_BLACKLIST_SYNC_SECONDS', 5)
+        if rebuild_interval_seconds is None:
+            rebuild_interval_seconds = getattr(settings, 'TOKEN_BLACKLIST_FILTER_REBUILD_SECONDS', 600)
+        self.sync_interval_seconds = sync_interval_seconds
+        self.rebuild_interval_seconds = rebuild_interval_seconds
+        self.clock = clock
+        self._filter = None
+        self._last_id = 0
+        self._synced_at = None
+        self._built_at = None
+        # 백그라운드 재구성 중에 add된 JTI. 새 필터로 바꿀 때 다시 넣는다.
+        self._added_during_rebuild = None
+        self._lock = threading.Lock()
+
+    def is_blacklisted(self, jti):
+        with self._lock:
+            needs_rebuild = self._ensure_fresh()
+            might_contain = jti in self._filter
+        if needs_rebuild:
+            self._start_rebuild()
+        if not might_contain:
+            return False
+        return BlacklistedToken.objects.filter(token__jti=jti).exists()
+
+    def add(self, jti):
+        with self._lock:
+            if self._filter is not None:
+                self._filter.add(jti)
+            if self._added_during_rebuild is not None:
+                self._added_during_rebuild.append(jti)
+
+    def _ensure_fresh(self):
+        """락 안에서 호출한다. 백그라운드 재구성을 시작해야 하면 True를 반환한다."""
+        if self._filter is None:
+            # 응답할 필터가 없으므로 처음 한 번은 이 요청에서 만든다.
+            self._filter, self._last_id, live_count = self._build()
+            self._synced_at = self._built_at = self.clock()
+            logger.info(f"리프레시 토큰 블랙리스트 필터를 만들었습니다. JTI 수: {live_count}, 비트 수: {self._filter.size}")
+            return False
+        if self.clock() - self._synced_at >= self.sync_interval_seconds:
+            self._sync()
+        if self._added_during_rebuild is not None:
+            return False  # 이미 재구성 중이다.
+        is_due = self.rebuild_interval_seconds and self.clock() - self._built_at >= self.rebuild_interval_seconds
+        if is_due or self._filter.count > self._filter.capacity:
+            self._added_during_rebuild = []
+            return True
+        return False
+
+    def _build(self):
+        rows = BlacklistedToken.objects.filter(token__expires_at__gt=timezone.now()).values_list('id', 'token__jti')
+        live_count = rows.count()
+        bloom = BloomFilter(max(self.capacity, live_count * 2), self.error_rate)
+        last_id = 0
+        for row_id, jti in rows.order_by('id').iterator(chunk_size=2000):
+            bloom.add(jti)
+            last_id = row_id
+        return bloom, last_id, live_count
+
+    def _start_rebuild(self):
+        threading.Thread(target=self._rebuild, name="token-blacklist-filter-rebuild", daemon=True).start()
+
+    def _rebuild(self):
+        try:
+            bloom, last_id, live_count = self._build()
+        except Exception:
+            logger.exception("리프레시 토큰 블랙리스트 필터 재구성 중 오류 발생")
+            with self._lock:
+                self._added_during_rebuild = None
+                self._built_at = self.clock()  # 다음 주기에 다시 시도한다.
+            return
+        finally:
+            close_old_connections()
+        with self._lock:
+            for jti in self._added_during_rebuild:
+                bloom.add(jti)
+            # 스냅샷 이후의 행은 다음 증분 동기화가 last_id부터 다시 읽는다.
+            self._filter, self._last_id = bloom, last_id
+            self._added_during_rebuild = None
+            self._built_at = self.clock()
+        logger.info(f"리프레시 토큰 블랙리스트 필터를 다시 만들었습니다. JTI 수: {live_count}, 비트 수: {bloom.size}")
+
+    def _sync(self):
+        rows = BlacklistedToken.objects.filter(id__gt=self._last_id - self.SYNC_OVERLAP_IDS).values_list(
+            'id', 'token__jti')
+        for row_id, jti in rows.order_by('id'):
+            self._filter.add(jti)  # 겹쳐 읽은 행은 이미 들어 있으므로 count가 늘지 않는다.
+            self._last_id = max(self._last_id, row_id)
+        self._synced_at = self.clock()
+
+
+@functools.lru_cache(maxsize=None)
+def get_blacklisted_token_filter():
+    return BlacklistedTokenFilter()
@@ -1,5 +1,5 @@
 from typing import Dict
-from rest_framework_simplejwt.tokens import RefreshToken
+from src.apps.account.infrastructure.authentication import AccountRefreshToken
 from rest_framework_simplejwt.exceptions import TokenError
 from src.apps.account.models import Users
 
@@ -10,7 +10,7 @@ class SimpleJwtTokenService(AuthTokenService):
     def issue_for_user(self, user_account_id) -> Dict[str, str]:
         try:
             user_model = Users.objects.get(id=user_account_id)
-            refresh = RefreshToken.for_user(user_model)
+            refresh = AccountRefreshToken.for_user(user_model)
             return {
                 'refresh': str(refresh),
                 'access': str(refresh.access_token),
@@ -18,9 +18,19 @@ class SimpleJwtTokenService(AuthTokenService):
         except Users.DoesNotExist:
             raise ValueError("토큰을 발급할 사용자를 찾을 수 없습니다.")
 
+    def issue_for_account(self, user_account) -> Dict[str, str]:
+        # 클레임(user_id, nickname, is_staff)과 OutstandingToken의 user_id만 필요하므로 저장되지 않은 모델로 충분하다.
+        user_model = Users(id=user_account.account_id, nickname=user_account.nickname.name,
+                           is_staff=user_account.is_staff)
+        refresh = AccountRefreshToken.for_user(user_model)
+        return {
+            'refresh': str(refresh),
+            'access': str(refresh.access_token),
+        }
+
     def blacklist(self, refresh_token: str) -> None:
         try:
-            token = RefreshToken(refresh_token)
+            token = AccountRefreshToken(refresh_token)
             token.blacklist()
         except TokenError:
             pass
\ No newline at end of file
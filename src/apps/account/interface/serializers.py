@@ -1,4 +1,10 @@
+from django.contrib.auth import get_user_model
 from rest_framework import serializers
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+
+from ..infrastructure.authentication import AccountRefreshToken
 
 
 class SocialLoginRequestSerializer(serializers.Serializer):
@@ -10,6 +16,15 @@ class SocialLoginRequestSerializer(serializers.Serializer):
 class UpdateNicknameRequestSerializer(serializers.Serializer):
     nickname = serializers.CharField(required=True, min_length=2, max_length=15)
 
+class NicknameAvailabilityQuerySerializer(serializers.Serializer):
+    # 형식 검사(2~15자)는 응답의 reason으로 알려주므로 여기서는 길이 상한만 둔다.
+    nickname = serializers.CharField(required=True, max_length=100, trim_whitespace=True)
+
+class NicknameAvailabilityResponseSerializer(serializers.Serializer):
+    nickname = serializers.CharField()
+    available = serializers.BooleanField()
+    reason = serializers.CharField(allow_null=True)
+
 class UserSocialLinkResponseSerializer(serializers.Serializer):
     provider_name = serializers.CharField()
     social_id = serializers.CharField()
@@ -32,4 +47,31 @@ class AuthResponseSerializer(serializers.Serializer):
     is_new_user = serializers.BooleanField()
 
 class LogoutRequestSerializer(serializers.Serializer):
-    refresh_token = serializers.CharField(required=True)
\ No newline at end of file
+    refresh_token = serializers.CharField(required=True)
+
+class AccountTokenRefreshSerializer(TokenRefreshSerializer):
+    # 블랙리스트 확인을 Bloom 필터로 거르는 AccountRefreshToken으로 검증/회전한다.
+    token_class = AccountRefreshToken
+
+    def validate(self, attrs):
+        refresh = self.token_class(attrs["refresh"])
+
+        user_id = refresh.payload.get(api_settings.USER_ID_CLAIM)
+        user = get_user_model().objects.filter(**{api_settings.USER_ID_FIELD: user_id}).first() if user_id else None
+        if user is None or not api_settings.USER_AUTHENTICATION_RULE(user):
+            raise AuthenticationFailed(self.error_messages["no_active_account"], "no_active_account")
+        # 회전된 토큰이 이전 페이로드를 그대로 물려받지 않도록, 새 토큰을 만들기 전에 현재 닉네임/권한으로 다시 기록한다.
+        self.token_class.stamp_profile_claims(refresh, user)
+
+        data = {"access": str(refresh.access_token)}
+
+        if api_settings.ROTATE_REFRESH_TOKENS:
+            if api_settings.BLACKLIST_AFTER_ROTATION:
+                refresh.blacklist()
+            refresh.set_jti()
+            refresh.set_exp()
+            refresh.set_iat()
+            refresh.outstand()
+            data["refresh"] = str(refresh)
+
+        return data
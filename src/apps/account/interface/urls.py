@@ -5,7 +5,9 @@ from .views import (
     SocialLoginAPIView,
     UserProfileAPIView,
     UserDeactivationAPIView,
-    LogoutAPIView
+    LogoutAPIView,
+    AccountTokenRefreshView,
+    NicknameAvailabilityAPIView
 )
 
 # app_name = 'account_interface' # 네임스페이스 사용 시 (선택 사항)
@@ -16,6 +18,8 @@ urlpatterns = [
     path('auth/login', SocialLoginAPIView.as_view(), name='social_login_register'),
     
     path('auth/logout', LogoutAPIView.as_view(), name='user_logout'),
+    path('auth/refresh', AccountTokenRefreshView.as_view(), name='token_refresh'),
     path('users/me/profile', UserProfileAPIView.as_view(), name='user_profile'),
     path('users/me', UserDeactivationAPIView.as_view(), name='user_deactivate'),
+    path('nicknames/availability', NicknameAvailabilityAPIView.as_view(), name='nickname_availability'),
 ]
\ No newline at end of file
@@ -1,18 +1,21 @@
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import IsAuthenticated, AllowAny
+from rest_framework_simplejwt.views import TokenRefreshView
 from dependency_injector.wiring import inject, Provide
 
 from .serializers import (
     SocialLoginRequestSerializer, AuthResponseSerializer, UserAccountResponseSerializer,
-    UpdateNicknameRequestSerializer, LogoutRequestSerializer
+    UpdateNicknameRequestSerializer, LogoutRequestSerializer, AccountTokenRefreshSerializer,
+    NicknameAvailabilityQuerySerializer, NicknameAvailabilityResponseSerializer
 )
 from ..application.dtos import SocialLoginRequestDto, UpdateNicknameRequestDto, LogoutRequestDto
 from ..application.services import (
     UserAuthAppService, UserProfileAppService, UserAccountDeactivationAppService
 )
 from ..containers import AccountContainer
+from ..infrastructure.authentication import DatabaseUserJWTAuthentication
 
 import logging
 logger = logging.getLogger(__name__)
@@ -59,7 +62,27 @@ class LogoutAPIView(APIView):
             return Response({"error": "로그아웃 처리 중 오류가 발생했습니다."}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+class AccountTokenRefreshView(TokenRefreshView):
+    # 리프레시 토큰 회전. 블랙리스트 확인이 Bloom 필터를 거치므로 발급된 토큰 수가 늘어도 지연이 커지지 않는다.
+    serializer_class = AccountTokenRefreshSerializer
+
+
+class NicknameAvailabilityAPIView(APIView):
+    # 가입 폼에서 입력할 때마다 호출되는 공개 API. 토큰 검증도 하지 않도록 인증을 끈다.
+    authentication_classes = []
+    permission_classes = [AllowAny]
+
+    def get(self, request):
+        serializer = NicknameAvailabilityQuerySerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        service = AccountContainer.nickname_availability_service()
+        availability_dto = service.check_availability(serializer.validated_data['nickname'])
+        return Response(NicknameAvailabilityResponseSerializer(availability_dto).data, status=status.HTTP_200_OK)
+
+
 class UserProfileAPIView(APIView):
+    # 프로필 조회/변경은 비활성화된 계정을 바로 막아야 하므로 토큰 클레임 대신 DB의 사용자를 확인한다.
+    authentication_classes = [DatabaseUserJWTAuthentication]
     permission_classes = [IsAuthenticated]
 
     @inject
@@ -102,6 +125,7 @@ class UserProfileAPIView(APIView):
 
 
 class UserDeactivationAPIView(APIView):
+    authentication_classes = [DatabaseUserJWTAuthentication]
     permission_classes = [IsAuthenticated]
 
     @inject
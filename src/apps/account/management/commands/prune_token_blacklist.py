@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+
+
+class Command(BaseCommand):
+    help = (
+        "만료된 리프레시 토큰 기록(OutstandingToken)과 그 블랙리스트 행(BlacklistedToken)을 배치 단위로 삭제합니다. "
+        "만료된 토큰은 서명 검증에서 이미 거부되므로 블랙리스트에 남겨 둘 필요가 없습니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help="한 트랜잭션에서 삭제할 토큰 수")
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        if batch_size < 1:
+            raise CommandError("--batch-size는 1 이상이어야 합니다.")
+
+        now = timezone.now()
+        outstanding_deleted = blacklisted_deleted = 0
+        while True:
+            # 배치마다 짧은 트랜잭션으로 끊어, 로그인/토큰 갱신의 쓰기를 오래 막지 않는다.
+            with transaction.atomic():
+                token_ids = list(OutstandingToken.objects.filter(expires_at__lte=now).order_by('id').values_list(
+                    'id', flat=True)[:batch_size])
+                if not token_ids:
+                    break
+                blacklisted_deleted += BlacklistedToken.objects.filter(token_id__in=token_ids).delete()[0]
+                outstanding_deleted += OutstandingToken.objects.filter(id__in=token_ids).delete()[0]
+
+        self.stdout.write(self.style.SUCCESS(
+            f"만료된 토큰 {outstanding_deleted}건과 블랙리스트 {blacklisted_deleted}건을 삭제했습니다."
+        ))
@@ -1,8 +1,11 @@
 import logging
+import time
 import uuid
+from contextlib import ExitStack
 from threading import local
 
-from django.contrib.auth.models import AnonymousUser
+from django.conf import settings
+from django.db import connections
 
 _thread_locals = local()
 logger = logging.getLogger(__name__)
@@ -11,29 +14,92 @@ def get_current_request_id():
     return getattr(_thread_locals, "request_id", None)
 
 def get_current_user():
-    return getattr(_thread_locals, "user", None)
+    # request.user는 인증이 필요한 뷰(DRF 인증)에서 처음 접근할 때 결정되므로, 여기서도 필요할 때만 읽는다.
+    request = getattr(_thread_locals, "request", None)
+    user = getattr(request, "user", None) if request is not None else None
+    if user is not None and user.is_authenticated:
+        return user
+    return None
+
+
+class QueryStats:
+    """connection.execute_wrapper로 등록해 요청 하나에서 실행된 SQL 수와 총 실행 시간을 잰다."""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started_at = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.count += 1
+            self.duration += time.perf_counter() - started_at
+
 
 class LoggingMiddleware:
+    """
+    요청 시작/종료를 로그로 남기고, 요청별 처리 시간, SQL 수, SQL 시간을 구조화된 로그 필드와 Server-Timing 헤더로 내보낸다.
+    settings.REQUEST_PERFORMANCE_BUDGETS의 URL 이름별 예산('*'는 기본값)을 넘으면 경고 로그를 남긴다.
+    스트리밍 응답(SSE 등)은 응답 객체를 돌려준 시점까지만 잰다.
+    """
+
     def __init__(self, get_response):
         self.get_response = get_response
 
     def __call__(self, request):
         request_id = str(uuid.uuid4())
         _thread_locals.request_id = request_id
-
-        if request.user.is_authenticated:
-            _thread_locals.user = request.user
-        else:
-            _thread_locals.user = None
+        _thread_locals.request = request
 
         logger.info(f"Request started: {request.method} {request.path}")
 
-        response = self.get_response(request)
+        query_stats = QueryStats()
+        started_at = time.perf_counter()
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(query_stats))
+                response = self.get_response(request)
+            duration = time.perf_counter() - started_at
+            self._report(request, response, duration, query_stats)
+        finally:
+            del _thread_locals.request_id
+            del _thread_locals.request
+
+        return response
 
-        logger.info(f"Request finished: {response.status_code}")
+    def _report(self, request, response, duration, query_stats):
+        endpoint = request.resolver_match.url_name if request.resolver_match else None
+        metrics = {
+            "status_code": response.status_code,
+            "endpoint": endpoint,
+            "duration_ms": round(duration * 1000, 1),
+            "db_query_count": query_stats.count,
+            "db_time_ms": round(query_stats.duration * 1000, 1),
+        }
+        logger.info(f"Request finished: {response.status_code}", extra=metrics)
 
-        del _thread_locals.request_id
-        if hasattr(_thread_locals, "user"):
-            del _thread_locals.user
+        if getattr(settings, "SERVER_TIMING_HEADER_ENABLED", True):
+            server_timing = (
+                f'app;dur={metrics["duration_ms"]}, '
+                f'db;dur={metrics["db_time_ms"]};desc="{query_stats.count} queries"'
+            )
+            if response.has_header("Server-Timing"):
+                server_timing = f'{response["Server-Timing"]}, {server_timing}'
+            response["Server-Timing"] = server_timing
 
-        return response
\ No newline at end of file
+        budgets = getattr(settings, "REQUEST_PERFORMANCE_BUDGETS", {})
+        budget = budgets.get(endpoint) or budgets.get("*")
+        if not budget:
+            return
+        exceeded = [
+            name for name, metric in (("max_queries", "db_query_count"), ("max_duration_ms", "duration_ms"))
+            if budget.get(name) is not None and metrics[metric] > budget[name]
+        ]
+        if exceeded:
+            logger.warning(
+                f"요청이 성능 예산을 초과했습니다: {request.method} {request.path} ({', '.join(exceeded)})",
+                extra={**metrics, "budget": budget},
+            )
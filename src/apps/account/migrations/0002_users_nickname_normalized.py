@@ -0,0 +1,47 @@
+# Generated by Django 4.2.20 on 2026-10-17 23:01
+
+import unicodedata
+
+from django.db import migrations, models
+
+
+def normalize_nickname(name):
+    # 마이그레이션은 작성 시점의 규칙으로 고정되어야 하므로 NickName.normalize를 임포트하지 않고 복사해 둔다.
+    return unicodedata.normalize('NFC', unicodedata.normalize('NFC', name).casefold())
+
+
+def backfill_nickname_normalized(apps, schema_editor):
+    # 기존 닉네임 중 정규화 값이 겹치는 경우(대소문자만 다른 닉네임) 먼저 가입한 사용자에게만 값을 채운다.
+    # 나머지는 NULL로 남으므로 유일 인덱스를 만들 수 있고, 닉네임을 바꿀 때 새 값이 채워진다.
+    users_model = apps.get_model('account', 'Users')
+    seen = set()
+    rows = []
+    for user in users_model.objects.order_by('id').only('id', 'nickname').iterator(chunk_size=2000):
+        normalized = normalize_nickname(user.nickname)
+        if normalized in seen:
+            continue
+        seen.add(normalized)
+        user.nickname_normalized = normalized
+        rows.append(user)
+    users_model.objects.bulk_update(rows, ['nickname_normalized'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='users',
+            name='nickname_normalized',
+            field=models.CharField(editable=False, max_length=100, null=True),
+        ),
+        migrations.RunPython(backfill_nickname_normalized, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='users',
+            name='nickname_normalized',
+            field=models.CharField(editable=False, max_length=100, null=True, unique=True),
+        ),
+    ]
@@ -2,6 +2,8 @@
 from django.db import models
 from django.contrib.auth.models import AbstractBaseUser, BaseUserManager, PermissionsMixin
 
+from src.apps.account.domain.value_objects.nickname import NickName
+
 class UserManager(BaseUserManager):
     def create_user(self, email_address, nickname, password=None, **extra_fields):
         if not email_address:
@@ -39,6 +41,8 @@ class Users(AbstractBaseUser, PermissionsMixin):
     id = models.AutoField(primary_key=True)
     email_address = models.EmailField(unique=True, max_length=254) # Google 이메일을 저장
     nickname = models.CharField(max_length=100, unique=True)
+    # 닉네임 중복 확인용 정규화 값(NFC + casefold). save()에서 nickname으로부터 채운다.
+    nickname_normalized = models.CharField(max_length=100, unique=True, null=True, editable=False)
 
     is_staff = models.BooleanField(default=False)
     is_active = models.BooleanField(default=True) # Google 로그인 시 이 필드가 True인지 확인 필요
@@ -63,6 +67,13 @@ class Users(AbstractBaseUser, PermissionsMixin):
     def __str__(self):
         return self.email_address
 
+    def save(self, *args, **kwargs):
+        self.nickname_normalized = NickName.normalize(self.nickname) if self.nickname else None
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'nickname' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'nickname_normalized'}
+        super().save(*args, **kwargs)
+
     def get_full_name(self):
         return self.nickname
 
@@ -51,11 +51,11 @@ class TestUserAuthAppService:
 
         mock_repo.find_by_social_link.return_value = None
         mock_repo.find_by_email.return_value = None
-        mock_repo.find_by_nickname.return_value = None
+        mock_repo.exists_by_nickname.return_value = False
         mock_verifier.verify.return_value = SocialUserInfo("google_id", "new@email.com", "Google Nick")
         mock_repo.save.side_effect = lambda user_account: UserAccount(1, user_account.email, user_account.nickname,
                                                                       user_account.social_links, datetime.now())
-        mock_token.issue_for_user.return_value = {"access": "a", "refresh": "b"}
+        mock_token.issue_for_account.return_value = {"access": "a", "refresh": "b"}
 
         result = service.login_or_register(request_dto)
 
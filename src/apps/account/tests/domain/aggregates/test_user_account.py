@@ -1,7 +1,7 @@
 import pytest
 from datetime import datetime, timedelta
 
-from src.apps.account.domain.aggregates.user_account import UserAccount
+from src.apps.account.domain.aggregates.user_account import UserAccount, UserAccountPart
 from src.apps.account.domain.value_objects.email import Email
 from src.apps.account.domain.value_objects.nickname import NickName
 from src.apps.account.domain.value_objects.social_link import SocialLink
@@ -75,4 +75,25 @@ class TestUserAccountAggregate:
         user_account.update_nickname(same_nickname, mock_checker)
 
         assert user_account.nickname.name == "기존닉네임"
-        mock_checker.assert_not_called()
\ No newline at end of file
+        mock_checker.assert_not_called()
+
+    # 계약: 저장소와 맞춘(mark_clean) 뒤에는 바뀐 부분만 changed_parts에 남아야 한다.
+    def test_changed_parts_track_only_touched_parts(self, user_account):
+        assert user_account.changed_parts == UserAccountPart.ALL
+
+        user_account.mark_clean()
+        assert not user_account.has_changes
+
+        user_account.record_login(datetime.now())
+        assert user_account.changed_parts == {UserAccountPart.LAST_LOGIN}
+
+    # 계약: 소셜 링크 변경은 마지막으로 저장소와 맞춘 상태와 비교한 추가분으로 드러나야 한다.
+    def test_added_social_links_are_diffed_against_persisted_state(self, user_account):
+        user_account.mark_clean()
+        new_link = SocialLink("kakao", "kakao_id_456")
+
+        user_account.add_social_link(new_link)
+
+        assert user_account.changed_parts == {UserAccountPart.SOCIAL_LINKS}
+        assert user_account.added_social_links == [new_link]
+        assert user_account.removed_social_links == []
@@ -1,3 +1,5 @@
+import unicodedata
+
 import pytest
 from src.apps.account.domain.value_objects.nickname import NickName
 
@@ -24,4 +26,12 @@ def test_nickname_equality():
     nick2 = NickName("같은닉네임")
     nick3 = NickName("다른닉네임")
     assert nick1 == nick2
-    assert nick1 != nick3
\ No newline at end of file
+    assert nick1 != nick3
+
+
+# 계약: 정규화 값은 대소문자와 유니코드 표기(NFC/NFD) 차이를 무시해야 한다.
+def test_nickname_normalized_ignores_case_and_unicode_form():
+    composed = NickName("Café닉")
+    decomposed = NickName(unicodedata.normalize('NFD', "CAFÉ닉"))
+
+    assert composed.normalized == decomposed.normalized == "café닉"
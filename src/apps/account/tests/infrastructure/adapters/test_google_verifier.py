@@ -0,0 +1,155 @@
+import time
+
+import pytest
+import rsa
+from google.auth import crypt, jwt
+
+from src.apps.account.infrastructure.adapters.google_certs import GoogleCertificateStore
+from src.apps.account.infrastructure.adapters.google_verifier import GoogleTokenVerifier
+
+CLIENT_ID = "test-client-id.apps.googleusercontent.com"
+
+
+def _make_key(key_id):
+    public_key, private_key = rsa.newkeys(1024)
+    signer = crypt.RSASigner.from_string(private_key.save_pkcs1(), key_id)
+    return signer, public_key.save_pkcs1().decode()
+
+
+@pytest.fixture(scope="module")
+def keys():
+    return {key_id: _make_key(key_id) for key_id in ("key-1", "key-2")}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeFetcher:
+    """로컬 키 서버 대용. 호출 횟수를 세고, 현재 공개 키 집합과 max-age를 돌려준다."""
+
+    def __init__(self, certs, max_age=3600):
+        self.certs = certs
+        self.max_age = max_age
+        self.calls = 0
+
+    def __call__(self, url):
+        self.calls += 1
+        return dict(self.certs), self.max_age
+
+
+def _token(signer, **overrides):
+    now = int(time.time())
+    payload = {
+        "iss": "https://accounts.google.com", "aud": CLIENT_ID, "sub": "google-123",
+        "email": "user@example.com", "name": "구글사용자", "iat": now, "exp": now + 600,
+    }
+    payload.update(overrides)
+    return jwt.encode(signer, payload).decode()
+
+
+@pytest.fixture
+def google_client_id(settings):
+    settings.GOOGLE_CLIENT_ID = CLIENT_ID
+
+
+# 계약: 인증서는 max-age 동안 캐시되어, 여러 번 검증해도 인증서는 한 번만 받아야 한다.
+def test_verify_reuses_cached_certs(keys, google_client_id):
+    signer, public_pem = keys["key-1"]
+    fetcher = FakeFetcher({"key-1": public_pem})
+    verifier = GoogleTokenVerifier(cert_store=GoogleCertificateStore(fetcher=fetcher, clock=FakeClock()))
+
+    first = verifier.verify(_token(signer))
+    verifier.verify(_token(signer, sub="google-456"))
+
+    assert fetcher.calls == 1
+    assert first.social_id == "google-123"
+    assert first.email == "user@example.com"
+    assert first.nickname == "구글사용자"
+
+
+# 계약: max-age가 지나면 다음 검증에서 인증서를 다시 받아야 한다.
+def test_certs_are_refetched_after_max_age(keys):
+    _, public_pem = keys["key-1"]
+    fetcher = FakeFetcher({"key-1": public_pem}, max_age=600)
+    clock = FakeClock()
+    store = GoogleCertificateStore(fetcher=fetcher, clock=clock)
+
+    store.get_certs("key-1")
+    clock.now += 601
+    store.get_certs("key-1")
+
+    assert fetcher.calls == 2
+
+
+# 계약: 만료 직전(refresh margin)에는 기존 인증서를 바로 반환하고 백그라운드에서 갱신해야 한다.
+def test_certs_are_refreshed_in_background_near_expiry(keys):
+    _, public_pem = keys["key-1"]
+    fetcher = FakeFetcher({"key-1": public_pem}, max_age=600)
+    clock = FakeClock()
+    store = GoogleCertificateStore(fetcher=fetcher, clock=clock, refresh_margin_seconds=300)
+    store.get_certs("key-1")
+
+    clock.now += 400
+    certs = store.get_certs("key-1")
+    store._refresh_thread.join(timeout=5)
+
+    assert certs == {"key-1": public_pem}
+    assert fetcher.calls == 2
+    assert store._expires_at == clock.now + 600
+
+
+# 계약: 캐시에 없는 kid(키 교체)가 오면 인증서를 다시 받아 새 키로 검증해야 한다.
+def test_unknown_key_id_triggers_refresh(keys, google_client_id):
+    _, old_pem = keys["key-1"]
+    new_signer, new_pem = keys["key-2"]
+    fetcher = FakeFetcher({"key-1": old_pem})
+    clock = FakeClock()
+    verifier = GoogleTokenVerifier(cert_store=GoogleCertificateStore(fetcher=fetcher, clock=clock))
+    verifier.cert_store.get_certs()
+
+    fetcher.certs = {"key-1": old_pem, "key-2": new_pem}
+    clock.now += 61
+    user_info = verifier.verify(_token(new_signer))
+
+    assert fetcher.calls == 2
+    assert user_info.social_id == "google-123"
+
+
+# 계약: 존재하지 않는 kid가 반복되어도 최소 갱신 간격 안에서는 인증서를 다시 받지 않아야 한다.
+def test_unknown_key_id_refresh_is_rate_limited(keys):
+    _, public_pem = keys["key-1"]
+    fetcher = FakeFetcher({"key-1": public_pem})
+    store = GoogleCertificateStore(fetcher=fetcher, clock=FakeClock(), min_refresh_interval_seconds=60)
+
+    store.get_certs("key-1")
+    store.get_certs("unknown-kid")
+    store.get_certs("unknown-kid")
+
+    assert fetcher.calls == 1
+
+
+# 계약: audience가 다른 토큰은 ValueError로 거부해야 한다.
+def test_verify_rejects_wrong_audience(keys, google_client_id):
+    signer, public_pem = keys["key-1"]
+    verifier = GoogleTokenVerifier(
+        cert_store=GoogleCertificateStore(fetcher=FakeFetcher({"key-1": public_pem}), clock=FakeClock())
+    )
+
+    with pytest.raises(ValueError):
+        verifier.verify(_token(signer, aud="other-client-id"))
+
+
+# 계약: Google이 아닌 발급자의 토큰은 ValueError로 거부해야 한다.
+def test_verify_rejects_wrong_issuer(keys, google_client_id):
+    signer, public_pem = keys["key-1"]
+    verifier = GoogleTokenVerifier(
+        cert_store=GoogleCertificateStore(fetcher=FakeFetcher({"key-1": public_pem}), clock=FakeClock())
+    )
+
+    with pytest.raises(ValueError, match="발급자"):
+        verifier.verify(_token(signer, iss="https://evil.example.com"))
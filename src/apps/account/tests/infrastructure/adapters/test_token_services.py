@@ -16,7 +16,7 @@ def test_issue_for_user(mocker):
     mock_refresh_token.__str__.return_value = "fake_refresh_token_string"
     type(mock_refresh_token).access_token = mock_access_token
 
-    mock_for_user = mocker.patch('src.apps.account.infrastructure.token_services.RefreshToken.for_user', return_value=mock_refresh_token)
+    mock_for_user = mocker.patch('src.apps.account.infrastructure.token_services.AccountRefreshToken.for_user', return_value=mock_refresh_token)
     token_service = SimpleJwtTokenService()
 
     result_tokens = token_service.issue_for_user(user_account_id=123)
@@ -26,12 +26,12 @@ def test_issue_for_user(mocker):
     assert result_tokens["refresh"] == "fake_refresh_token_string"
 
 
-# 계약: 로그아웃(블랙리스트) 시, SimpleJwtTokenService는 RefreshToken 객체를 생성하고 blacklist 메서드를 호출해야 한다.
+# 계약: 로그아웃(블랙리스트) 시, SimpleJwtTokenService는 AccountRefreshToken 객체를 생성하고 blacklist 메서드를 호출해야 한다.
 def test_blacklist_token_successfully(mocker):
     # --- 1. 준비 (Arrange) ---
 
     # RefreshToken 클래스 자체를 Mocking합니다.
-    mock_refresh_token_class = mocker.patch('src.apps.account.infrastructure.token_services.RefreshToken')
+    mock_refresh_token_class = mocker.patch('src.apps.account.infrastructure.token_services.AccountRefreshToken')
 
     # 생성된 Mock 클래스의 인스턴스에서 blacklist 메서드를 가져옵니다.
     mock_blacklist_method = mock_refresh_token_class.return_value.blacklist
@@ -0,0 +1,63 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from src.apps.account.infrastructure.authentication import AccountRefreshToken, AccountTokenUser
+from src.apps.movie.models import MovieModel
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def user():
+    return get_user_model().objects.create_user(email_address="jwt@example.com", nickname="토큰유저", is_staff=True)
+
+
+def bearer_client(user):
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccountRefreshToken.for_user(user).access_token}")
+    return client
+
+
+# 계약: 발급된 액세스 토큰에는 nickname/is_staff 클레임이 있어야 하고, AccountTokenUser는 이를 그대로 노출해야 한다.
+def test_access_token_carries_profile_claims(user):
+    token_user = AccountTokenUser(AccountRefreshToken.for_user(user).access_token)
+
+    assert (token_user.id, token_user.nickname, token_user.is_staff) == (user.id, "토큰유저", True)
+    assert token_user.is_authenticated
+
+
+# 계약: nickname 클레임이 없는 이전 토큰은 DB에서 닉네임을 읽어 빈 닉네임으로 댓글을 쓰지 않아야 한다.
+def test_token_without_nickname_claim_falls_back_to_database(user):
+    access_token = AccountRefreshToken.for_user(user).access_token
+    del access_token['nickname']
+
+    assert AccountTokenUser(access_token).nickname == "토큰유저"
+
+
+# 계약: 기본 인증은 토큰 클레임만 사용하므로, 인증된 요청에서도 users 테이블을 조회하지 않아야 한다.
+def test_default_authentication_skips_user_lookup(user):
+    movie = MovieModel.objects.create(korean_title="기생충")
+    client = bearer_client(user)
+
+    with CaptureQueriesContext(connection) as captured:
+        response = client.post(
+            reverse('movie_comment_list_create', kwargs={'movie_id': movie.id}), {'content': "좋아요"}, format='json'
+        )
+
+    assert response.status_code == 201
+    assert response.data['author'] == {'account_id': user.id, 'nickname': "토큰유저"}
+    assert not [q for q in captured.captured_queries if 'FROM "users"' in q['sql']]
+
+
+# 계약: DB 인증을 지정한 뷰는 비활성화된 계정의 토큰을 거부해야 한다.
+def test_database_authentication_rejects_inactive_user(user):
+    client = bearer_client(user)
+    get_user_model().objects.filter(id=user.id).update(is_active=False)
+
+    response = client.get(reverse('user_profile'))
+
+    assert response.status_code == 401
@@ -0,0 +1,137 @@
+import datetime
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from src.apps.account.domain.value_objects.social_link import SocialLink
+from src.apps.account.infrastructure import last_login_buffer
+from src.apps.account.infrastructure.last_login_buffer import LastLoginBuffer
+from src.apps.account.infrastructure.repositories import DjangoUserAccountRepository
+from src.apps.account.models import UserSocialAccounts
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def users():
+    User = get_user_model()
+    return [User.objects.create_user(email_address=f"user{i}@example.com", nickname=f"사용자{i}") for i in range(3)]
+
+
+@pytest.fixture
+def make_buffer():
+    """record가 띄우는 기록 스레드를 테스트가 끝날 때 멈춘다."""
+    buffers = []
+
+    def make(**kwargs):
+        buffers.append(LastLoginBuffer(**kwargs))
+        return buffers[-1]
+
+    yield make
+    for buffer in buffers:
+        buffer.stop(timeout=5)
+
+
+# 계약: 버퍼에 쌓인 로그인 시각은 flush 때 사용자 수와 관계없이 UPDATE 한 번으로 기록되어야 한다.
+def test_flush_writes_all_pending_logins_in_one_update(users, make_buffer):
+    buffer = make_buffer(flush_interval_seconds=30)
+    login_time = timezone.now()
+    for user in users:
+        buffer.record(user.id, login_time)
+
+    with CaptureQueriesContext(connection) as captured:
+        flushed = buffer.flush()
+
+    assert flushed == 3
+    assert len(buffer) == 0
+    assert [q['sql'].lstrip().split(' ', 1)[0].upper() for q in captured.captured_queries] == ['UPDATE']
+    assert set(get_user_model().objects.values_list('last_login_at', flat=True)) == {login_time}
+
+
+# 계약: 같은 사용자의 로그인이 여러 번 쌓이면 가장 최근 시각만 기록되어야 한다.
+def test_record_keeps_latest_login_per_user(users, make_buffer):
+    buffer = make_buffer(flush_interval_seconds=30)
+    earlier = timezone.now()
+    later = earlier + datetime.timedelta(minutes=5)
+
+    buffer.record(users[0].id, later)
+    buffer.record(users[0].id, earlier)
+    buffer.flush()
+
+    users[0].refresh_from_db()
+    assert users[0].last_login_at == later
+
+
+# 계약: 동기 모드(주기 0)에서는 record가 즉시 기록해야 한다.
+def test_sync_mode_writes_immediately(users):
+    buffer = LastLoginBuffer(flush_interval_seconds=0)
+    login_time = timezone.now()
+
+    buffer.record(users[0].id, login_time)
+
+    users[0].refresh_from_db()
+    assert users[0].last_login_at == login_time
+    assert len(buffer) == 0
+
+
+# 계약: 버퍼가 max_size에 도달하면 주기를 기다리지 않고 바로 기록해야 한다.
+def test_full_buffer_flushes_inline(users, make_buffer):
+    buffer = make_buffer(flush_interval_seconds=30, max_size=2)
+    login_time = timezone.now()
+
+    buffer.record(users[0].id, login_time)
+    assert len(buffer) == 1
+    buffer.record(users[1].id, login_time)
+
+    assert len(buffer) == 0
+    assert get_user_model().objects.filter(last_login_at=login_time).count() == 2
+
+
+# 계약: 기록 스레드는 첫 record에서 프로세스마다 한 번만 시작되고, fork된 프로세스(pid 변경)에서는 새로 시작되어야 한다.
+def test_record_starts_flusher_lazily_per_process(users, make_buffer, monkeypatch):
+    buffer = make_buffer(flush_interval_seconds=30)
+    assert buffer._thread is None
+
+    buffer.record(users[0].id, timezone.now())
+    parent_thread, parent_stop_event = buffer._thread, buffer._stop_event
+    buffer.record(users[1].id, timezone.now())
+    assert parent_thread.is_alive() and buffer._thread is parent_thread
+
+    monkeypatch.setattr(last_login_buffer.os, 'getpid', lambda: -1)
+    buffer.record(users[2].id, timezone.now())
+    assert buffer._thread is not parent_thread and buffer._thread.is_alive()
+    parent_stop_event.set()
+    parent_thread.join(5)
+
+
+# 계약: stop은 남은 로그인 시각을 기록해야 한다. (프로세스 종료 시 atexit에서 호출)
+def test_stop_flushes_remaining_logins(users):
+    buffer = LastLoginBuffer(flush_interval_seconds=30)
+    buffer.start()
+    login_time = timezone.now()
+    buffer.record(users[0].id, login_time)
+
+    buffer.stop(timeout=5)
+
+    users[0].refresh_from_db()
+    assert users[0].last_login_at == login_time
+
+
+# 계약: 버퍼를 쓰는 저장소는 재방문 로그인 저장 시 쿼리를 보내지 않고, 이후 조회에는 버퍼의 최신 시각을 보여야 한다.
+def test_repository_defers_login_time_to_buffer(users, make_buffer):
+    UserSocialAccounts.objects.create(user=users[0], provider="google", provider_account_id="google-0")
+    buffer = make_buffer(flush_interval_seconds=30)
+    repository = DjangoUserAccountRepository(last_login_buffer=buffer)
+    user_account = repository.find_by_social_link(SocialLink("google", "google-0"))
+    login_time = timezone.now()
+    user_account.record_login(login_time)
+
+    with CaptureQueriesContext(connection) as captured:
+        repository.save(user_account)
+
+    assert len(captured) == 0
+    assert buffer.pending_for(users[0].id) == login_time
+    assert repository.find_by_id(users[0].id).last_login_at == login_time
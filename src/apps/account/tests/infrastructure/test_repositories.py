@@ -0,0 +1,114 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from src.apps.account.application.dtos import SocialLoginRequestDto
+from src.apps.account.application.ports.social_verifier import SocialUserInfo
+from src.apps.account.application.services import UserAuthAppService
+from src.apps.account.domain.value_objects.social_link import SocialLink
+from src.apps.account.infrastructure.authentication import AccountTokenUser
+from src.apps.account.infrastructure.repositories import DjangoUserAccountRepository
+from src.apps.account.infrastructure.token_services import SimpleJwtTokenService
+from src.apps.account.models import UserSocialAccounts
+from rest_framework_simplejwt.tokens import AccessToken
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def returning_user():
+    user = get_user_model().objects.create_user(email_address="back@example.com", nickname="재방문")
+    UserSocialAccounts.objects.create(user=user, provider="google", provider_account_id="google-1")
+    return user
+
+
+def _write_statements(captured):
+    return [q['sql'] for q in captured.captured_queries if not q['sql'].lstrip().upper().startswith('SELECT')]
+
+
+# 계약: 소셜 링크로 사용자를 찾을 때, 사용자와 모든 소셜 링크를 쿼리 한 번으로 읽어야 한다.
+def test_find_by_social_link_uses_single_query(returning_user):
+    repository = DjangoUserAccountRepository()
+
+    with CaptureQueriesContext(connection) as captured:
+        user_account = repository.find_by_social_link(SocialLink("google", "google-1"))
+
+    assert len(captured) == 1
+    assert user_account.account_id == returning_user.id
+    assert user_account.social_links == [SocialLink("google", "google-1")]
+    assert not user_account.has_changes
+
+
+# 계약: 로그인 시각만 바뀐 애그리거트 저장은 last_login_at 한 컬럼 UPDATE 한 번이어야 한다.
+def test_save_login_only_issues_narrow_update(returning_user):
+    repository = DjangoUserAccountRepository()
+    user_account = repository.find_by_social_link(SocialLink("google", "google-1"))
+    login_time = timezone.now()
+    user_account.record_login(login_time)
+
+    with CaptureQueriesContext(connection) as captured:
+        saved = repository.save(user_account)
+
+    assert saved is user_account
+    assert len(captured) == 1
+    assert 'UPDATE' in captured[0]['sql'] and 'last_login_at' in captured[0]['sql']
+    assert 'nickname' not in captured[0]['sql']
+    returning_user.refresh_from_db()
+    assert returning_user.last_login_at == login_time
+
+
+# 계약: 소셜 링크 추가는 기존 링크 행을 지우지 않고 새 링크만 INSERT해야 한다.
+def test_save_new_social_link_inserts_only_the_difference(returning_user):
+    repository = DjangoUserAccountRepository()
+    user_account = repository.find_by_id(returning_user.id)
+    original_link_id = UserSocialAccounts.objects.get(user=returning_user).id
+    user_account.add_social_link(SocialLink("kakao", "kakao-1"))
+
+    with CaptureQueriesContext(connection) as captured:
+        repository.save(user_account)
+
+    writes = _write_statements(captured)
+    assert not any(sql.lstrip().upper().startswith('DELETE') for sql in writes)
+    assert sorted(UserSocialAccounts.objects.filter(user=returning_user).values_list('provider', flat=True)) == [
+        'google', 'kakao']
+    assert UserSocialAccounts.objects.filter(id=original_link_id).exists()
+
+
+# 계약: 재방문 사용자 로그인은 조회 1회, last_login_at UPDATE 1회, 발급 토큰 기록 INSERT 1회로 끝나야 한다.
+def test_returning_user_login_fast_path(returning_user, mocker):
+    verifier = mocker.MagicMock()
+    verifier.verify.return_value = SocialUserInfo("google-1", "back@example.com", "재방문")
+    service = UserAuthAppService(
+        user_account_repository=DjangoUserAccountRepository(),
+        social_verifier_map={"google": lambda: verifier},
+        token_service=SimpleJwtTokenService(),
+    )
+
+    with CaptureQueriesContext(connection) as captured:
+        result = service.login_or_register(SocialLoginRequestDto("google", "id-token", "back@example.com", None))
+
+    statements = [q['sql'].lstrip().split(' ', 1)[0].upper() for q in captured.captured_queries]
+    assert statements == ['SELECT', 'UPDATE', 'INSERT']
+    assert result.is_new_user is False
+    token_user = AccountTokenUser(AccessToken(result.access_token))
+    assert (token_user.id, token_user.nickname) == (returning_user.id, "재방문")
+
+
+# 계약: 신규 사용자 저장 후 반환된 애그리거트는 발급된 ID를 가지고 깨끗한 상태여야 한다.
+def test_save_new_user_assigns_account_id(mocker):
+    verifier = mocker.MagicMock()
+    verifier.verify.return_value = SocialUserInfo("google-new", "new@example.com", "새사용자")
+    service = UserAuthAppService(
+        user_account_repository=DjangoUserAccountRepository(),
+        social_verifier_map={"google": lambda: verifier},
+        token_service=SimpleJwtTokenService(),
+    )
+
+    result = service.login_or_register(SocialLoginRequestDto("google", "id-token", "new@example.com", None))
+
+    user = get_user_model().objects.get(email_address="new@example.com")
+    assert result.is_new_user is True
+    assert result.user.account_id == user.id
+    assert list(user.social_accounts.values_list('provider_account_id', flat=True)) == ["google-new"]
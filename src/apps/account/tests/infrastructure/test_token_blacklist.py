@@ -0,0 +1,205 @@
+import datetime
+import uuid
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.tokens import AccessToken
+
+from src.apps.account.infrastructure.authentication import AccountRefreshToken
+from src.apps.account.infrastructure.token_services import SimpleJwtTokenService
+from src.apps.account.infrastructure.token_blacklist import (
+    BloomFilter, BlacklistedTokenFilter, get_blacklisted_token_filter
+)
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def user():
+    return get_user_model().objects.create_user(email_address="refresh@example.com", nickname="갱신유저")
+
+
+@pytest.fixture
+def fresh_process_filter(settings):
+    # 프로세스 단위 필터를 테스트마다 새로 만들고, 다른 프로세스의 블랙리스트를 바로 반영하도록 한다.
+    settings.TOKEN_BLACKLIST_SYNC_SECONDS = 0
+    get_blacklisted_token_filter.cache_clear()
+    yield
+    get_blacklisted_token_filter.cache_clear()
+
+
+def _outstanding(jti, expires_at, blacklisted=False):
+    token = OutstandingToken.objects.create(jti=jti, token="t", created_at=timezone.now(), expires_at=expires_at)
+    if blacklisted:
+        BlacklistedToken.objects.create(token=token)
+    return token
+
+
+# 계약: Bloom 필터는 추가한 키를 항상 포함한다고 답하고, 추가하지 않은 키의 오탐은 드물어야 한다.
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    added = [uuid.uuid4().hex for _ in range(1000)]
+    for key in added:
+        bloom.add(key)
+
+    assert all(key in bloom for key in added)
+    false_positives = sum(uuid.uuid4().hex in bloom for _ in range(2000))
+    assert false_positives < 100
+
+
+# 계약: 이미 들어 있는 키를 다시 넣어도 count가 늘지 않아야 한다. (용량 초과 판단은 새 키만 센다)
+def test_bloom_filter_counts_only_new_keys():
+    bloom = BloomFilter(capacity=100, error_rate=0.01)
+
+    assert bloom.add("a") is True
+    assert bloom.add("a") is False
+    assert bloom.count == 1
+
+
+class InlineRebuildTokenFilter(BlacklistedTokenFilter):
+    """백그라운드 재구성을 호출한 스레드에서 바로 실행한다. (테스트 DB 트랜잭션을 같은 연결로 보기 위함)"""
+
+    def _start_rebuild(self):
+        self._rebuild()
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+# 계약: 증분 동기화가 겹쳐 읽는 행은 count를 늘리지 않아, 동기화를 반복해도 용량 초과 재구성이 일어나지 않아야 한다.
+def test_overlapping_sync_does_not_inflate_count():
+    for i in range(3):
+        _outstanding(f"revoked-{i}", timezone.now() + datetime.timedelta(days=1), blacklisted=True)
+    token_filter = InlineRebuildTokenFilter(sync_interval_seconds=0, rebuild_interval_seconds=0)
+
+    for _ in range(5):
+        token_filter.is_blacklisted("unknown")
+
+    assert token_filter._filter.count == 3
+
+
+# 계약: 증분 동기화 범위보다 늦게 커밋된 행도 주기적 재구성에서 반영되어야 한다.
+def test_periodic_rebuild_picks_up_rows_missed_by_sync():
+    clock = FakeClock()
+    token_filter = InlineRebuildTokenFilter(sync_interval_seconds=5, rebuild_interval_seconds=600, clock=clock)
+    token_filter.is_blacklisted("anything")
+    _outstanding("late-commit", timezone.now() + datetime.timedelta(days=1), blacklisted=True)
+    token_filter._last_id += BlacklistedTokenFilter.SYNC_OVERLAP_IDS + 1  # 더 큰 id가 먼저 커밋된 상황
+
+    clock.now = 10
+    assert token_filter.is_blacklisted("late-commit") is False
+
+    clock.now = 601
+    token_filter.is_blacklisted("anything")
+    assert token_filter.is_blacklisted("late-commit") is True
+
+
+# 계약: 필터에 없는 JTI는 DB를 조회하지 않고 블랙리스트가 아니라고 판단해야 한다.
+def test_filter_skips_database_for_unknown_jti():
+    _outstanding("revoked", timezone.now() + datetime.timedelta(days=1), blacklisted=True)
+    token_filter = BlacklistedTokenFilter(sync_interval_seconds=60)
+    assert token_filter.is_blacklisted("revoked") is True
+
+    with CaptureQueriesContext(connection) as captured:
+        assert token_filter.is_blacklisted("never-revoked") is False
+
+    assert len(captured) == 0
+
+
+# 계약: 필터를 만든 뒤 다른 프로세스가 블랙리스트에 올린 JTI도 증분 동기화로 반영되어야 한다.
+def test_filter_picks_up_rows_blacklisted_elsewhere():
+    token_filter = BlacklistedTokenFilter(sync_interval_seconds=0)
+    assert token_filter.is_blacklisted("later") is False
+
+    _outstanding("later", timezone.now() + datetime.timedelta(days=1), blacklisted=True)
+
+    assert token_filter.is_blacklisted("later") is True
+
+
+# 계약: 토큰 갱신은 새 토큰을 돌려주고, 회전된 이전 리프레시 토큰은 다시 쓸 수 없어야 한다.
+def test_refresh_rotates_and_rejects_reused_token(user, fresh_process_filter):
+    client = APIClient()
+    refresh = str(AccountRefreshToken.for_user(user))
+
+    first = client.post(reverse('token_refresh'), {'refresh': refresh}, format='json')
+    reused = client.post(reverse('token_refresh'), {'refresh': refresh}, format='json')
+
+    assert first.status_code == 200
+    assert {'access', 'refresh'} <= set(first.data)
+    assert AccountRefreshToken(first.data['refresh'])['nickname'] == "갱신유저"
+    assert reused.status_code == 401
+
+
+# 계약: 로그아웃(SimpleJwtTokenService.blacklist)으로 블랙리스트에 오른 리프레시 토큰으로는 갱신할 수 없어야 한다.
+def test_logged_out_token_cannot_refresh(user, fresh_process_filter):
+    refresh = str(AccountRefreshToken.for_user(user))
+    SimpleJwtTokenService().blacklist(refresh)
+
+    response = APIClient().post(reverse('token_refresh'), {'refresh': refresh}, format='json')
+
+    assert response.status_code == 401
+
+
+# 계약: 갱신으로 받은 토큰의 nickname, is_staff 클레임은 DB의 현재 값이어야 한다. (권한 회수, 닉네임 변경 반영)
+def test_refresh_restamps_profile_claims(user, fresh_process_filter):
+    user.is_staff = True
+    user.save(update_fields=['is_staff'])
+    refresh = str(AccountRefreshToken.for_user(user))
+    user.nickname = "바뀐닉네임"
+    user.is_staff = False
+    user.save(update_fields=['nickname', 'is_staff'])
+
+    response = APIClient().post(reverse('token_refresh'), {'refresh': refresh}, format='json')
+
+    assert response.status_code == 200
+    access = AccessToken(response.data['access'])
+    rotated = AccountRefreshToken(response.data['refresh'])
+    assert (access['nickname'], access['is_staff']) == ("바뀐닉네임", False)
+    assert (rotated['nickname'], rotated['is_staff']) == ("바뀐닉네임", False)
+    assert OutstandingToken.objects.get(jti=rotated['jti']).token == response.data['refresh']
+
+
+# 계약: 발급 기록(OutstandingToken.token)은 클레임이 들어간, 실제로 발급된 토큰 문자열이어야 한다.
+def test_issued_token_is_recorded_as_issued(user):
+    token = AccountRefreshToken.for_user(user)
+
+    assert OutstandingToken.objects.get(jti=token['jti']).token == str(token)
+
+
+# 계약: 발급 기록이 없는 토큰을 블랙리스트에 올릴 때 사용자가 이미 탈퇴했다면 오류 없이 사용자 없는 기록으로 남겨야 한다.
+def test_blacklist_tolerates_deleted_user_without_outstanding_row(user, fresh_process_filter):
+    token = AccountRefreshToken.for_user(user)
+    OutstandingToken.objects.filter(jti=token['jti']).delete()
+    user.delete()
+
+    token.blacklist()
+
+    outstanding = OutstandingToken.objects.get(jti=token['jti'])
+    assert outstanding.user_id is None
+    assert BlacklistedToken.objects.filter(token=outstanding).exists()
+
+
+# 계약: 정리 명령은 만료된 토큰과 그 블랙리스트 행만 배치로 삭제해야 한다.
+def test_prune_command_deletes_only_expired_tokens():
+    past = timezone.now() - datetime.timedelta(days=1)
+    future = timezone.now() + datetime.timedelta(days=1)
+    for i in range(3):
+        _outstanding(f"expired-{i}", past, blacklisted=i % 2 == 0)
+    _outstanding("live", future, blacklisted=True)
+
+    call_command('prune_token_blacklist', '--batch-size', '2', stdout=open('/dev/null', 'w'))
+
+    assert list(OutstandingToken.objects.values_list('jti', flat=True)) == ["live"]
+    assert BlacklistedToken.objects.count() == 1
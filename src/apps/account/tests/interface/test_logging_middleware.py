@@ -0,0 +1,66 @@
+import re
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from src.apps.account import middleware
+
+pytestmark = pytest.mark.django_db
+
+SERVER_TIMING = re.compile(r'app;dur=[\d.]+, db;dur=[\d.]+;desc="(\d+) queries"')
+
+
+@pytest.fixture(autouse=True)
+def clear_taken_nickname_cache():
+    caches['nickname_taken'].clear()
+
+
+def check_nickname(nickname="새닉네임"):
+    return APIClient().get(reverse('nickname_availability'), {'nickname': nickname})
+
+
+# 계약: 응답에는 처리 시간과 SQL 수/시간을 담은 Server-Timing 헤더가 붙어야 한다.
+def test_server_timing_header_reports_query_count():
+    response = check_nickname()
+
+    match = SERVER_TIMING.fullmatch(response['Server-Timing'])
+    assert match and match.group(1) == "1"
+
+
+# 계약: 요청 종료 로그에는 엔드포인트, 처리 시간, SQL 수/시간이 구조화된 필드로 남아야 한다.
+def test_finished_log_carries_metrics(mocker):
+    info = mocker.spy(middleware.logger, 'info')
+
+    check_nickname()
+
+    finished = info.call_args_list[-1]
+    assert finished.args[0] == "Request finished: 200"
+    metrics = finished.kwargs['extra']
+    assert metrics['endpoint'] == 'nickname_availability'
+    assert metrics['db_query_count'] == 1
+    assert metrics['duration_ms'] >= metrics['db_time_ms'] >= 0
+
+
+# 계약: 엔드포인트별 예산을 넘으면 경고 로그를 남기고, 넘지 않으면 남기지 않아야 한다.
+def test_budget_warning_only_when_exceeded(mocker, settings):
+    get_user_model().objects.create_user(email_address="taken@example.com", nickname="사용중닉")
+    warning = mocker.spy(middleware.logger, 'warning')
+
+    settings.REQUEST_PERFORMANCE_BUDGETS = {'nickname_availability': {'max_queries': 1}}
+    check_nickname("사용중닉")
+    assert warning.call_count == 0
+
+    settings.REQUEST_PERFORMANCE_BUDGETS = {'nickname_availability': {'max_queries': 0}}
+    check_nickname("다른닉네임")
+    assert warning.call_count == 1
+    assert warning.call_args.kwargs['extra']['db_query_count'] == 1
+
+
+# 계약: SERVER_TIMING_HEADER_ENABLED가 False이면 헤더를 붙이지 않아야 한다.
+def test_server_timing_header_can_be_disabled(settings):
+    settings.SERVER_TIMING_HEADER_ENABLED = False
+
+    assert not check_nickname().has_header('Server-Timing')
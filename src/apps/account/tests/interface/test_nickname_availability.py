@@ -0,0 +1,85 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from src.apps.account.domain.value_objects.nickname import NickName
+from src.apps.account.infrastructure.repositories import DjangoUserAccountRepository
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def clear_taken_nickname_cache():
+    caches['nickname_taken'].clear()
+    yield
+    caches['nickname_taken'].clear()
+
+
+@pytest.fixture
+def taken_user():
+    return get_user_model().objects.create_user(email_address="taken@example.com", nickname="MovieFan")
+
+
+def check(nickname):
+    return APIClient().get(reverse('nickname_availability'), {'nickname': nickname})
+
+
+# 계약: 아무도 쓰지 않는 닉네임은 사용 가능으로 응답해야 한다.
+def test_available_nickname(taken_user):
+    response = check("새로운닉네임")
+
+    assert response.status_code == 200
+    assert response.data == {'nickname': "새로운닉네임", 'available': True, 'reason': None}
+
+
+# 계약: 대소문자만 다른 닉네임도 사용 중으로 판단해야 한다.
+def test_taken_nickname_ignores_case(taken_user):
+    response = check("moviefan")
+
+    assert response.status_code == 200
+    assert response.data['available'] is False
+    assert response.data['reason'] == "이미 사용 중인 닉네임입니다."
+
+
+# 계약: 형식에 맞지 않는 닉네임은 DB를 조회하지 않고 이유와 함께 사용 불가로 응답해야 한다.
+def test_invalid_nickname_reports_reason():
+    with CaptureQueriesContext(connection) as captured:
+        response = check("닉")
+
+    assert response.data['available'] is False
+    assert "2자 이상" in response.data['reason']
+    assert len(captured) == 0
+
+
+# 계약: 사용 중으로 확인된 닉네임의 반복 조회는 캐시에서 답해 DB를 조회하지 않아야 한다.
+def test_taken_nickname_is_served_from_cache(taken_user):
+    check("MovieFan")
+
+    with CaptureQueriesContext(connection) as captured:
+        response = check("MOVIEFAN")
+
+    assert response.data['available'] is False
+    assert len(captured) == 0
+
+
+# 계약: exists_by_nickname은 정규화 값으로 한 번만 조회하고, 본인 계정은 제외할 수 있어야 한다.
+def test_exists_by_nickname_uses_single_query(taken_user):
+    repository = DjangoUserAccountRepository()
+
+    with CaptureQueriesContext(connection) as captured:
+        assert repository.exists_by_nickname(NickName("moviefan")) is True
+
+    assert len(captured) == 1
+    assert repository.exists_by_nickname(NickName("moviefan"), exclude_account_id=taken_user.id) is False
+
+
+# 계약: 정규화 값이 같은 닉네임으로는 사용자를 만들 수 없어야 한다. (유일 인덱스)
+def test_normalized_nickname_is_unique(taken_user):
+    from django.db import IntegrityError, transaction
+
+    with pytest.raises(IntegrityError), transaction.atomic():
+        get_user_model().objects.create_user(email_address="other@example.com", nickname="MOVIEFAN")
@@ -1,6 +1,8 @@
 import logging
 from django.contrib import admin
 
+# 뷰, 저장소와 같은 컨테이너(src.apps.*)를 써야 워커 내 자동완성 인덱스 싱글턴을 공유한다.
+from src.apps.movie.containers import MovieContainer
 from src.apps.movie.models import MovieCastMemberModel, StillCutModel, TrailerModel, MoviePlatformRatingModel, \
     MovieOTTAvailabilityModel, MovieModel, PersonModel, GenreModel, OTTPlatformModel
 
@@ -52,6 +54,23 @@ class MovieAdmin(admin.ModelAdmin):
     def save_model(self, request, obj, form, change):
         logger.info(f"Movie '{obj.korean_title}' is being saved by admin user '{request.user}'. Change: {change}")
         super().save_model(request, obj, form, change)
+        MovieContainer.movie_detail_cache().invalidate(obj.id)
+
+    def save_related(self, request, form, formsets, change):
+        super().save_related(request, form, formsets, change)
+        # 인라인(출연진, 평점, OTT 등)과 M2M(감독, 장르)은 save_model 이후에 저장되므로 여기서 다시 반영한다.
+        MovieContainer.movie_full_text_index().sync([form.instance.id])
+        MovieContainer.movie_korean_index().index_movies([form.instance.id])
+        MovieContainer.movie_rating_projection().sync([form.instance.id])
+        MovieContainer.movie_detail_cache().invalidate(form.instance.id)
+        MovieContainer.movie_autocomplete_index().upsert_movie(form.instance.id, form.instance.korean_title)
+
+    def delete_model(self, request, obj):
+        movie_id = obj.id
+        super().delete_model(request, obj)
+        MovieContainer.movie_full_text_index().remove([movie_id])
+        MovieContainer.movie_detail_cache().invalidate(movie_id)
+        MovieContainer.movie_autocomplete_index().remove_movie(movie_id)
 
 
 @admin.register(PersonModel)
@@ -59,6 +78,11 @@ class PersonAdmin(admin.ModelAdmin):
     list_display = ('name', 'external_id')
     search_fields = ('name',)
 
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        MovieContainer.movie_korean_index().index_people([obj.id])
+        MovieContainer.movie_autocomplete_index().upsert_person(obj.id, obj.name)
+
 
 @admin.register(GenreModel)
 class GenreAdmin(admin.ModelAdmin):
@@ -71,8 +95,24 @@ class OTTPlatformAdmin(admin.ModelAdmin):
     search_fields = ('name',)
 
 
+@admin.register(MoviePlatformRatingModel)
+class MoviePlatformRatingAdmin(admin.ModelAdmin):
+    list_display = ('movie', 'platform_name', 'score')
+    list_filter = ('platform_name',)
+
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        MovieContainer.movie_rating_projection().sync([obj.movie_id])
+        MovieContainer.movie_detail_cache().invalidate(obj.movie_id)
+
+    def delete_model(self, request, obj):
+        movie_id = obj.movie_id
+        super().delete_model(request, obj)
+        MovieContainer.movie_rating_projection().sync([movie_id])
+        MovieContainer.movie_detail_cache().invalidate(movie_id)
+
+
 admin.site.register(MovieCastMemberModel)
 admin.site.register(StillCutModel)
 admin.site.register(TrailerModel)
-admin.site.register(MoviePlatformRatingModel)
 admin.site.register(MovieOTTAvailabilityModel)
\ No newline at end of file
@@ -46,13 +46,24 @@ class SortOptionDto:
 
 
 class PaginationDto:
-    def __init__(self, page_number: int = 1, page_size: int = 20):
+    COUNT_MODES = ('exact', 'estimated')
+
+    def __init__(self, page_number: int = 1, page_size: int = 20, cursor: Optional[str] = None,
+                 count_mode: str = 'exact'):
         if not isinstance(page_number, int) or page_number < 1:
             raise ValueError("페이지 번호는 1 이상의 정수여야 합니다.")
         if not isinstance(page_size, int) or not (1 <= page_size <= 100):
             raise ValueError("페이지 크기는 1에서 100 사이의 정수여야 합니다.")
+        if cursor is not None and (not isinstance(cursor, str) or len(cursor) > 512):
+            raise ValueError("커서는 최대 512자의 문자열이어야 합니다.")
+        if count_mode not in self.COUNT_MODES:
+            raise ValueError("count_mode는 'exact' 또는 'estimated'여야 합니다.")
         self.page_number = page_number
         self.page_size = page_size
+        # cursor가 있으면 page_number 대신 keyset 방식으로 다음 페이지를 조회한다.
+        self.cursor = cursor or None
+        # estimated이면 전체 개수를 상한까지만 센다. (예: "1000+")
+        self.count_mode = count_mode
 
 
 class MovieSearchCriteriaDto:
@@ -71,12 +82,14 @@ class MovieSearchCriteriaDto:
 
 class SearchedMovieItemDto:
     def __init__(self, movie_id: int, title: str, poster_image_url: Optional[str], release_year: Optional[int],
-                 rating: Optional[float]):
+                 rating: Optional[float], comment_count: int = 0, last_comment_at: Optional[datetime] = None):
         self.movie_id = movie_id
         self.title = title
         self.poster_image_url = poster_image_url
         self.release_year = release_year
         self.rating = rating
+        self.comment_count = comment_count
+        self.last_comment_at = last_comment_at
 
 
 class MovieSearchResultDto:
@@ -85,12 +98,16 @@ class MovieSearchResultDto:
                  total_results: int,
                  current_page: int,
                  total_pages: int,
-                 message: Optional[str] = None):
+                 message: Optional[str] = None,
+                 next_cursor: Optional[str] = None,
+                 is_total_exact: bool = True):
         self.movies = movies
         self.total_results = total_results
         self.current_page = current_page
         self.total_pages = total_pages
         self.message = message
+        self.next_cursor = next_cursor
+        self.is_total_exact = is_total_exact
 
 
 class TitleInfoDisplayDto:
@@ -165,4 +182,11 @@ class MovieDetailDto:
         self.platform_ratings = platform_ratings
         self.ott_availability = ott_availability
         self.created_at_str = created_at_str
-        self.updated_at_str = updated_at_str
\ No newline at end of file
+        self.updated_at_str = updated_at_str
+
+
+class AutocompleteSuggestionDto:
+    def __init__(self, suggestion_type: str, target_id: int, label: str):
+        self.suggestion_type = suggestion_type
+        self.target_id = target_id
+        self.label = label
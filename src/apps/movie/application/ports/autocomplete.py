@@ -0,0 +1,19 @@
+import abc
+
+
+class MovieAutocompleteIndex(abc.ABC):
+    @abc.abstractmethod
+    def suggest(self, prefix, limit):
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def upsert_movie(self, movie_id, title):
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def upsert_person(self, person_id, name):
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def remove_movie(self, movie_id):
+        raise NotImplementedError
@@ -0,0 +1,23 @@
+import abc
+
+
+class MovieDetailCache(abc.ABC):
+    @abc.abstractmethod
+    def get(self, movie_id):
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def set(self, movie_id, movie_detail_dto):
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def get_many(self, movie_ids):
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def set_many(self, movie_detail_dtos_by_id):
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def invalidate(self, movie_id):
+        raise NotImplementedError
@@ -0,0 +1,15 @@
+import abc
+
+
+class MovieCommentActivityReader(abc.ABC):
+    """순위 계산에 쓰는 영화별 댓글 활동. 댓글을 소유한 컨텍스트(review_community)가 구현한다."""
+
+    @abc.abstractmethod
+    def comment_counts(self):
+        """{movie_id: 전체 댓글 수}"""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def recent_comment_counts(self, since):
+        """{movie_id: since 이후 작성된 댓글 수}"""
+        raise NotImplementedError
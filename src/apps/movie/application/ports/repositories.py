@@ -8,10 +8,18 @@ class MovieRepository(abc.ABC):
     def find_by_id(self, movie_id):
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def find_by_ids(self, movie_ids):
+        raise NotImplementedError
+
     @abc.abstractmethod
     def save(self, movie: Movie):
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def save_many(self, movies):
+        raise NotImplementedError
+
     @abc.abstractmethod
     def delete(self, movie_id):
         raise NotImplementedError
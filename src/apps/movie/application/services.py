@@ -1,5 +1,7 @@
 from .dtos import MovieDetailDto, PaginationDto, StillCutDisplayDto, TrailerDisplayDto, MoviePlatformRatingDisplayDto, \
     OTTInfoDisplayDto, TitleInfoDisplayDto, PlotDisplayDto
+from .ports.autocomplete import MovieAutocompleteIndex
+from .ports.caches import MovieDetailCache
 from .ports.repositories import MovieRepository, MovieSearchRepository
 import logging
 
@@ -8,9 +10,13 @@ logger = logging.getLogger(__name__)
 class MovieAppService:
     def __init__(self, 
                  movie_repository: MovieRepository,
-                 movie_search_repository: MovieSearchRepository):
+                 movie_search_repository: MovieSearchRepository,
+                 movie_detail_cache: MovieDetailCache = None,
+                 autocomplete_index: MovieAutocompleteIndex = None):
         self.movie_repository = movie_repository
         self.movie_search_repository = movie_search_repository
+        self.movie_detail_cache = movie_detail_cache
+        self.autocomplete_index = autocomplete_index
 
     def _movie_aggregate_to_detail_dto(self, movie) -> MovieDetailDto:
         genres_display = [genre_vo.name for genre_vo in movie.genres]
@@ -84,17 +90,48 @@ class MovieAppService:
         logger.info(f"키워드로 영화를 찾습니다.: {criteria_dto.__dict__}")
         return self.movie_search_repository.search_movies(criteria=criteria_dto)
 
+    def get_autocomplete_suggestions(self, query, limit=10):
+        if not self.autocomplete_index:
+            return []
+        return self.autocomplete_index.suggest(query, limit)
+
     def get_movie_details(self, movie_id):
         logger.info(f"영화 정보를 가져옵니다. movie_id: {movie_id}")
+        if self.movie_detail_cache:
+            cached_dto = self.movie_detail_cache.get(movie_id)
+            if cached_dto is not None:
+                logger.info(f"캐시에서 영화 정보를 찾았습니다. movie_id: {movie_id}")
+                return cached_dto
+
         movie_aggregate = self.movie_repository.find_by_id(movie_id)
         if not movie_aggregate:
             logger.warning(f"{movie_id}에 해당되는 영화가 없습니다.")
             return None
 
         movie_detail_dto = self._movie_aggregate_to_detail_dto(movie_aggregate)
+        if self.movie_detail_cache:
+            self.movie_detail_cache.set(movie_id, movie_detail_dto)
         logger.info(f"영화를 성공적으로 찾았습니다. movie_id: {movie_id}")
         return movie_detail_dto
 
+    def get_movie_details_bulk(self, movie_ids):
+        unique_ids = list(dict.fromkeys(movie_ids))
+        logger.info(f"영화 정보를 일괄로 가져옵니다. movie_ids: {unique_ids}")
+
+        detail_dtos_by_id = self.movie_detail_cache.get_many(unique_ids) if self.movie_detail_cache else {}
+        missing_ids = [movie_id for movie_id in unique_ids if movie_id not in detail_dtos_by_id]
+
+        if missing_ids:
+            loaded_dtos_by_id = {
+                movie_aggregate.movie_id: self._movie_aggregate_to_detail_dto(movie_aggregate)
+                for movie_aggregate in self.movie_repository.find_by_ids(missing_ids)
+            }
+            if self.movie_detail_cache and loaded_dtos_by_id:
+                self.movie_detail_cache.set_many(loaded_dtos_by_id)
+            detail_dtos_by_id.update(loaded_dtos_by_id)
+
+        return [detail_dtos_by_id[movie_id] for movie_id in unique_ids if movie_id in detail_dtos_by_id]
+
     def get_popular_movies(self, 
                            list_type, 
                            genre_filter=None, 
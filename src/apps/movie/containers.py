@@ -1,18 +1,58 @@
 import logging
 from dependency_injector import containers, providers
 from .application.services import MovieAppService
+from .infrastructure.cache.count_cache import DjangoSearchCountCache
+from .infrastructure.cache.detail_cache import DjangoMovieDetailCache
+from .infrastructure.persistence.rating_projection import MovieRatingProjection
 from .infrastructure.persistence.repositories import DjangoMovieRepository, DjangoMovieSearchRepository
+from .infrastructure.ranking.materializer import MovieRankingMaterializer
+from .infrastructure.ranking.scheduler import MovieRankingScheduler
+from .infrastructure.search.autocomplete import InMemoryPrefixAutocompleteIndex
+from .infrastructure.search.fulltext import SqliteMovieFullTextIndex
+from .infrastructure.search.ngram_index import KoreanNgramIndex
+from src.apps.review_community.infrastructure.comment_activity import DjangoMovieCommentActivityReader
 
 logger = logging.getLogger(__name__)
 
 class MovieContainer(containers.DeclarativeContainer):
     logger.info("Initializing MovieContainer")
 
-    movie_repository = providers.Factory(DjangoMovieRepository)
-    movie_search_repository = providers.Factory(DjangoMovieSearchRepository)
+    movie_detail_cache = providers.Singleton(DjangoMovieDetailCache)
+    movie_search_count_cache = providers.Singleton(DjangoSearchCountCache)
+
+    movie_full_text_index = providers.Singleton(SqliteMovieFullTextIndex)
+    movie_korean_index = providers.Singleton(KoreanNgramIndex)
+    movie_rating_projection = providers.Singleton(MovieRatingProjection)
+    # 워커 프로세스당 하나의 인메모리 인덱스를 공유한다.
+    movie_autocomplete_index = providers.Singleton(InMemoryPrefixAutocompleteIndex)
+
+    movie_repository = providers.Factory(
+        DjangoMovieRepository,
+        detail_cache=movie_detail_cache,
+        full_text_index=movie_full_text_index,
+        korean_index=movie_korean_index,
+        autocomplete_index=movie_autocomplete_index,
+    )
+    movie_comment_activity = providers.Singleton(DjangoMovieCommentActivityReader)
+    movie_ranking_materializer = providers.Factory(
+        MovieRankingMaterializer,
+        comment_activity=movie_comment_activity,
+    )
+    # 워커 프로세스당 하나. settings.MOVIE_RANKING_REFRESH_INTERVAL_SECONDS가 없으면 시작하지 않는다.
+    movie_ranking_scheduler = providers.Singleton(MovieRankingScheduler, materializer=movie_ranking_materializer)
+
+    movie_search_repository = providers.Factory(
+        DjangoMovieSearchRepository,
+        full_text_index=movie_full_text_index,
+        korean_index=movie_korean_index,
+        count_cache=movie_search_count_cache,
+        ranking_scheduler=movie_ranking_scheduler,
+    )
 
     movie_app_service = providers.Factory(
         MovieAppService,
         movie_repository=movie_repository,
         movie_search_repository=movie_search_repository,
+        movie_detail_cache=movie_detail_cache,
+        autocomplete_index=movie_autocomplete_index,
     )
\ No newline at end of file
@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timezone
 
 from src.apps.movie.domain.value_objects.title_info_vo import TitleInfoVO
 from src.apps.movie.domain.value_objects.plot_vo import PlotVO
@@ -13,6 +13,15 @@ from src.apps.movie.domain.value_objects.trailer_vo import TrailerVO
 from src.apps.movie.domain.value_objects.movie_platform_rating_vo import MoviePlatformRatingVO
 from src.apps.movie.domain.value_objects.ott_info_vo import OTTInfoVO
 
+class MoviePart:
+    """저장 시 변경 여부를 추적하는 애그리거트의 영속 단위."""
+    DETAILS = 'details'  # 제목, 줄거리, 개봉일, 상영 시간, 포스터 (movies 행)
+    GENRES = 'genres'
+    DIRECTORS = 'directors'
+    CAST = 'cast'
+    ALL = frozenset({DETAILS, GENRES, DIRECTORS, CAST})
+
+
 class Movie:
     def __init__(self,
                  movie_id,
@@ -83,10 +92,15 @@ class Movie:
         self._platform_ratings = list(platform_ratings) 
         self._ott_availability = list(ott_availability) 
         
-        current_time = datetime.now() 
+        current_time = datetime.now(timezone.utc)
         self._created_at = created_at if created_at else current_time
         self._updated_at = updated_at if updated_at else current_time
 
+        # 새로 만든 애그리거트는 저장소 상태를 알 수 없으므로 모든 부분이 변경된 것으로 본다.
+        # 저장소가 불러오거나 저장한 뒤에는 mark_clean()으로 초기화된다.
+        self._changed_parts = set(MoviePart.ALL)
+        self._is_persisted = False
+
     # ... (프로퍼티 및 다른 메서드는 이전과 동일하게 유지) ...
     @property
     def movie_id(self):
@@ -161,22 +175,45 @@ class Movie:
             return str(self._title_info.korean_title)
         return f"Movie (ID: {self._movie_id})"
 
+    @property
+    def changed_parts(self):
+        return frozenset(self._changed_parts)
+
+    @property
+    def has_changes(self):
+        return bool(self._changed_parts)
+
+    @property
+    def is_persisted(self):
+        return self._is_persisted
+
+    def mark_clean(self):
+        """저장소와 상태가 같아졌음을 기록한다. (저장소 구현에서 조회/저장 직후 호출)"""
+        self._changed_parts.clear()
+        self._is_persisted = True
+
+    def _touch(self, part):
+        self._changed_parts.add(part)
+        # 저장소(USE_TZ)에 그대로 쓸 수 있도록 UTC 기준의 aware datetime을 쓴다.
+        self._updated_at = datetime.now(timezone.utc)
+
     def update_plot(self, new_plot):
         if not isinstance(new_plot, PlotVO):
             raise TypeError("새로운 줄거리는 PlotVO의 인스턴스여야 합니다.")
-        self._plot = new_plot
-        self._updated_at = datetime.now()
+        if new_plot != self._plot:
+            self._plot = new_plot
+            self._touch(MoviePart.DETAILS)
 
     def add_genre(self, genre):
         if not isinstance(genre, GenreVO):
             raise TypeError("추가할 장르는 GenreVO의 인스턴스여야 합니다.")
         if genre not in self._genres:
             self._genres.append(genre)
-            self._updated_at = datetime.now()
+            self._touch(MoviePart.GENRES)
 
     def remove_genre(self, genre_to_remove):
         if not isinstance(genre_to_remove, GenreVO):
             raise TypeError("삭제할 장르는 GenreVO의 인스턴스여야 합니다.")
         if genre_to_remove in self._genres:
             self._genres.remove(genre_to_remove)
-            self._updated_at = datetime.now()
+            self._touch(MoviePart.GENRES)
@@ -0,0 +1,37 @@
+import hashlib
+import json
+import logging
+
+from django.conf import settings
+from django.core.cache import caches
+
+logger = logging.getLogger(__name__)
+
+
+class DjangoSearchCountCache:
+    """
+    검색/목록 결과의 전체 개수를 정규화된 조건별로 잠시 보관하는 캐시.
+    개수는 페이지와 정렬에 무관하므로 같은 조건으로 페이지를 넘기는 동안 COUNT 쿼리를 다시 실행하지 않는다.
+    무효화 없이 settings.CACHES의 짧은 TIMEOUT에만 의존하므로, 그 시간 동안은 개수가 조금 어긋날 수 있다.
+    """
+    KEY_PREFIX = "movie:count"
+
+    def __init__(self, cache_alias=None):
+        self._cache_alias = cache_alias or getattr(settings, 'MOVIE_SEARCH_COUNT_CACHE_ALIAS', 'movie_search_count')
+
+    @property
+    def _cache(self):
+        return caches[self._cache_alias]
+
+    def _key(self, criteria_key):
+        digest = hashlib.sha1(
+            json.dumps(criteria_key, sort_keys=True, ensure_ascii=False, default=str).encode('utf-8')
+        ).hexdigest()
+        return f"{self.KEY_PREFIX}:{digest}"
+
+    def get(self, criteria_key):
+        """(개수, 정확 여부) 튜플 또는 None을 반환한다."""
+        return self._cache.get(self._key(criteria_key))
+
+    def set(self, criteria_key, total_results, is_exact):
+        self._cache.set(self._key(criteria_key), (total_results, is_exact))
@@ -0,0 +1,48 @@
+import logging
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+from src.apps.movie.application.ports.caches import MovieDetailCache
+
+logger = logging.getLogger(__name__)
+
+
+class DjangoMovieDetailCache(MovieDetailCache):
+    """
+    영화 상세 DTO를 Django 캐시 프레임워크에 저장하는 read-through 캐시.
+    TTL과 최대 항목 수는 settings.CACHES의 해당 alias 설정(TIMEOUT, MAX_ENTRIES)을 따른다.
+    """
+    KEY_PREFIX = "movie:detail"
+
+    def __init__(self, cache_alias=None):
+        self._cache_alias = cache_alias or getattr(settings, 'MOVIE_DETAIL_CACHE_ALIAS', 'movie_detail')
+
+    @property
+    def _cache(self):
+        return caches[self._cache_alias]
+
+    def _key(self, movie_id):
+        return f"{self.KEY_PREFIX}:{movie_id}"
+
+    def get(self, movie_id):
+        return self._cache.get(self._key(movie_id))
+
+    def set(self, movie_id, movie_detail_dto):
+        self._cache.set(self._key(movie_id), movie_detail_dto)
+
+    def get_many(self, movie_ids):
+        keys_by_id = {movie_id: self._key(movie_id) for movie_id in movie_ids}
+        found = self._cache.get_many(keys_by_id.values())
+        return {movie_id: found[key] for movie_id, key in keys_by_id.items() if key in found}
+
+    def set_many(self, movie_detail_dtos_by_id):
+        self._cache.set_many({self._key(movie_id): dto for movie_id, dto in movie_detail_dtos_by_id.items()})
+
+    def invalidate(self, movie_id):
+        key = self._key(movie_id)
+        self._cache.delete(key)
+        # 커밋 전에 다른 요청이 이전 데이터로 캐시를 다시 채웠을 수 있으므로 커밋 후 한 번 더 지운다.
+        transaction.on_commit(lambda: self._cache.delete(key))
+        logger.debug(f"영화 상세 캐시를 무효화했습니다. movie_id: {movie_id}")
@@ -0,0 +1,103 @@
+import csv
+import datetime
+import json
+
+from src.apps.movie.domain.aggregates.movie import Movie
+from src.apps.movie.domain.value_objects.actor_vo import ActorVO
+from src.apps.movie.domain.value_objects.director_vo import DirectorVO
+from src.apps.movie.domain.value_objects.genre_vo import GenreVO
+from src.apps.movie.domain.value_objects.plot_vo import PlotVO
+from src.apps.movie.domain.value_objects.poster_image_vo import PosterImageVO
+from src.apps.movie.domain.value_objects.release_date_vo import ReleaseDateVO
+from src.apps.movie.domain.value_objects.runtime_vo import RuntimeVO
+from src.apps.movie.domain.value_objects.title_info_vo import TitleInfoVO
+
+# 이 모듈은 프로세스 풀 워커에서 실행되므로 Django(ORM, settings)에 의존하지 않는다.
+
+CSV_LIST_SEPARATOR = '|'
+CSV_ROLE_SEPARATOR = ':'
+
+
+def read_jsonl_records(lines):
+    """(줄 번호, dict | 오류 메시지) 를 순서대로 내보낸다. 빈 줄은 건너뛴다."""
+    for line_no, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield line_no, f"JSON 형식 오류: {e}"
+            continue
+        yield line_no, record if isinstance(record, dict) else "각 줄은 JSON 객체여야 합니다."
+
+
+def read_csv_records(lines):
+    """
+    CSV 헤더는 JSONL 필드명과 같다. genres/directors/cast는 '|'로 구분하며, 출연진은 '이름:배역' 형식이다.
+    줄 번호는 헤더를 1번으로 센 파일상의 줄 번호다.
+    """
+    reader = csv.DictReader(lines)
+    for row in reader:
+        record = {key: value for key, value in row.items() if value not in (None, '')}
+        for field in ('genres', 'directors', 'cast'):
+            if field in record:
+                record[field] = [item.strip() for item in record[field].split(CSV_LIST_SEPARATOR) if item.strip()]
+        if 'cast' in record:
+            record['cast'] = [
+                dict(zip(('name', 'role_name'), (part.strip() for part in item.split(CSV_ROLE_SEPARATOR, 1))))
+                for item in record['cast']
+            ]
+        yield reader.line_num, record
+
+
+def _person(item, key_fields):
+    if isinstance(item, str):
+        return {'name': item}
+    if isinstance(item, dict):
+        return {key: item.get(key) for key in key_fields if item.get(key) is not None}
+    raise TypeError("인물은 이름 문자열 또는 객체여야 합니다.")
+
+
+def movie_from_record(record):
+    """카탈로그 레코드(dict)를 Movie 애그리거트로 변환한다. 유효하지 않으면 ValueError/TypeError가 발생한다."""
+    movie_id = record.get('movie_id')
+    if isinstance(movie_id, str) and movie_id.isdigit():
+        movie_id = int(movie_id)
+
+    release_date = record.get('release_date')
+    runtime_minutes = record.get('runtime_minutes')
+    if isinstance(runtime_minutes, str):
+        runtime_minutes = int(runtime_minutes)
+    poster_image_url = record.get('poster_image_url')
+
+    return Movie(
+        movie_id=movie_id,
+        title_info=TitleInfoVO(korean_title=record.get('korean_title'), original_title=record.get('original_title')),
+        plot=PlotVO(text=record.get('plot')),
+        release_date=ReleaseDateVO(release_date=datetime.date.fromisoformat(release_date)) if release_date else None,
+        runtime=RuntimeVO(minutes=runtime_minutes) if runtime_minutes is not None else None,
+        poster_image=PosterImageVO(url=poster_image_url) if poster_image_url else None,
+        genres=[GenreVO(name=name) for name in record.get('genres', [])],
+        directors=[DirectorVO(**_person(item, ('name', 'external_id'))) for item in record.get('directors', [])],
+        cast=[ActorVO(**_person(item, ('name', 'role_name', 'external_id'))) for item in record.get('cast', [])],
+        still_cuts=[],
+        trailers=[],
+        platform_ratings=[],
+        ott_availability=[],
+    )
+
+
+def validate_chunk(chunk):
+    """
+    프로세스 풀 작업 단위. [(줄 번호, 레코드 | 오류 메시지)] -> [(줄 번호, Movie | None, 오류 메시지 | None)]
+    """
+    results = []
+    for line_no, record in chunk:
+        if isinstance(record, str):
+            results.append((line_no, None, record))
+            continue
+        try:
+            results.append((line_no, movie_from_record(record), None))
+        except (ValueError, TypeError) as e:
+            results.append((line_no, None, str(e)))
+    return results
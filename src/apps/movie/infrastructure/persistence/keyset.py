@@ -0,0 +1,131 @@
+import base64
+import binascii
+import datetime
+import json
+import operator
+import uuid
+from functools import reduce
+
+from django.db.models import F, Q
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+def _encode_value(value):
+    if isinstance(value, datetime.datetime):
+        return {'dt': value.isoformat()}
+    if isinstance(value, datetime.date):
+        return {'d': value.isoformat()}
+    if isinstance(value, uuid.UUID):
+        return {'u': str(value)}
+    return value
+
+
+def _decode_value(value):
+    if isinstance(value, dict):
+        if 'dt' in value:
+            return datetime.datetime.fromisoformat(value['dt'])
+        if 'd' in value:
+            return datetime.date.fromisoformat(value['d'])
+        if 'u' in value:
+            return uuid.UUID(value['u'])
+        raise InvalidCursorError("유효하지 않은 커서입니다.")
+    return value
+
+
+class KeysetField:
+    def __init__(self, name, descending=False, nullable=False):
+        self.name = name
+        self.descending = descending
+        self.nullable = nullable
+
+    def order_expression(self):
+        expression = F(self.name)
+        # DB마다 NULL 정렬 위치가 다르므로, nullable 필드는 방향과 무관하게 항상 마지막에 둔다.
+        nulls_last = True if self.nullable else None
+        return expression.desc(nulls_last=nulls_last) if self.descending else expression.asc(nulls_last=nulls_last)
+
+    def after(self, value):
+        if value is None:
+            return None  # NULL은 마지막이므로 이 필드에서 더 뒤에 오는 값은 없다.
+        lookup = 'lt' if self.descending else 'gt'
+        condition = Q(**{f'{self.name}__{lookup}': value})
+        if self.nullable:
+            condition |= Q(**{f'{self.name}__isnull': True})
+        return condition
+
+    def equal(self, value):
+        if value is None:
+            return Q(**{f'{self.name}__isnull': True})
+        return Q(**{self.name: value})
+
+
+class KeysetOrdering:
+    """
+    정렬 튜플(마지막은 반드시 유일한 필드)을 기준으로 한 keyset 페이지네이션.
+    커서는 마지막 행의 정렬 값과 정렬 시그니처를 담은 불투명한 base64 문자열이며,
+    다른 정렬로 만든 커서는 거부한다.
+    """
+
+    def __init__(self, *fields):
+        self.fields = fields
+        self.signature = ','.join(f"{field.name}:{'d' if field.descending else 'a'}" for field in fields)
+
+    def apply(self, queryset):
+        return queryset.order_by(*(field.order_expression() for field in self.fields))
+
+    def encode_cursor(self, instance):
+        payload = {
+            'k': self.signature,
+            'v': [_encode_value(getattr(instance, field.name)) for field in self.fields],
+        }
+        raw = json.dumps(payload, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+        return base64.urlsafe_b64encode(raw).rstrip(b'=').decode('ascii')
+
+    def decode_cursor(self, cursor):
+        try:
+            raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+            payload = json.loads(raw)
+            values = [_decode_value(value) for value in payload['v']]
+        except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError, TypeError, KeyError, ValueError):
+            raise InvalidCursorError("유효하지 않은 커서입니다.")
+        if payload.get('k') != self.signature or len(values) != len(self.fields):
+            raise InvalidCursorError("현재 정렬 조건과 맞지 않는 커서입니다.")
+        return values
+
+    def filter_after(self, queryset, cursor):
+        values = self.decode_cursor(cursor)
+        conditions = []
+        equal_prefix = Q()
+        for field, value in zip(self.fields, values):
+            after = field.after(value)
+            if after is not None:
+                conditions.append(equal_prefix & after)
+            equal_prefix &= field.equal(value)
+        if not conditions:
+            return queryset.none()
+        return queryset.filter(reduce(operator.or_, conditions))
+
+
+class ChainedKeysetOrdering:
+    """
+    여러 queryset을 차례로 이어 붙인 목록(예: 평점 있는 영화 → 평점 없는 영화)의 keyset 커서.
+    커서에는 마지막 행이 속한 부분의 번호와 그 부분의 KeysetOrdering 커서가 함께 들어간다.
+    """
+
+    def __init__(self, *orderings):
+        self.orderings = orderings
+
+    def encode_cursor(self, part_index, instance):
+        return f"{part_index}.{self.orderings[part_index].encode_cursor(instance)}"
+
+    def decode_cursor(self, cursor):
+        """(부분 번호, 그 부분의 커서)를 반환한다."""
+        part, _, inner_cursor = cursor.partition('.')
+        if not part.isdigit() or int(part) >= len(self.orderings) or not inner_cursor:
+            raise InvalidCursorError("유효하지 않은 커서입니다.")
+        part_index = int(part)
+        self.orderings[part_index].decode_cursor(inner_cursor)  # 정렬 시그니처 검증
+        return part_index, inner_cursor
@@ -0,0 +1,31 @@
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.db import connection
+
+
+class UnexpectedQueryError(RuntimeError):
+    pass
+
+
+@contextmanager
+def forbid_queries(label):
+    """
+    블록 안에서 SQL이 실행되면 UnexpectedQueryError를 발생시킨다.
+    애그리거트 매퍼가 prefetch된 데이터만 사용하는지 검증할 때 사용한다.
+    """
+    def _blocker(execute, sql, params, many, context):
+        raise UnexpectedQueryError(f"{label} 실행 중 예상하지 못한 SQL이 발생했습니다: {sql}")
+
+    with connection.execute_wrapper(_blocker):
+        yield
+
+
+@contextmanager
+def strict_mapping_guard(label):
+    """settings.MOVIE_STRICT_AGGREGATE_MAPPING이 켜져 있을 때만 forbid_queries를 적용한다."""
+    if getattr(settings, 'MOVIE_STRICT_AGGREGATE_MAPPING', False):
+        with forbid_queries(label):
+            yield
+    else:
+        yield
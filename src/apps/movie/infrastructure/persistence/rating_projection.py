@@ -0,0 +1,38 @@
+import logging
+
+from src.apps.movie.models import MoviePlatformRatingModel, MovieRatingProjectionModel, MovieModel
+
+logger = logging.getLogger(__name__)
+
+
+class MovieRatingProjection:
+    """
+    MoviePlatformRatingModel을 평점 정렬용 MovieRatingProjectionModel로 복제한다.
+    평점이 바뀌는 경로(영화 저장, 관리자 화면)에서 sync를 호출하고, 어긋난 경우 rebuild로 다시 만든다.
+    """
+
+    def _build_rows(self, movie_ids):
+        ratings = MoviePlatformRatingModel.objects.filter(movie_id__in=movie_ids).values_list(
+            'movie_id', 'platform_name', 'score', 'movie__created_at')
+        return [
+            MovieRatingProjectionModel(
+                movie_id=movie_id, platform_name=platform_name, score=score, movie_created_at=movie_created_at
+            )
+            for movie_id, platform_name, score, movie_created_at in ratings
+        ]
+
+    def sync(self, movie_ids):
+        movie_ids = list(movie_ids)
+        if not movie_ids:
+            return
+        MovieRatingProjectionModel.objects.filter(movie_id__in=movie_ids).delete()
+        MovieRatingProjectionModel.objects.bulk_create(self._build_rows(movie_ids), batch_size=1000)
+
+    def rebuild(self, batch_size=500):
+        MovieRatingProjectionModel.objects.all().delete()
+        movie_ids = list(MovieModel.objects.order_by('id').values_list('id', flat=True))
+        for start in range(0, len(movie_ids), batch_size):
+            self.sync(movie_ids[start:start + batch_size])
+        indexed_count = MovieRatingProjectionModel.objects.count()
+        logger.info(f"평점 정렬 프로젝션을 다시 만들었습니다. 평점 수: {indexed_count}")
+        return indexed_count
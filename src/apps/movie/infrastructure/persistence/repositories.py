@@ -1,13 +1,15 @@
 import logging
 
+from django.conf import settings
 from django.core.exceptions import ObjectDoesNotExist
 from django.db import transaction
-from django.db.models import Q, Avg, Subquery, OuterRef, FloatField, Value
-from django.db.models.functions import Coalesce
-import datetime
+from django.db.models import Exists, OuterRef, Q, Prefetch
+from django.utils import timezone
 
-from src.apps.movie.domain.aggregates.movie import Movie
+from src.apps.movie.domain.aggregates.movie import Movie, MoviePart
 
+from src.apps.movie.application.ports.autocomplete import MovieAutocompleteIndex
+from src.apps.movie.application.ports.caches import MovieDetailCache
 from src.apps.movie.application.ports.repositories import MovieRepository, MovieSearchRepository
 from src.apps.movie.application.dtos import MovieSearchResultDto, SearchedMovieItemDto
 from src.apps.movie.domain.value_objects.actor_vo import ActorVO
@@ -22,16 +24,45 @@ from src.apps.movie.domain.value_objects.runtime_vo import RuntimeVO
 from src.apps.movie.domain.value_objects.still_cut_vo import StillCutVO
 from src.apps.movie.domain.value_objects.title_info_vo import TitleInfoVO
 from src.apps.movie.domain.value_objects.trailer_vo import TrailerVO
-from src.apps.movie.models import MovieModel, GenreModel, PersonModel, MovieCastMemberModel, MoviePlatformRatingModel
+from src.apps.movie.infrastructure.persistence.keyset import ChainedKeysetOrdering, KeysetField, KeysetOrdering
+from src.apps.movie.infrastructure.persistence.query_guard import strict_mapping_guard
+from src.apps.movie.infrastructure.search.fulltext import SqliteMovieFullTextIndex
+from src.apps.movie.infrastructure.search.ngram_index import KoreanNgramIndex
+from src.apps.movie.models import MovieModel, GenreModel, PersonModel, MovieCastMemberModel, MoviePlatformRatingModel, \
+    MovieOTTAvailabilityModel, MovieRankingModel, MovieRankingListType, MovieRatingProjectionModel
 
 logger = logging.getLogger(__name__)
 
 
 class DjangoMovieRepository(MovieRepository):
+    def __init__(self, detail_cache: MovieDetailCache = None, full_text_index=None, korean_index=None,
+                 autocomplete_index: MovieAutocompleteIndex = None):
+        self.detail_cache = detail_cache
+        self.full_text_index = full_text_index or SqliteMovieFullTextIndex()
+        self.korean_index = korean_index or KoreanNgramIndex()
+        self.autocomplete_index = autocomplete_index
+
+    def _invalidate_detail_cache(self, movie_id):
+        if self.detail_cache:
+            self.detail_cache.invalidate(movie_id)
+
+    def _with_relations(self, queryset):
+        # 매퍼(_to_domain_object)는 여기서 prefetch한 데이터만 사용해야 한다. (영화 1건당 쿼리 8개로 고정)
+        return queryset.prefetch_related(
+            'genres', 'directors',
+            Prefetch('cast_members', queryset=MovieCastMemberModel.objects.select_related('actor').order_by('display_order', 'id')),
+            'still_cuts', 'trailers', 'platform_ratings',
+            Prefetch('ott_availability', queryset=MovieOTTAvailabilityModel.objects.select_related('platform')),
+        )
+
     def _to_domain_object(self, movie_model):
         if not movie_model:
             return None
 
+        with strict_mapping_guard(f"Movie 매핑(id={movie_model.id})"):
+            return self._map_to_aggregate(movie_model)
+
+    def _map_to_aggregate(self, movie_model):
         title_info_vo = TitleInfoVO(korean_title=movie_model.korean_title, original_title=movie_model.original_title)
         plot_vo = PlotVO(text=movie_model.plot)
         release_date_vo = ReleaseDateVO(release_date=movie_model.release_date) if movie_model.release_date else None
@@ -40,32 +71,26 @@ class DjangoMovieRepository(MovieRepository):
 
         genres_vo = [GenreVO(name=g.name) for g in movie_model.genres.all()]
         directors_vo = [DirectorVO(name=d.name, external_id=d.external_id) for d in movie_model.directors.all()]
-
-        cast_vo = []
-        if hasattr(movie_model, 'cast_members'):
-            for cast_member in movie_model.cast_members.select_related('actor').all():
-                cast_vo.append(ActorVO(name=cast_member.actor.name, role_name=cast_member.role_name,
-                                       external_id=cast_member.actor.external_id))
-
+        cast_vo = [
+            ActorVO(name=cm.actor.name, role_name=cm.role_name, external_id=cm.actor.external_id)
+            for cm in movie_model.cast_members.all()
+        ]
         still_cuts_vo = [StillCutVO(image_url=sc.image_url, caption=sc.caption, display_order=sc.display_order) for sc
                          in movie_model.still_cuts.all()]
         trailers_vo = [
             TrailerVO(url=t.url, trailer_type=t.trailer_type, site_name=t.site_name, thumbnail_url=t.thumbnail_url) for
             t in movie_model.trailers.all()]
+        platform_ratings_vo = [
+            MoviePlatformRatingVO(platform_name=r.platform_name, score=r.score)
+            for r in movie_model.platform_ratings.all()
+        ]
+        ott_availability_vo = [
+            OTTInfoVO(platform_name=o.platform.name, watch_url=o.watch_url,
+                      logo_image_url=o.platform.logo_image_url, availability_note=o.availability_note)
+            for o in movie_model.ott_availability.all()
+        ]
 
-        platform_ratings_vo = []
-        if hasattr(movie_model, 'platform_ratings'):
-            for r in movie_model.platform_ratings.all():
-                platform_ratings_vo.append(MoviePlatformRatingVO(platform_name=r.platform_name, score=r.score))
-
-        ott_availability_vo = []
-        if hasattr(movie_model, 'ott_availability'):
-            for o in movie_model.ott_availability.select_related('platform').all():
-                ott_availability_vo.append(OTTInfoVO(platform_name=o.platform.name, watch_url=o.watch_url,
-                                                     logo_image_url=o.platform.logo_image_url,
-                                                     availability_note=o.availability_note))
-
-        return Movie(
+        movie = Movie(
             movie_id=movie_model.id,
             title_info=title_info_vo,
             plot=plot_vo,
@@ -82,60 +107,236 @@ class DjangoMovieRepository(MovieRepository):
             created_at=movie_model.created_at,
             updated_at=movie_model.updated_at
         )
+        movie.mark_clean()
+        return movie
 
     def find_by_id(self, movie_id):
         try:
-            movie_model = MovieModel.objects.prefetch_related(
-                'genres', 'directors', 'cast_members__actor',
-                'still_cuts', 'trailers', 'platform_ratings',
-                'ott_availability__platform'
-            ).get(id=movie_id)
+            movie_model = self._with_relations(MovieModel.objects.all()).get(id=movie_id)
             logger.info(f"DB에 MovieModel찾음: {movie_id}")
             return self._to_domain_object(movie_model)
         except ObjectDoesNotExist:
             logger.warning(f"MovieModel not found in DB for id: {movie_id}")
             return None
 
-    @transaction.atomic
-    def save(self, movie: Movie):
-        logger.info(f"데이터 베이스에 영화 저장 중, Movie ID: {movie.movie_id}, Title: {movie.title_info.korean_title}")
-        defaults = {
+    def find_by_ids(self, movie_ids):
+        # 자식 관계는 id 집합 전체에 대해 한 번씩만 prefetch되므로 영화 수와 관계없이 쿼리 수가 고정된다.
+        movie_models = self._with_relations(MovieModel.objects.filter(id__in=movie_ids))
+        movies_by_id = {movie_model.id: self._to_domain_object(movie_model) for movie_model in movie_models}
+        logger.info(f"DB에서 MovieModel {len(movies_by_id)}/{len(movie_ids)}건을 찾음")
+        return [movies_by_id[movie_id] for movie_id in movie_ids if movie_id in movies_by_id]
+
+    @staticmethod
+    def _movie_row(movie):
+        return {
             'korean_title': movie.title_info.korean_title,
             'original_title': movie.title_info.original_title,
             'plot': movie.plot.text if movie.plot else None,
             'release_date': movie.release_date.release_date if movie.release_date else None,
             'runtime_minutes': movie.runtime.minutes if movie.runtime else None,
             'poster_image_url': movie.poster_image.url if movie.poster_image else None,
-            'updated_at': movie.updated_at if movie.updated_at else datetime.datetime.now(),
+            'updated_at': movie.updated_at if movie.updated_at else timezone.now(),
         }
 
-        if movie.movie_id and movie.movie_id > 0:
-            movie_model, created = MovieModel.objects.update_or_create(id=movie.movie_id, defaults=defaults)
-        else:
-            if movie.created_at:
-                defaults['created_at'] = movie.created_at
-            movie_model = MovieModel.objects.create(**defaults)
-            created = True
-
-        logger.info(f"영화가 저장되었습니다. ID: {movie_model.id}, Created: {created}")
-
-        genre_instances = [GenreModel.objects.get_or_create(name=g.name)[0] for g in movie.genres]
-        movie_model.genres.set(genre_instances)
+    def save(self, movie: Movie):
+        """
+        애그리거트가 기록한 변경 부분(Movie.changed_parts)만 저장한다. 변경이 없으면 쿼리를 실행하지 않는다.
+        저장 후에는 다시 조회하지 않고, 같은 애그리거트를 clean 상태로 표시해 반환한다.
+        """
+        changed = movie.changed_parts
+        if not changed:
+            logger.info(f"변경 사항이 없어 저장을 생략합니다. Movie ID: {movie.movie_id}")
+            return movie
+        # 변경이 없을 때 SAVEPOINT도 만들지 않도록 트랜잭션은 변경 확인 뒤에 연다.
+        with transaction.atomic():
+            logger.info(f"데이터 베이스에 영화 저장 중, Movie ID: {movie.movie_id}, Title: {movie.title_info.korean_title}, "
+                        f"변경: {sorted(changed)}")
+            movie_id = movie.movie_id
+            movie_model = MovieModel(id=movie_id)
+
+            if movie.is_persisted:
+                # 상세 정보가 바뀌지 않았어도 변경 시각은 기록한다. 갱신된 행이 없으면 그 사이에 삭제된 영화다.
+                row = self._movie_row(movie) if MoviePart.DETAILS in changed else {'updated_at': movie.updated_at}
+                if MovieModel.objects.filter(id=movie_id).update(**row) == 0:
+                    raise ValueError(f"ID {movie_id}를 가진 영화가 존재하지 않아 업데이트할 수 없습니다.")
+                logger.info(f"영화가 저장되었습니다. ID: {movie_id}, Created: False")
+            elif MoviePart.DETAILS in changed:
+                movie_model, created = MovieModel.objects.update_or_create(id=movie_id, defaults=self._movie_row(movie))
+                logger.info(f"영화가 저장되었습니다. ID: {movie_id}, Created: {created}")
+
+            if MoviePart.GENRES in changed:
+                genre_ids = self._resolve_genre_ids([g.name for g in movie.genres])
+                movie_model.genres.set(genre_ids.values())
+
+            created_people = []
+            if changed & {MoviePart.DIRECTORS, MoviePart.CAST}:
+                people = []
+                if MoviePart.DIRECTORS in changed:
+                    people += [(d.name, d.external_id) for d in movie.directors]
+                if MoviePart.CAST in changed:
+                    people += [(a.name, a.external_id) for a in movie.cast]
+                person_ids, created_people = self._resolve_person_ids(people)
+                if MoviePart.DIRECTORS in changed:
+                    movie_model.directors.set([person_ids[d.name] for d in movie.directors])
+                if MoviePart.CAST in changed:
+                    self._sync_cast_members(movie_id, [(person_ids[a.name], a.role_name) for a in movie.cast])
+
+            # FTS 문서에는 제목, 감독, 출연진 이름이 들어 있고, 한글 색인/자동완성은 제목만 사용한다.
+            if changed & {MoviePart.DETAILS, MoviePart.DIRECTORS, MoviePart.CAST}:
+                self.full_text_index.sync([movie_id])
+            if MoviePart.DETAILS in changed:
+                self.korean_index.index_movies([movie_id])
+            self.korean_index.index_people([person_id for person_id, _ in created_people])
+            self._invalidate_detail_cache(movie_id)
+            if self.autocomplete_index and (MoviePart.DETAILS in changed or created_people):
+                movie_titles = [(movie_id, movie.title_info.korean_title)] if MoviePart.DETAILS in changed else []
+                transaction.on_commit(lambda: self._refresh_autocomplete(movie_titles, created_people))
+
+        movie.mark_clean()
+        return movie
 
-        director_instances = [PersonModel.objects.get_or_create(name=d.name, defaults={'external_id': d.external_id})[0] for d in movie.directors]
-        movie_model.directors.set(director_instances)
+    @transaction.atomic
+    def save_many(self, movies):
+        """
+        여러 애그리거트를 한 트랜잭션에서 집합 단위로 저장하고 저장한 영화 id 목록을 반환한다. (대량 적재용)
+        영화 행은 bulk_create/bulk_update, 장르/감독/출연진은 대상 영화 전체에 대해 한 번에 교체하므로
+        쿼리 수가 영화 수와 무관하다. 같은 id가 여러 번 오면 마지막 애그리거트가 저장된다.
+        """
+        movies = list({movie.movie_id: movie for movie in movies}.values())
+        if not movies:
+            return []
+        movie_ids = [movie.movie_id for movie in movies]
+        logger.info(f"데이터 베이스에 영화 {len(movies)}건을 일괄 저장 중")
+
+        existing_ids = set(MovieModel.objects.filter(id__in=movie_ids).values_list('id', flat=True))
+        movie_models = [MovieModel(id=movie.movie_id, **self._movie_row(movie)) for movie in movies]
+        MovieModel.objects.bulk_create([m for m in movie_models if m.id not in existing_ids], batch_size=500)
+        MovieModel.objects.bulk_update(
+            [m for m in movie_models if m.id in existing_ids],
+            fields=list(self._movie_row(movies[0]).keys()), batch_size=500
+        )
 
-        MovieCastMemberModel.objects.filter(movie_id=movie_model.id).delete()
-        for actor_vo in movie.cast:
-            actor_instance = PersonModel.objects.get_or_create(name=actor_vo.name, defaults={'external_id': actor_vo.external_id})[0]
-            MovieCastMemberModel.objects.create(movie_id=movie_model.id, actor=actor_instance)
+        genre_ids = self._resolve_genre_ids([g.name for movie in movies for g in movie.genres])
+        person_ids, created_people = self._resolve_person_ids([
+            (person.name, person.external_id) for movie in movies for person in [*movie.directors, *movie.cast]
+        ])
+
+        genre_through = MovieModel.genres.through
+        genre_through.objects.filter(moviemodel_id__in=movie_ids).delete()
+        genre_through.objects.bulk_create([
+            genre_through(moviemodel_id=movie.movie_id, genremodel_id=genre_id)
+            for movie in movies
+            for genre_id in dict.fromkeys(genre_ids[g.name] for g in movie.genres)
+        ], batch_size=1000)
+
+        director_through = MovieModel.directors.through
+        director_through.objects.filter(moviemodel_id__in=movie_ids).delete()
+        director_through.objects.bulk_create([
+            director_through(moviemodel_id=movie.movie_id, personmodel_id=person_id)
+            for movie in movies
+            for person_id in dict.fromkeys(person_ids[d.name] for d in movie.directors)
+        ], batch_size=1000)
+
+        MovieCastMemberModel.objects.filter(movie_id__in=movie_ids).delete()
+        MovieCastMemberModel.objects.bulk_create([
+            MovieCastMemberModel(movie_id=movie.movie_id, actor_id=actor_id, role_name=role_name, display_order=order)
+            for movie in movies
+            for order, (actor_id, role_name) in enumerate(dict.fromkeys((person_ids[a.name], a.role_name) for a in movie.cast))
+        ], batch_size=1000)
+
+        self.full_text_index.sync(movie_ids)
+        self.korean_index.index_movies(movie_ids)
+        self.korean_index.index_people([person_id for person_id, _ in created_people])
+        for movie_id in movie_ids:
+            self._invalidate_detail_cache(movie_id)
+        for movie in movies:
+            movie.mark_clean()
+        if self.autocomplete_index:
+            movie_titles = [(movie.movie_id, movie.title_info.korean_title) for movie in movies]
+            transaction.on_commit(lambda: self._refresh_autocomplete(movie_titles, created_people))
+        return movie_ids
+
+    def _refresh_autocomplete(self, movie_titles, created_people):
+        for movie_id, title in movie_titles:
+            self.autocomplete_index.upsert_movie(movie_id, title)
+        for person_id, name in created_people:
+            self.autocomplete_index.upsert_person(person_id, name)
+
+    def _resolve_genre_ids(self, names):
+        """장르 이름 -> id. 기존 장르는 한 번에 조회하고, 없는 장르만 bulk_create한다."""
+        names = list(dict.fromkeys(names))
+        genre_ids = dict(GenreModel.objects.filter(name__in=names).values_list('name', 'id'))
+        missing = [name for name in names if name not in genre_ids]
+        if missing:
+            # 동시에 같은 장르를 만드는 저장이 있을 수 있으므로 충돌은 무시하고 다시 조회한다.
+            GenreModel.objects.bulk_create([GenreModel(name=name) for name in missing], ignore_conflicts=True)
+            genre_ids.update(GenreModel.objects.filter(name__in=missing).values_list('name', 'id'))
+        return genre_ids
+
+    def _resolve_person_ids(self, people):
+        """
+        (이름, 외부 ID) 목록 -> ({이름: id}, 새로 만든 [(id, 이름)]). 이름 기준으로 한 번에 조회하고 없는 인물만 bulk_create한다.
+        """
+        external_ids = {}
+        for name, external_id in people:
+            external_ids.setdefault(name, external_id)
+        person_ids = dict(PersonModel.objects.filter(name__in=external_ids.keys()).values_list('name', 'id'))
+        missing = [name for name in external_ids if name not in person_ids]
+        if not missing:
+            return person_ids, []
+
+        PersonModel.objects.bulk_create(
+            [PersonModel(name=name, external_id=external_ids[name]) for name in missing], ignore_conflicts=True
+        )
+        created = dict(PersonModel.objects.filter(name__in=missing).values_list('name', 'id'))
+        for name in missing:
+            if name not in created:
+                # 외부 ID가 다른 인물과 겹쳐 무시된 경우. 기존 get_or_create와 같은 방식으로 처리(오류 전파)한다.
+                created[name] = PersonModel.objects.get_or_create(
+                    name=name, defaults={'external_id': external_ids[name]})[0].id
+        person_ids.update(created)
+        return person_ids, [(person_id, name) for name, person_id in created.items()]
+
+    def _sync_cast_members(self, movie_id, cast):
+        """
+        출연진 (actor_id, role_name) 목록을 순서대로 반영한다. 기존 행과 (actor_id, role_name)으로 비교해
+        없어진 행만 삭제하고 새 행만 bulk_create하며, 남은 행은 순서(display_order)가 바뀐 것만 갱신한다.
+        """
+        desired = {member: order for order, member in enumerate(dict.fromkeys(cast))}
+        existing, stale_ids = {}, []
+        for row_id, actor_id, role_name, display_order in MovieCastMemberModel.objects.filter(
+                movie_id=movie_id).order_by('display_order', 'id').values_list('id', 'actor_id', 'role_name', 'display_order'):
+            member = (actor_id, role_name)
+            # role_name이 NULL인 행은 유일 제약에 걸리지 않으므로 중복이 있을 수 있다. 하나만 남긴다.
+            if member not in desired or member in existing:
+                stale_ids.append(row_id)
+            else:
+                existing[member] = (row_id, display_order)
 
-        return self._to_domain_object(MovieModel.objects.get(id=movie_model.id))
+        if stale_ids:
+            MovieCastMemberModel.objects.filter(id__in=stale_ids).delete()
+        moved = [
+            MovieCastMemberModel(id=row_id, display_order=desired[member])
+            for member, (row_id, display_order) in existing.items() if display_order != desired[member]
+        ]
+        if moved:
+            MovieCastMemberModel.objects.bulk_update(moved, ['display_order'])
+        added = [member for member in desired if member not in existing]
+        if added:
+            MovieCastMemberModel.objects.bulk_create([
+                MovieCastMemberModel(movie_id=movie_id, actor_id=actor_id, role_name=role_name,
+                                     display_order=desired[(actor_id, role_name)])
+                for actor_id, role_name in added
+            ])
 
     @transaction.atomic
     def delete(self, movie_id):
         logger.warning(f"데이터베이스에서 영화를 삭제합니다. Movie ID: {movie_id}")
         deleted_count, _ = MovieModel.objects.filter(id=movie_id).delete()
+        self.full_text_index.remove([movie_id])
+        self._invalidate_detail_cache(movie_id)
+        if self.autocomplete_index:
+            transaction.on_commit(lambda: self.autocomplete_index.remove_movie(movie_id))
         if deleted_count > 0:
             logger.info(f"성공적으로 영화가 삭제되었습니다. Movie ID: {movie_id}")
         else:
@@ -143,17 +344,38 @@ class DjangoMovieRepository(MovieRepository):
 
 
 class DjangoMovieSearchRepository(MovieSearchRepository):
+    LATEST_LIST_TYPE = 'latest'
+
+    def __init__(self, full_text_index=None, korean_index=None, count_cache=None, ranking_scheduler=None):
+        self.full_text_index = full_text_index or SqliteMovieFullTextIndex()
+        self.korean_index = korean_index or KoreanNgramIndex()
+        self.count_cache = count_cache
+        # 지정하면 순위 목록을 처음 읽을 때 이 프로세스의 순위 갱신 스레드를 띄운다. (MovieRankingScheduler.start)
+        self.ranking_scheduler = ranking_scheduler
+
+    def _filter_by_keyword(self, queryset, keyword):
+        # FTS(단어 접두어)가 일치하는 영화를 찾으면 그 결과만 쓴다. FTS가 답하지 못하는 검색어
+        # (초성, '생충' 같은 단어 중간의 부분 문자열)에만 한글 n-gram 색인을 조회한다.
+        match_query = self.full_text_index.build_match_query(keyword)
+        if match_query and self.full_text_index.is_available():
+            if self.full_text_index.has_matches(match_query):
+                return self.full_text_index.filter_matching(queryset, match_query)
+            return queryset.filter(id__in=self.korean_index.search_movie_ids(keyword))
+
+        return queryset.filter(
+            Q(korean_title__icontains=keyword) |
+            Q(original_title__icontains=keyword) |
+            Q(directors__name__icontains=keyword) |
+            Q(cast_members__actor__name__icontains=keyword) |
+            Q(id__in=self.korean_index.search_movie_ids(keyword))
+        ).distinct()
+
     def search_movies(self, criteria):
         logger.info(f"Executing movie search in database with criteria: {criteria.__dict__}")
-        queryset = MovieModel.objects.all()
+        queryset = MovieModel.objects.select_related('comment_stats')
 
         if criteria.keyword:
-            queryset = queryset.filter(
-                Q(korean_title__icontains=criteria.keyword) |
-                Q(original_title__icontains=criteria.keyword) |
-                Q(directors__name__icontains=criteria.keyword) |
-                Q(cast_members__actor__name__icontains=criteria.keyword)
-            ).distinct()
+            queryset = self._filter_by_keyword(queryset, criteria.keyword)
 
         if criteria.filters:
             if criteria.filters.genres:
@@ -163,75 +385,215 @@ class DjangoMovieSearchRepository(MovieSearchRepository):
             if criteria.filters.release_year_to:
                 queryset = queryset.filter(release_date__year__lte=criteria.filters.release_year_to)
 
-        if criteria.sort_by:
-            sort_direction = "-" if criteria.sort_by.direction == "desc" else ""
-            sort_field = criteria.sort_by.field
-
-            if sort_field == "rating" and criteria.sort_by.rating_platform:
-                platform_score = Subquery(
-                    MoviePlatformRatingModel.objects.filter(
-                        movie=OuterRef('pk'),
-                        platform_name=criteria.sort_by.rating_platform
-                    ).values('score')[:1]
-                )
-                queryset = queryset.annotate(
-                    relevant_score=Coalesce(platform_score, Value(0.0), output_field=FloatField())
-                ).order_by(f'{sort_direction}relevant_score', '-created_at')
-            elif sort_field == "release_date":
-                queryset = queryset.order_by(f'{sort_direction}release_date', '-created_at')
+        count_key = {
+            'list': 'search',
+            'keyword': self._keyword_count_key(criteria.keyword),
+            'genres': sorted(set(criteria.filters.genres)) if criteria.filters and criteria.filters.genres else None,
+            'year_from': criteria.filters.release_year_from if criteria.filters else None,
+            'year_to': criteria.filters.release_year_to if criteria.filters else None,
+        }
+        sort_by = criteria.sort_by
+        if sort_by and sort_by.field == "rating" and sort_by.rating_platform:
+            return self._search_by_rating(queryset, sort_by, criteria.pagination, count_key)
+        queryset, ordering = self._apply_sort(queryset, sort_by)
+        return self._paginate(queryset, ordering, criteria.pagination, count_key, self._to_item_dto)
+
+    @staticmethod
+    def _keyword_count_key(keyword):
+        # 검색(FTS)과 같은 방식으로 공백 단위로 나눈다. 대소문자만 다른 검색어는 결과가 같으므로 casefold로 합친다.
+        # '해리 포터'와 '해리포터'는 결과가 다를 수 있으므로 서로 다른 키가 된다.
+        tokens = keyword.casefold().split() if keyword else []
+        return " ".join(tokens) or None
+
+    def _search_by_rating(self, queryset, sort_by, pagination, count_key):
+        """
+        평점순 정렬. 해당 플랫폼 평점이 있는 영화는 비정규화 테이블을
+        (platform_name, score, movie_created_at, movie) 인덱스 순서 그대로 읽고, 평점이 없는 영화는 그 뒤에
+        등록순(created_at, id 내림차순)으로 이어 붙인다. 인덱스 순서를 쓰도록 동점 기준도 평점과 같은 방향으로 정렬한다.
+        """
+        descending = sort_by.direction == "desc"
+        platform_ratings = MovieRatingProjectionModel.objects.filter(platform_name=sort_by.rating_platform)
+        rated = platform_ratings.select_related('movie', 'movie__comment_stats')
+        if queryset.query.where:
+            # 키워드/필터가 있으면 조건에 맞는 영화로 좁힌다.
+            rated = rated.filter(movie_id__in=queryset.order_by().values('id'))
+        unrated = queryset.filter(~Exists(platform_ratings.filter(movie=OuterRef('pk'))))
+
+        parts = [
+            (rated,
+             KeysetOrdering(KeysetField('score', descending=descending),
+                            KeysetField('movie_created_at', descending=descending),
+                            KeysetField('movie_id', descending=descending)),
+             lambda rating: self._to_item_dto(rating.movie, round(rating.score, 1))),
+            (unrated,
+             KeysetOrdering(KeysetField('created_at', descending=True), KeysetField('id', descending=True)),
+             lambda movie: self._to_item_dto(movie, 0.0)),
+        ]
+        return self._paginate_parts(parts, queryset, pagination, count_key)
+
+    def _apply_sort(self, queryset, sort_by):
+        tie_breakers = (KeysetField('created_at', descending=True), KeysetField('id', descending=True))
+        if sort_by:
+            descending = sort_by.direction == "desc"
+            sort_field = sort_by.field
+
+            if sort_field == "release_date":
+                primary = KeysetField('release_date', descending=descending, nullable=True)
             else:
-                queryset = queryset.order_by(f'{sort_direction}korean_title', '-created_at')
+                primary = KeysetField('korean_title', descending=descending)
+            return queryset, KeysetOrdering(primary, *tie_breakers)
+        if 'search_rank' in queryset.query.annotations:
+            return queryset, KeysetOrdering(KeysetField('search_rank'), *tie_breakers)
+        return queryset, KeysetOrdering(*tie_breakers)
+
+    def _count(self, queryset, count_mode, count_key):
+        """
+        (전체 개수, 정확 여부)를 반환한다. estimated 모드는 상한+1개까지만 세고, 넘으면 상한값을 부정확한 개수로 돌려준다.
+        정확한 개수가 캐시에 있으면 estimated 요청에도 그 값을 쓴다.
+        """
+        exact_key = {**count_key, 'mode': 'exact'}
+        estimated_key = {**count_key, 'mode': 'estimated'}
+        if self.count_cache:
+            cached = self.count_cache.get(exact_key)
+            if cached is None and count_mode == 'estimated':
+                cached = self.count_cache.get(estimated_key)
+            if cached is not None:
+                return cached
+
+        if count_mode == 'estimated':
+            cap = getattr(settings, 'MOVIE_SEARCH_COUNT_ESTIMATE_CAP', 1000)
+            counted = queryset[:cap + 1].count()
+            total_results, is_exact = (cap, False) if counted > cap else (counted, True)
         else:
-            queryset = queryset.order_by('-created_at')
-
-        total_results = queryset.count()
-        start = (criteria.pagination.page_number - 1) * criteria.pagination.page_size
-        end = start + criteria.pagination.page_size
-        paginated_qs = queryset[start:end]
-
-        movies_dto_list = [
-            SearchedMovieItemDto(
-                movie_id=movie.id,
-                title=movie.korean_title,
-                poster_image_url=movie.poster_image_url,
-                release_year=movie.release_date.year if movie.release_date else None,
-                rating=round(getattr(movie, 'relevant_score', 0.0), 1)
-            ) for movie in paginated_qs
-        ]
+            total_results, is_exact = queryset.count(), True
+
+        if self.count_cache:
+            self.count_cache.set(exact_key if is_exact else estimated_key, total_results, is_exact)
+        return total_results, is_exact
+
+    @staticmethod
+    def _to_item_dto(movie, rating=None):
+        # 댓글 통계는 select_related로 함께 읽으며, 댓글이 한 번도 없던 영화는 통계 행이 없다.
+        try:
+            comment_stats = movie.comment_stats
+        except ObjectDoesNotExist:
+            comment_stats = None
+        return SearchedMovieItemDto(
+            movie_id=movie.id,
+            title=movie.korean_title,
+            poster_image_url=movie.poster_image_url,
+            release_year=movie.release_date.year if movie.release_date else None,
+            rating=rating,
+            comment_count=comment_stats.comment_count if comment_stats else 0,
+            last_comment_at=comment_stats.last_comment_at if comment_stats else None
+        )
 
-        total_pages = (total_results + criteria.pagination.page_size - 1) // criteria.pagination.page_size
+    def _paginate(self, queryset, ordering, pagination, count_key, to_item_dto):
+        """
+        page_number(OFFSET) 모드와 cursor(keyset) 모드를 모두 지원한다.
+        한 행을 더 읽어 다음 페이지 존재 여부를 판단하고, 있으면 두 모드 모두 next_cursor를 돌려준다.
+        page_number 모드에서 마지막 페이지를 읽었다면 전체 개수가 확정되므로 COUNT 쿼리를 생략한다.
+        """
+        page_size = pagination.page_size
+        ordered_queryset = ordering.apply(queryset)
+        if pagination.cursor:
+            start = None
+            rows = list(ordering.filter_after(ordered_queryset, pagination.cursor)[:page_size + 1])
+        else:
+            start = (pagination.page_number - 1) * page_size
+            rows = list(ordered_queryset[start:start + page_size + 1])
+
+        has_next = len(rows) > page_size
+        rows = rows[:page_size]
+        next_cursor = ordering.encode_cursor(rows[-1]) if has_next else None
+        return self._to_result(queryset, pagination, count_key, start, [to_item_dto(row) for row in rows], next_cursor)
+
+    def _paginate_parts(self, parts, count_queryset, pagination, count_key):
+        """
+        (queryset, KeysetOrdering, to_item_dto) 부분들을 차례로 이어 붙인 목록을 _paginate와 같은 방식으로 나눈다.
+        page_number 모드에서 페이지가 앞 부분을 완전히 지나서 시작할 때만 앞 부분의 개수를 센다.
+        """
+        page_size = pagination.page_size
+        chain = ChainedKeysetOrdering(*(ordering for _, ordering, _ in parts))
+        if pagination.cursor:
+            start, offset = None, 0
+            first_part, inner_cursor = chain.decode_cursor(pagination.cursor)
+        else:
+            start = offset = (pagination.page_number - 1) * page_size
+            first_part, inner_cursor = 0, None
+
+        rows = []
+        for part_index in range(first_part, len(parts)):
+            queryset, ordering, _ = parts[part_index]
+            ordered_queryset = ordering.apply(queryset)
+            if part_index == first_part and inner_cursor:
+                ordered_queryset = ordering.filter_after(ordered_queryset, inner_cursor)
+            part_rows = list(ordered_queryset[offset:offset + page_size + 1 - len(rows)])
+            rows += [(part_index, row) for row in part_rows]
+            if len(rows) > page_size:
+                break
+            # 이 부분에서 한 행도 못 읽었다면 페이지가 이 부분 뒤에서 시작하므로, 다음 부분에서의 위치를 계산한다.
+            offset = max(offset - queryset.count(), 0) if offset and not part_rows else 0
+
+        has_next = len(rows) > page_size
+        rows = rows[:page_size]
+        next_cursor = chain.encode_cursor(*rows[-1]) if has_next else None
+        movies_dto_list = [parts[part_index][2](row) for part_index, row in rows]
+        return self._to_result(count_queryset, pagination, count_key, start, movies_dto_list, next_cursor)
+
+    def _to_result(self, queryset, pagination, count_key, start, movies_dto_list, next_cursor):
+        page_size = pagination.page_size
+        if start is not None and next_cursor is None and (movies_dto_list or start == 0):
+            total_results, is_total_exact = start + len(movies_dto_list), True
+        else:
+            total_results, is_total_exact = self._count(queryset, pagination.count_mode, count_key)
+
+        total_pages = (total_results + page_size - 1) // page_size
         return MovieSearchResultDto(
             movies=movies_dto_list,
             total_results=total_results,
-            current_page=criteria.pagination.page_number,
-            total_pages=total_pages
+            current_page=None if pagination.cursor else pagination.page_number,
+            total_pages=total_pages,
+            next_cursor=next_cursor,
+            is_total_exact=is_total_exact
         )
 
     def find_popular_movies(self, list_type_criterion, genre_filter, pagination):
+        """
+        'latest'는 개봉일순 실시간 목록이고, MovieRankingListType의 목록은 미리 계산된 순위(MovieRankingModel)를
+        position 순으로 페이지 단위로 읽는다. 순위가 아직 계산되지 않은 목록은 'latest'로 대신한다.
+        """
         logger.info(f"Executing popular movie search in database. Type: {list_type_criterion}")
-        queryset = MovieModel.objects.all().order_by('-release_date', '-created_at')
+        if list_type_criterion == self.LATEST_LIST_TYPE:
+            return self._find_latest_movies(genre_filter, pagination)
+        if list_type_criterion not in MovieRankingListType.values:
+            raise ValueError(f"지원하지 않는 목록 유형입니다: {list_type_criterion}")
+        if self.ranking_scheduler is not None:
+            self.ranking_scheduler.start()
+
+        ranking_queryset = MovieRankingModel.objects.filter(
+            list_type=list_type_criterion, genre=genre_filter or ''
+        ).select_related('movie', 'movie__comment_stats')
+        count_key = {'list': list_type_criterion, 'genre': genre_filter}
+        result = self._paginate(
+            ranking_queryset, KeysetOrdering(KeysetField('position')), pagination, count_key,
+            lambda ranking: self._to_item_dto(ranking.movie)
+        )
+        # 첫 페이지가 비어 있을 때만 순위가 없는 것이다. (뒤쪽 페이지나 커서 이후가 빈 것은 목록의 끝)
+        if not result.movies and not pagination.cursor and pagination.page_number == 1:
+            logger.warning(f"계산된 순위가 없어 최신 개봉순으로 대신합니다. Type: {list_type_criterion}, Genre: {genre_filter}")
+            return self._find_latest_movies(genre_filter, pagination)
+        return result
+
+    def _find_latest_movies(self, genre_filter, pagination):
+        queryset = MovieModel.objects.select_related('comment_stats')
         if genre_filter:
             queryset = queryset.filter(genres__name=genre_filter)
 
-        total_results = queryset.count()
-        start = (pagination.page_number - 1) * pagination.page_size
-        end = start + pagination.page_size
-        paginated_qs = queryset[start:end]
-
-        movies_dto_list = [
-            SearchedMovieItemDto(
-                movie_id=movie.id,
-                title=movie.korean_title,
-                poster_image_url=movie.poster_image_url,
-                release_year=movie.release_date.year if movie.release_date else None,
-                rating=None
-            ) for movie in paginated_qs
-        ]
-
-        total_pages = (total_results + pagination.page_size - 1) // pagination.page_size
-        return MovieSearchResultDto(
-            movies=movies_dto_list,
-            total_results=total_results,
-            current_page=pagination.page_number,
-            total_pages=total_pages
-        )
\ No newline at end of file
+        ordering = KeysetOrdering(
+            KeysetField('release_date', descending=True, nullable=True),
+            KeysetField('created_at', descending=True),
+            KeysetField('id', descending=True),
+        )
+        count_key = {'list': self.LATEST_LIST_TYPE, 'genre': genre_filter}
+        return self._paginate(queryset, ordering, pagination, count_key, self._to_item_dto)
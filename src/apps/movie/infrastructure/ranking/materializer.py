@@ -0,0 +1,117 @@
+import datetime
+import logging
+import math
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Avg
+from django.utils import timezone
+
+from src.apps.movie.models import MovieModel, MoviePlatformRatingModel, MovieRankingModel, MovieRankingListType
+
+logger = logging.getLogger(__name__)
+
+
+class MovieRankingMaterializer:
+    """
+    평점, 댓글 활동, 최신성으로 (목록 유형, 장르)별 영화 순위를 계산해 MovieRankingModel에 통째로 교체 저장한다.
+    - popular: 최근 댓글 수(가중), 전체 댓글 수(로그 스케일), 평균 평점을 합산한다.
+    - latest_highly_rated: 최근 RECENT_RELEASE_DAYS 이내 개봉작 중 평점이 있는 영화를, 개봉 후 경과일에 따라 감쇠한 평점순으로.
+    댓글 활동은 MovieCommentActivityReader 포트로 읽는다.
+    """
+    RECENT_COMMENT_DAYS = 30
+    RECENT_COMMENT_WEIGHT = 3.0
+    TOTAL_COMMENT_WEIGHT = 1.0
+    RATING_WEIGHT = 1.0
+    RECENT_RELEASE_DAYS = 365
+    RELEASE_HALF_LIFE_DAYS = 180
+
+    def __init__(self, comment_activity, list_size=None):
+        self.comment_activity = comment_activity
+        self.list_size = list_size or getattr(settings, 'MOVIE_RANKING_LIST_SIZE', 500)
+
+    def _load_signals(self, now):
+        movies = {
+            movie_id: {'release_date': release_date, 'genres': set(), 'rating': None,
+                       'comments': 0, 'recent_comments': 0}
+            for movie_id, release_date in MovieModel.objects.values_list('id', 'release_date')
+        }
+        # 신호를 읽는 사이에 추가된 영화는 이번 계산에서 건너뛰고 다음 계산에 포함한다.
+        for movie_id, genre_name in MovieModel.genres.through.objects.values_list('moviemodel_id', 'genremodel__name'):
+            if movie_id in movies:
+                movies[movie_id]['genres'].add(genre_name)
+        for movie_id, rating in MoviePlatformRatingModel.objects.values_list('movie_id').annotate(avg=Avg('score')):
+            if movie_id in movies:
+                movies[movie_id]['rating'] = rating
+        for movie_id, comments in self.comment_activity.comment_counts().items():
+            if movie_id in movies:
+                movies[movie_id]['comments'] = comments
+        recent_since = now - datetime.timedelta(days=self.RECENT_COMMENT_DAYS)
+        for movie_id, comments in self.comment_activity.recent_comment_counts(recent_since).items():
+            if movie_id in movies:
+                movies[movie_id]['recent_comments'] = comments
+        return movies
+
+    def _popular_score(self, signals, today):
+        score = (self.RECENT_COMMENT_WEIGHT * math.log1p(signals['recent_comments'])
+                 + self.TOTAL_COMMENT_WEIGHT * math.log1p(signals['comments']))
+        if signals['rating'] is not None:
+            score += self.RATING_WEIGHT * signals['rating'] / 10
+        return score
+
+    def _latest_highly_rated_score(self, signals, today):
+        release_date = signals['release_date']
+        if signals['rating'] is None or release_date is None:
+            return None
+        age_days = (today - release_date).days
+        if age_days < 0 or age_days > self.RECENT_RELEASE_DAYS:
+            return None
+        return signals['rating'] * 0.5 ** (age_days / self.RELEASE_HALF_LIFE_DAYS)
+
+    def _rank(self, movies, score_fn, today):
+        scored = []
+        for movie_id, signals in movies.items():
+            score = score_fn(signals, today)
+            if score is None:
+                continue
+            release_ordinal = signals['release_date'].toordinal() if signals['release_date'] else 0
+            scored.append((-score, -release_ordinal, -movie_id, movie_id, score))
+        scored.sort()
+        return [(movie_id, score) for _, _, _, movie_id, score in scored]
+
+    def compute(self, now=None):
+        """{(list_type, genre): [(movie_id, score), ...]}를 반환한다. genre ''는 전체 목록이다."""
+        now = now or timezone.now()
+        today = timezone.localdate(now)
+        movies = self._load_signals(now)
+        all_genres = sorted({genre for signals in movies.values() for genre in signals['genres']})
+        score_fns = {
+            MovieRankingListType.POPULAR: self._popular_score,
+            MovieRankingListType.LATEST_HIGHLY_RATED: self._latest_highly_rated_score,
+        }
+
+        rankings = {}
+        for list_type, score_fn in score_fns.items():
+            ranked = self._rank(movies, score_fn, today)
+            rankings[(list_type, '')] = ranked[:self.list_size]
+            for genre in all_genres:
+                rankings[(list_type, genre)] = [
+                    (movie_id, score) for movie_id, score in ranked if genre in movies[movie_id]['genres']
+                ][:self.list_size]
+        return rankings
+
+    def refresh(self, now=None):
+        now = now or timezone.now()
+        rankings = self.compute(now)
+        rows = [
+            MovieRankingModel(list_type=list_type, genre=genre, position=position, movie_id=movie_id,
+                              score=score, computed_at=now)
+            for (list_type, genre), ranked in rankings.items()
+            for position, (movie_id, score) in enumerate(ranked, start=1)
+        ]
+        # 조회 쪽에서는 교체 전후 어느 한쪽의 완전한 순위만 보이도록 한 트랜잭션에서 바꾼다.
+        with transaction.atomic():
+            MovieRankingModel.objects.all().delete()
+            MovieRankingModel.objects.bulk_create(rows, batch_size=1000)
+        logger.info(f"영화 순위를 다시 계산했습니다. 목록 수: {len(rankings)}, 항목 수: {len(rows)}")
+        return len(rankings), len(rows)
@@ -0,0 +1,65 @@
+import logging
+import os
+import threading
+
+from django.conf import settings
+from django.db import close_old_connections
+
+logger = logging.getLogger(__name__)
+
+
+class MovieRankingScheduler:
+    """
+    영화 순위를 주기적으로 다시 계산하는 인프로세스 백그라운드 스레드.
+    여러 워커에서 켜면 같은 계산을 중복 수행하므로, 보통은 refresh_movie_rankings 명령을 cron 등으로 실행하고
+    단일 프로세스 배포에서만 settings.MOVIE_RANKING_REFRESH_INTERVAL_SECONDS로 켠다.
+    스레드는 프로세스마다 순위 목록을 처음 조회할 때 시작한다. (migrate/shell 같은 명령에서는 뜨지 않고, fork된 워커는 자기 스레드를 띄운다)
+    interval_seconds가 0 또는 None이면 꺼진 상태로 start가 아무 일도 하지 않는다.
+    """
+
+    def __init__(self, materializer, interval_seconds=None):
+        if interval_seconds is None:
+            interval_seconds = getattr(settings, 'MOVIE_RANKING_REFRESH_INTERVAL_SECONDS', None)
+        self.materializer = materializer
+        self.interval_seconds = interval_seconds
+        self._start_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._pid = None
+
+    @property
+    def is_enabled(self):
+        return bool(self.interval_seconds)
+
+    def start(self):
+        """현재 프로세스의 갱신 스레드를 시작한다. 꺼져 있거나 이미 이 프로세스에서 시작했다면 아무 일도 하지 않는다."""
+        pid = os.getpid()
+        if not self.is_enabled or self._pid == pid:
+            return
+        with self._start_lock:
+            if self._pid == pid:
+                return
+            # fork 이전에 부모가 띄운 스레드는 자식 프로세스에 없으므로 pid가 바뀌면 새로 띄운다.
+            self._stop_event = threading.Event()
+            self._thread = threading.Thread(target=self._run, name="movie-ranking-scheduler", daemon=True)
+            self._thread.start()
+            self._pid = pid
+        logger.info(f"영화 순위 스케줄러를 시작합니다. 주기: {self.interval_seconds}초, pid: {pid}")
+
+    def stop(self, timeout=None):
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout)
+
+    def run_once(self):
+        try:
+            self.materializer.refresh()
+        except Exception:
+            logger.exception("영화 순위 갱신 중 오류 발생")
+        finally:
+            close_old_connections()
+
+    def _run(self):
+        self.run_once()
+        while not self._stop_event.wait(self.interval_seconds):
+            self.run_once()
@@ -0,0 +1,245 @@
+import bisect
+import heapq
+import logging
+import os
+import threading
+import time
+
+from django.conf import settings
+from django.db import close_old_connections
+from django.db.models import Count
+
+from src.apps.movie.application.dtos import AutocompleteSuggestionDto
+from src.apps.movie.application.ports.autocomplete import MovieAutocompleteIndex
+from src.apps.movie.infrastructure.search.korean_text import normalize, extract_choseong, contains_hangul
+from src.apps.movie.models import MovieModel, PersonModel, MovieCastMemberModel
+
+logger = logging.getLogger(__name__)
+
+MOVIE = 'movie'
+PERSON = 'person'
+_KEY_UPPER_BOUND = '\U0010ffff'
+
+
+def _keys_for(label):
+    normalized = normalize(label)
+    keys = {normalized} if normalized else set()
+    if contains_hangul(normalized):
+        keys.add(extract_choseong(normalized))
+    return keys
+
+
+class InMemoryPrefixAutocompleteIndex(MovieAutocompleteIndex):
+    """
+    영화 제목과 인물 이름에 대한 워커 프로세스 공용 접두어 자동완성 인덱스.
+    (정규화된 키, -인기도, 종류, id) 튜플의 정렬 배열을 이진 탐색하며, 초성 키도 함께 넣어 초성 자동완성을 지원한다.
+    memo_prefix_length 이하의 짧은 접두어는 범위가 넓으므로, 접두어별 인기순 상위 top_size개를 재구성과 증분 갱신 때 미리 계산해 둔다.
+    그보다 긴 접두어는 범위가 좁으므로 조회 때 범위 전체에서 인기순으로 고른다.
+    - refresh_interval_seconds > 0: 워커별 첫 조회 때 백그라운드 스레드를 띄워 바로 적재하고, 이후 주기마다 DB에서 다시 만든다.
+      요청 스레드는 재구성을 기다리지 않으며, 첫 적재가 끝나기 전에는 빈 결과를 돌려준다.
+    - refresh_interval_seconds가 0이면 동기 모드: 첫 조회에서 한 번만 적재하고 주기적으로 다시 만들지 않는다. (테스트/디버깅용)
+    """
+
+    def __init__(self, refresh_interval_seconds=None, memo_prefix_length=2, top_size=None):
+        if refresh_interval_seconds is None:
+            refresh_interval_seconds = getattr(settings, 'MOVIE_AUTOCOMPLETE_REFRESH_SECONDS', 600)
+        self._refresh_interval_seconds = refresh_interval_seconds
+        self._memo_prefix_length = memo_prefix_length
+        self._top_size = top_size or getattr(settings, 'MOVIE_AUTOCOMPLETE_TOP_SIZE', 20)
+        self._lock = threading.RLock()
+        # 재구성(동기 모드의 첫 적재, 백그라운드 스레드 시작)은 한 스레드만 수행한다.
+        self._refresh_lock = threading.Lock()
+        self._refresh_thread = None
+        self._refresh_pid = None
+        self._stop_event = threading.Event()
+        self._entries = []
+        self._entries_by_target = {}
+        self._labels = {}
+        # 짧은 접두어 -> [(-인기도, 키, 종류, id)] 인기순 상위 top_size개. (대상별 하나)
+        self._top_by_prefix = {}
+        self._loaded_at = None
+
+    @property
+    def is_sync(self):
+        return not self._refresh_interval_seconds
+
+    # --- 적재 ---
+
+    def _load_movie_rows(self):
+        return MovieModel.objects.annotate(popularity=Count('comments_on_movie')).values_list(
+            'id', 'korean_title', 'popularity')
+
+    def _load_person_rows(self):
+        popularity = {}
+        for person_id, directed_count in MovieModel.directors.through.objects.values_list(
+                'personmodel_id').annotate(n=Count('id')):
+            popularity[person_id] = popularity.get(person_id, 0) + directed_count
+        for person_id, cast_count in MovieCastMemberModel.objects.values_list(
+                'actor_id').annotate(n=Count('movie_id', distinct=True)):
+            popularity[person_id] = popularity.get(person_id, 0) + cast_count
+        return [(person_id, name, popularity.get(person_id, 0))
+                for person_id, name in PersonModel.objects.values_list('id', 'name')]
+
+    def rebuild(self):
+        entries_by_target = {}
+        labels = {}
+        for kind, rows in ((MOVIE, self._load_movie_rows()), (PERSON, self._load_person_rows())):
+            for target_id, label, popularity in rows:
+                target = (kind, target_id)
+                labels[target] = label
+                entries_by_target[target] = [(key, -popularity, kind, target_id) for key in _keys_for(label)]
+        entries = sorted(entry for target_entries in entries_by_target.values() for entry in target_entries)
+        top_by_prefix = self._build_top_by_prefix(entries)
+
+        with self._lock:
+            self._entries = entries
+            self._entries_by_target = entries_by_target
+            self._labels = labels
+            self._top_by_prefix = top_by_prefix
+            self._loaded_at = time.monotonic()
+        logger.info(f"자동완성 인덱스를 재구성했습니다. 항목 수: {len(entries)}, 짧은 접두어 수: {len(top_by_prefix)}")
+
+    def _short_prefixes(self, key):
+        return {key[:length] for length in range(1, min(len(key), self._memo_prefix_length) + 1)}
+
+    def _build_top_by_prefix(self, entries):
+        best_by_prefix = {}
+        for key, negative_popularity, kind, target_id in entries:
+            ranked = (negative_popularity, key, kind, target_id)
+            for prefix in self._short_prefixes(key):
+                best = best_by_prefix.setdefault(prefix, {})
+                if (kind, target_id) not in best or ranked < best[(kind, target_id)]:
+                    best[(kind, target_id)] = ranked
+        return {prefix: heapq.nsmallest(self._top_size, best.values()) for prefix, best in best_by_prefix.items()}
+
+    def _ensure_fresh(self):
+        if not self.is_sync:
+            self.start()
+            return
+        if self._loaded_at is None:
+            with self._refresh_lock:
+                # 락을 기다리는 동안 다른 스레드가 이미 적재했다면 다시 만들지 않는다.
+                if self._loaded_at is None:
+                    self.rebuild()
+
+    def start(self):
+        """백그라운드 재구성 스레드를 시작한다. fork 이후의 워커에서는 첫 조회 때 자기 스레드를 새로 띄운다."""
+        pid = os.getpid()
+        if self.is_sync or self._refresh_pid == pid:
+            return
+        with self._refresh_lock:
+            if self._refresh_pid == pid:
+                return
+            self._stop_event = threading.Event()
+            self._refresh_thread = threading.Thread(target=self._run, name="movie-autocomplete-refresher", daemon=True)
+            self._refresh_thread.start()
+            self._refresh_pid = pid
+        logger.info(f"자동완성 인덱스 재구성 스레드를 시작합니다. 주기: {self._refresh_interval_seconds}초")
+
+    def stop(self, timeout=None):
+        self._stop_event.set()
+        if self._refresh_thread:
+            self._refresh_thread.join(timeout)
+
+    def _run(self):
+        while True:
+            try:
+                self.rebuild()
+            except Exception:
+                logger.exception("자동완성 인덱스 재구성 중 오류 발생")
+            finally:
+                close_old_connections()
+            if self._stop_event.wait(self._refresh_interval_seconds):
+                return
+
+    # --- 조회 ---
+
+    def suggest(self, prefix, limit=10):
+        self._ensure_fresh()
+        key = normalize(prefix)
+        if not key:
+            return []
+
+        with self._lock:
+            if len(key) <= self._memo_prefix_length and limit <= self._top_size:
+                ranked = self._top_by_prefix.get(key, [])[:limit]
+            else:
+                ranked = self._scan(key, limit)
+            return [AutocompleteSuggestionDto(suggestion_type=kind, target_id=target_id, label=self._labels[(kind, target_id)])
+                    for _, _, kind, target_id in ranked]
+
+    def _scan(self, key, limit):
+        """key로 시작하는 범위 전체에서 인기순 상위 limit개 (-인기도, 키, 종류, id)를 대상별 하나씩 고른다."""
+        lo = bisect.bisect_left(self._entries, (key,))
+        hi = bisect.bisect_left(self._entries, (key + _KEY_UPPER_BOUND,))
+        # 같은 대상이 제목 키와 초성 키로 모두 걸릴 수 있으므로 여유 있게 뽑은 뒤 중복을 제거한다.
+        candidates = heapq.nsmallest(limit * 2, ((entry[1], entry[0], entry[2], entry[3])
+                                                 for entry in (self._entries[i] for i in range(lo, hi))))
+        ranked, seen = [], set()
+        for candidate in candidates:
+            if candidate[2:] in seen:
+                continue
+            seen.add(candidate[2:])
+            ranked.append(candidate)
+            if len(ranked) == limit:
+                break
+        return ranked
+
+    # --- 증분 갱신 ---
+
+    def _upsert(self, kind, target_id, label):
+        with self._lock:
+            if self._loaded_at is None:
+                return  # 아직 적재 전이면 첫 적재 때 DB에서 함께 읽힌다.
+            target = (kind, target_id)
+            previous_entries = self._entries_by_target.get(target, [])
+            popularity = -previous_entries[0][1] if previous_entries else 0
+            new_entries = sorted((key, -popularity, kind, target_id) for key in _keys_for(label))
+            self._labels[target] = label
+            if new_entries == sorted(previous_entries):
+                return  # 표시 문자열만 같거나 정규화 결과가 같으면 정렬 배열은 그대로다.
+            self._remove_entries(previous_entries)
+            for entry in new_entries:
+                bisect.insort(self._entries, entry)
+            self._entries_by_target[target] = new_entries
+            self._add_to_top(new_entries)
+
+    def _remove_entries(self, entries):
+        """정렬 배열과 짧은 접두어 상위 목록에서 항목을 뺀다. 가득 찼던 상위 목록은 범위를 다시 훑어 채운다."""
+        for entry in entries:
+            index = bisect.bisect_left(self._entries, entry)
+            if index < len(self._entries) and self._entries[index] == entry:
+                del self._entries[index]
+        for key, _, kind, target_id in entries:
+            for prefix in self._short_prefixes(key):
+                top = self._top_by_prefix.get(prefix, [])
+                remaining = [ranked for ranked in top if ranked[2:] != (kind, target_id)]
+                if len(remaining) == len(top):
+                    continue
+                # 잘려 나간 다음 순위 후보가 있을 수 있으므로 가득 찼던 목록만 다시 계산한다.
+                self._top_by_prefix[prefix] = self._scan(prefix, self._top_size) if len(top) >= self._top_size else remaining
+
+    def _add_to_top(self, entries):
+        for key, negative_popularity, kind, target_id in entries:
+            ranked = (negative_popularity, key, kind, target_id)
+            for prefix in self._short_prefixes(key):
+                top = self._top_by_prefix.setdefault(prefix, [])
+                existing = next((other for other in top if other[2:] == (kind, target_id)), None)
+                if existing is not None:
+                    if existing <= ranked:
+                        continue
+                    top.remove(existing)
+                if len(top) < self._top_size or ranked < top[-1]:
+                    bisect.insort(top, ranked)
+                    del top[self._top_size:]
+
+    def upsert_movie(self, movie_id, title):
+        self._upsert(MOVIE, movie_id, title)
+
+    def upsert_person(self, person_id, name):
+        self._upsert(PERSON, person_id, name)
+
+    def remove_movie(self, movie_id):
+        with self._lock:
+            self._remove_entries(self._entries_by_target.pop((MOVIE, movie_id), []))
+            self._labels.pop((MOVIE, movie_id), None)
@@ -0,0 +1,105 @@
+import logging
+from collections import defaultdict
+
+from django.db import connection
+from django.db.models import FloatField
+from django.db.models.expressions import RawSQL
+
+from src.apps.movie.models import MovieModel, MovieCastMemberModel
+
+logger = logging.getLogger(__name__)
+
+
+class SqliteMovieFullTextIndex:
+    """
+    SQLite FTS5 가상 테이블(movie_search_fts)을 이용한 영화 키워드 검색 인덱스.
+    rowid는 movies.id와 같고, 제목/원제/감독/출연진 이름을 색인한다.
+    SQLite가 아닌 DB에서는 is_available()이 False를 반환하며 호출 측이 기존 검색으로 대체해야 한다.
+    """
+    TABLE_NAME = "movie_search_fts"
+    # bm25 컬럼 가중치: korean_title, original_title, directors, cast_names 순
+    COLUMN_WEIGHTS = (10.0, 5.0, 3.0, 1.0)
+
+    def is_available(self):
+        return connection.vendor == 'sqlite'
+
+    @staticmethod
+    def build_match_query(keyword):
+        tokens = keyword.split() if keyword else []
+        if not tokens:
+            return None
+        # 각 토큰을 구문(phrase)으로 감싸 FTS 연산자를 무력화하고, 접두어 검색(*)으로 입력 중인 단어도 매칭한다.
+        return " ".join('"' + token.replace('"', '""') + '"*' for token in tokens)
+
+    def has_matches(self, match_query):
+        with connection.cursor() as cursor:
+            cursor.execute(f"SELECT 1 FROM {self.TABLE_NAME} WHERE {self.TABLE_NAME} MATCH %s LIMIT 1", (match_query,))
+            return cursor.fetchone() is not None
+
+    def filter_matching(self, queryset, match_query):
+        """
+        FTS 테이블을 한 번 조인해 일치하는 영화만 남기고, bm25 점수를 search_rank로 붙인다.
+        MATCH는 조인된 FTS 행에 대해 한 번만 실행되며, bm25는 그 행에서 바로 계산된다. (값이 작을수록 관련도가 높다)
+        """
+        weights = ", ".join(str(weight) for weight in self.COLUMN_WEIGHTS)
+        return queryset.extra(
+            tables=[self.TABLE_NAME],
+            where=[f"{self.TABLE_NAME}.rowid = {MovieModel._meta.db_table}.id", f"{self.TABLE_NAME} MATCH %s"],
+            params=[match_query],
+        ).annotate(search_rank=RawSQL(f"bm25({self.TABLE_NAME}, {weights})", (), output_field=FloatField()))
+
+    def _build_documents(self, movie_ids):
+        directors_by_movie = defaultdict(list)
+        for movie_id, name in MovieModel.directors.through.objects.filter(
+                moviemodel_id__in=movie_ids).values_list('moviemodel_id', 'personmodel__name'):
+            directors_by_movie[movie_id].append(name)
+
+        cast_by_movie = defaultdict(list)
+        for movie_id, name in MovieCastMemberModel.objects.filter(
+                movie_id__in=movie_ids).order_by('id').values_list('movie_id', 'actor__name'):
+            cast_by_movie[movie_id].append(name)
+
+        return [
+            (movie_id, korean_title, original_title or "",
+             " ".join(directors_by_movie[movie_id]), " ".join(cast_by_movie[movie_id]))
+            for movie_id, korean_title, original_title in MovieModel.objects.filter(
+                id__in=movie_ids).values_list('id', 'korean_title', 'original_title')
+        ]
+
+    def sync(self, movie_ids):
+        movie_ids = list(movie_ids)
+        if not movie_ids or not self.is_available():
+            return
+        documents = self._build_documents(movie_ids)
+        with connection.cursor() as cursor:
+            self._delete_rows(cursor, movie_ids)
+            cursor.executemany(
+                f"INSERT INTO {self.TABLE_NAME}(rowid, korean_title, original_title, directors, cast_names) "
+                f"VALUES (%s, %s, %s, %s, %s)",
+                documents
+            )
+        logger.debug(f"영화 검색 인덱스를 갱신했습니다. movie_ids: {movie_ids}")
+
+    def remove(self, movie_ids):
+        movie_ids = list(movie_ids)
+        if not movie_ids or not self.is_available():
+            return
+        with connection.cursor() as cursor:
+            self._delete_rows(cursor, movie_ids)
+
+    def rebuild(self, batch_size=500):
+        if not self.is_available():
+            raise RuntimeError("FTS5 검색 인덱스는 SQLite 데이터베이스에서만 사용할 수 있습니다.")
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {self.TABLE_NAME}")
+        indexed_count = 0
+        movie_ids = list(MovieModel.objects.order_by('id').values_list('id', flat=True))
+        for start in range(0, len(movie_ids), batch_size):
+            batch = movie_ids[start:start + batch_size]
+            self.sync(batch)
+            indexed_count += len(batch)
+        return indexed_count
+
+    def _delete_rows(self, cursor, movie_ids):
+        placeholders = ", ".join(["%s"] * len(movie_ids))
+        cursor.execute(f"DELETE FROM {self.TABLE_NAME} WHERE rowid IN ({placeholders})", movie_ids)
@@ -0,0 +1,71 @@
+import unicodedata
+
+HANGUL_SYLLABLE_START = 0xAC00
+HANGUL_SYLLABLE_END = 0xD7A3
+SYLLABLES_PER_CHOSEONG = 588  # 중성 21개 * 종성 28개
+
+CHOSEONG = (
+    'ㄱ', 'ㄲ', 'ㄴ', 'ㄷ', 'ㄸ', 'ㄹ', 'ㅁ', 'ㅂ', 'ㅃ', 'ㅅ',
+    'ㅆ', 'ㅇ', 'ㅈ', 'ㅉ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ',
+)
+CHOSEONG_SET = frozenset(CHOSEONG)
+
+
+def normalize(text):
+    """NFC 정규화 후 대소문자를 접고 공백을 제거한다. 색인과 검색어 모두 같은 규칙을 사용한다."""
+    if not text:
+        return ""
+    return "".join(unicodedata.normalize('NFC', text).casefold().split())
+
+
+def is_hangul_syllable(char):
+    return HANGUL_SYLLABLE_START <= ord(char) <= HANGUL_SYLLABLE_END
+
+
+def to_choseong(char):
+    """한글 음절이면 초성(호환 자모)을, 아니면 문자 그대로를 반환한다."""
+    if is_hangul_syllable(char):
+        return CHOSEONG[(ord(char) - HANGUL_SYLLABLE_START) // SYLLABLES_PER_CHOSEONG]
+    return char
+
+
+def extract_choseong(text):
+    return "".join(to_choseong(char) for char in text)
+
+
+def contains_choseong(text):
+    return any(char in CHOSEONG_SET for char in text)
+
+
+def contains_hangul(text):
+    return any(is_hangul_syllable(char) or char in CHOSEONG_SET for char in text)
+
+
+def ngrams(text, n=2):
+    if len(text) < n:
+        return {text} if text else set()
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+def index_grams(text):
+    """색인용 gram: 한 글자 검색을 위한 unigram과 그 외 검색을 위한 bigram."""
+    return ngrams(text, 1) | ngrams(text, 2)
+
+
+def query_grams(query):
+    return ngrams(query, 1) if len(query) == 1 else ngrams(query, 2)
+
+
+def matches(normalized_text, normalized_query):
+    """
+    검색어가 텍스트의 연속된 부분과 일치하는지 확인한다.
+    검색어의 초성 자모는 같은 초성을 가진 음절과도 일치한다. (예: 'ㄱㅅㅊ', '기ㅅ충' -> '기생충')
+    """
+    if not contains_choseong(normalized_query):
+        return normalized_query in normalized_text
+    width = len(normalized_query)
+    for start in range(len(normalized_text) - width + 1):
+        window = normalized_text[start:start + width]
+        if all(q == t or (q in CHOSEONG_SET and to_choseong(t) == q) for q, t in zip(normalized_query, window)):
+            return True
+    return False
@@ -0,0 +1,112 @@
+import logging
+
+from django.conf import settings
+from django.db.models import Count
+
+from src.apps.movie.infrastructure.search.korean_text import (
+    normalize, extract_choseong, contains_choseong, contains_hangul, index_grams, query_grams, matches
+)
+from src.apps.movie.models import (
+    MovieModel, PersonModel, MovieCastMemberModel, MovieTitleGramModel, PersonNameGramModel, SearchGramKind
+)
+
+logger = logging.getLogger(__name__)
+
+
+class KoreanNgramIndex:
+    """
+    영화 제목(MovieModel.korean_title)과 인물 이름(PersonModel.name)에 대한 한글 n-gram/초성 색인.
+    음절 gram으로 부분 문자열('생충')을, 초성 gram으로 초성 검색('ㄱㅅㅊ')을 인덱스 조회만으로 처리한다.
+    gram 교집합으로 후보를 좁힌 뒤 원문과 다시 비교하므로 bigram 우연 일치로 인한 오탐은 걸러진다.
+    짧은 검색어는 카탈로그 대부분과 일치할 수 있으므로 후보와 결과는 max_candidates개로 제한한다.
+    """
+
+    def __init__(self, max_candidates=None):
+        self.max_candidates = max_candidates or getattr(settings, 'MOVIE_KOREAN_SEARCH_MAX_CANDIDATES', 300)
+
+    def _build_gram_rows(self, model, owner_field, owners):
+        rows = []
+        for owner_id, text in owners:
+            normalized = normalize(text)
+            for gram in index_grams(normalized):
+                rows.append(model(**{f"{owner_field}_id": owner_id}, kind=SearchGramKind.SYLLABLE, gram=gram))
+            if contains_hangul(normalized):
+                for gram in index_grams(extract_choseong(normalized)):
+                    rows.append(model(**{f"{owner_field}_id": owner_id}, kind=SearchGramKind.CHOSEONG, gram=gram))
+        return rows
+
+    def _replace_grams(self, model, owner_field, owners):
+        owners = list(owners)
+        if not owners:
+            return
+        model.objects.filter(**{f"{owner_field}_id__in": [owner_id for owner_id, _ in owners]}).delete()
+        model.objects.bulk_create(self._build_gram_rows(model, owner_field, owners), batch_size=1000)
+
+    def index_movies(self, movie_ids):
+        self._replace_grams(
+            MovieTitleGramModel, 'movie',
+            MovieModel.objects.filter(id__in=list(movie_ids)).values_list('id', 'korean_title')
+        )
+
+    def index_people(self, person_ids):
+        self._replace_grams(
+            PersonNameGramModel, 'person',
+            PersonModel.objects.filter(id__in=list(person_ids)).values_list('id', 'name')
+        )
+
+    def rebuild(self, batch_size=500):
+        MovieTitleGramModel.objects.all().delete()
+        PersonNameGramModel.objects.all().delete()
+        movie_ids = list(MovieModel.objects.order_by('id').values_list('id', flat=True))
+        for start in range(0, len(movie_ids), batch_size):
+            self.index_movies(movie_ids[start:start + batch_size])
+        person_ids = list(PersonModel.objects.order_by('id').values_list('id', flat=True))
+        for start in range(0, len(person_ids), batch_size):
+            self.index_people(person_ids[start:start + batch_size])
+        return len(movie_ids), len(person_ids)
+
+    def _candidate_owner_ids(self, model, owner_field, query):
+        if contains_choseong(query):
+            kind, grams = SearchGramKind.CHOSEONG, query_grams(extract_choseong(query))
+        else:
+            kind, grams = SearchGramKind.SYLLABLE, query_grams(query)
+        return (
+            model.objects.filter(kind=kind, gram__in=grams)
+            .values(owner_field)
+            .annotate(matched_grams=Count('gram', distinct=True))
+            .filter(matched_grams=len(grams))
+            .order_by(owner_field)
+            .values_list(owner_field, flat=True)[:self.max_candidates]
+        )
+
+    def search_movie_ids(self, keyword):
+        """일치하는 영화 ID를 최대 max_candidates개까지 정렬된 리스트로 반환한다. (id__in에 그대로 넣을 수 있는 크기)"""
+        query = normalize(keyword)
+        if not query or not contains_hangul(query):
+            return []
+
+        movie_ids = {
+            movie_id for movie_id, title in MovieModel.objects.filter(
+                id__in=self._candidate_owner_ids(MovieTitleGramModel, 'movie', query)
+            ).values_list('id', 'korean_title')
+            if matches(normalize(title), query)
+        }
+
+        person_ids = [
+            person_id for person_id, name in PersonModel.objects.filter(
+                id__in=self._candidate_owner_ids(PersonNameGramModel, 'person', query)
+            ).values_list('id', 'name')
+            if matches(normalize(name), query)
+        ]
+        if person_ids:
+            movie_ids.update(MovieModel.directors.through.objects.filter(
+                personmodel_id__in=person_ids).order_by('moviemodel_id').values_list(
+                'moviemodel_id', flat=True)[:self.max_candidates])
+            movie_ids.update(MovieCastMemberModel.objects.filter(
+                actor_id__in=person_ids).order_by('movie_id').values_list('movie_id', flat=True)[:self.max_candidates])
+
+        if len(movie_ids) > self.max_candidates:
+            logger.info(f"한글 n-gram 검색 결과가 많아 {self.max_candidates}개로 제한합니다. keyword={keyword}")
+        movie_ids = sorted(movie_ids)[:self.max_candidates]
+        logger.debug(f"한글 n-gram 검색 결과: keyword={keyword}, movies={len(movie_ids)}")
+        return movie_ids
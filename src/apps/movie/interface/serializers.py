@@ -11,6 +11,27 @@ class MovieSearchQueryParamSerializer(serializers.Serializer):
     rating_platform = serializers.CharField(required=False, allow_blank=True, allow_null=True)
     page_number = serializers.IntegerField(required=False, min_value=1, allow_null=True)
     page_size = serializers.IntegerField(required=False, min_value=1, max_value=100, allow_null=True)
+    cursor = serializers.CharField(required=False, allow_blank=True, allow_null=True, max_length=512)
+    count_mode = serializers.ChoiceField(choices=['exact', 'estimated'], required=False, default='exact')
+
+
+class MovieBatchQueryParamSerializer(serializers.Serializer):
+    MAX_IDS = 50
+
+    ids = serializers.CharField(required=True)
+
+    def validate_ids(self, value):
+        try:
+            movie_ids = [int(movie_id) for movie_id in value.split(',') if movie_id.strip()]
+        except ValueError:
+            raise serializers.ValidationError("ids는 쉼표로 구분된 정수 목록이어야 합니다.")
+        if not movie_ids:
+            raise serializers.ValidationError("최소 1개의 영화 ID가 필요합니다.")
+        if any(movie_id <= 0 for movie_id in movie_ids):
+            raise serializers.ValidationError("영화 ID는 0보다 큰 정수여야 합니다.")
+        if len(set(movie_ids)) > self.MAX_IDS:
+            raise serializers.ValidationError(f"한 번에 최대 {self.MAX_IDS}개의 영화만 조회할 수 있습니다.")
+        return list(dict.fromkeys(movie_ids))
 
 
 class SearchedMovieItemResponseSerializer(serializers.Serializer):
@@ -19,13 +40,17 @@ class SearchedMovieItemResponseSerializer(serializers.Serializer):
     poster_image_url = serializers.URLField(allow_null=True)
     release_year = serializers.IntegerField(allow_null=True)
     rating = serializers.FloatField(allow_null=True)
+    comment_count = serializers.IntegerField(required=False, default=0)
+    last_comment_at = serializers.DateTimeField(allow_null=True, required=False)
 
 class MovieSearchResultResponseSerializer(serializers.Serializer):
     movies = SearchedMovieItemResponseSerializer(many=True)
     total_results = serializers.IntegerField()
-    current_page = serializers.IntegerField()
+    current_page = serializers.IntegerField(allow_null=True)
     total_pages = serializers.IntegerField()
     message = serializers.CharField(allow_null=True, required=False)
+    next_cursor = serializers.CharField(allow_null=True, required=False)
+    is_total_exact = serializers.BooleanField(required=False)
 
 class TitleInfoDisplayResponseSerializer(serializers.Serializer):
     korean_title = serializers.CharField()
@@ -70,4 +95,20 @@ class MovieDetailResponseSerializer(serializers.Serializer):
     platform_ratings = MoviePlatformRatingDisplayResponseSerializer(many=True)
     ott_availability = OTTInfoDisplayResponseSerializer(many=True)
     created_at_str = serializers.CharField()
-    updated_at_str = serializers.CharField(allow_null=True, required=False)
\ No newline at end of file
+    updated_at_str = serializers.CharField(allow_null=True, required=False)
+
+class MovieBatchDetailResponseSerializer(serializers.Serializer):
+    movies = MovieDetailResponseSerializer(many=True)
+    missing_ids = serializers.ListField(child=serializers.IntegerField())
+
+class MovieAutocompleteQueryParamSerializer(serializers.Serializer):
+    q = serializers.CharField(max_length=50, trim_whitespace=True)
+    limit = serializers.IntegerField(required=False, default=10, min_value=1, max_value=20)
+
+class AutocompleteSuggestionResponseSerializer(serializers.Serializer):
+    suggestion_type = serializers.CharField()
+    target_id = serializers.IntegerField()
+    label = serializers.CharField()
+
+class MovieAutocompleteResponseSerializer(serializers.Serializer):
+    suggestions = AutocompleteSuggestionResponseSerializer(many=True)
@@ -1,8 +1,11 @@
 from django.urls import path
-from .views import MovieSearchAPIView, MovieDetailAPIView, PopularMoviesAPIView
+from .views import MovieSearchAPIView, MovieDetailAPIView, PopularMoviesAPIView, MovieBatchDetailAPIView, \
+    MovieAutocompleteAPIView
 
 urlpatterns = [
     path('search', MovieSearchAPIView.as_view(), name='movie_search'),
+    path('autocomplete', MovieAutocompleteAPIView.as_view(), name='movie_autocomplete'),
+    path('batch', MovieBatchDetailAPIView.as_view(), name='movie_batch_detail'),
     path('<int:movie_id>', MovieDetailAPIView.as_view(), name='movie_detail'),
     path('popular', PopularMoviesAPIView.as_view(), name='popular_movies'),
 ]
\ No newline at end of file
@@ -3,14 +3,18 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 
-from apps.movie.application.dtos import (
+from src.apps.movie.application.dtos import (
     MovieSearchCriteriaDto, FilterOptionsDto, SortOptionDto, PaginationDto, MovieDetailDto
 )
-from apps.movie.containers import MovieContainer
+from src.apps.movie.containers import MovieContainer
 from src.apps.movie.interface.serializers import (
     MovieSearchQueryParamSerializer,
     MovieSearchResultResponseSerializer,
-    MovieDetailResponseSerializer
+    MovieDetailResponseSerializer,
+    MovieBatchQueryParamSerializer,
+    MovieBatchDetailResponseSerializer,
+    MovieAutocompleteQueryParamSerializer,
+    MovieAutocompleteResponseSerializer
 )
 
 logger = logging.getLogger(__name__)
@@ -35,6 +39,53 @@ class MovieDetailAPIView(APIView):
             return Response({"error": "서버 내부 오류"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+class MovieBatchDetailAPIView(APIView):
+    def get(self, request):
+        service = MovieContainer.movie_app_service()
+
+        logger.info(f"MovieBatchDetailAPIView GET request received with params: {request.query_params}")
+
+        query_param_serializer = MovieBatchQueryParamSerializer(data=request.query_params)
+        if not query_param_serializer.is_valid():
+            logger.warning(f"MovieBatchDetailAPIView request validation failed: {query_param_serializer.errors}")
+            return Response(query_param_serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        movie_ids = query_param_serializer.validated_data['ids']
+        try:
+            movie_detail_dtos = service.get_movie_details_bulk(movie_ids=movie_ids)
+            found_ids = {dto.movie_id for dto in movie_detail_dtos}
+            response_serializer = MovieBatchDetailResponseSerializer({
+                'movies': movie_detail_dtos,
+                'missing_ids': [movie_id for movie_id in movie_ids if movie_id not in found_ids],
+            })
+            return Response(response_serializer.data)
+        except Exception as e:
+            logger.exception(f"영화 일괄 상세 정보 조회 중 오류 발생 movie_ids: {movie_ids}")
+            return Response({"error": "서버 내부 오류"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+class MovieAutocompleteAPIView(APIView):
+    def get(self, request):
+        service = MovieContainer.movie_app_service()
+
+        query_param_serializer = MovieAutocompleteQueryParamSerializer(data=request.query_params)
+        if not query_param_serializer.is_valid():
+            logger.warning(f"MovieAutocompleteAPIView request validation failed: {query_param_serializer.errors}")
+            return Response(query_param_serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        validated_data = query_param_serializer.validated_data
+        try:
+            suggestions = service.get_autocomplete_suggestions(
+                query=validated_data['q'],
+                limit=validated_data['limit']
+            )
+            response_serializer = MovieAutocompleteResponseSerializer({'suggestions': suggestions})
+            return Response(response_serializer.data)
+        except Exception as e:
+            logger.exception(f"자동완성 조회 중 오류 발생 q: {validated_data['q']}")
+            return Response({"error": "서버 내부 오류"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
 class MovieSearchAPIView(APIView):
     def get(self, request):
         # ✅ 메서드 시작 시점에서 컨테이너로부터 서비스 인스턴스를 직접 가져옴
@@ -70,7 +121,9 @@ class MovieSearchAPIView(APIView):
 
             pagination_dto = PaginationDto(
                 page_number=validated_data.get('page_number', 1),
-                page_size=validated_data.get('page_size', 20)
+                page_size=validated_data.get('page_size', 20),
+                cursor=validated_data.get('cursor'),
+                count_mode=validated_data.get('count_mode', 'exact')
             )
 
             criteria_dto = MovieSearchCriteriaDto(
@@ -100,7 +153,9 @@ class PopularMoviesAPIView(APIView):
         try:
             pagination_dto = PaginationDto(
                 page_number=int(request.query_params.get('page_number', 1)),
-                page_size=int(request.query_params.get('page_size', 10))
+                page_size=int(request.query_params.get('page_size', 10)),
+                cursor=request.query_params.get('cursor'),
+                count_mode=request.query_params.get('count_mode', 'exact')
             )
             list_type = request.query_params.get('type', 'latest_highly_rated')
             genre = request.query_params.get('genre')
@@ -113,8 +168,8 @@ class PopularMoviesAPIView(APIView):
             response_serializer = MovieSearchResultResponseSerializer(popular_movies_dto)
             return Response(response_serializer.data)
         except (ValueError, TypeError):
-            logger.warning(f"Invalid pagination params in PopularMoviesAPIView: {request.query_params}")
-            return Response({"error": "잘못된 페이지 또는 페이지 크기 값입니다."}, status=status.HTTP_400_BAD_REQUEST)
+            logger.warning(f"Invalid params in PopularMoviesAPIView: {request.query_params}")
+            return Response({"error": "잘못된 목록 유형, 페이지, 페이지 크기, 커서 또는 count_mode 값입니다."}, status=status.HTTP_400_BAD_REQUEST)
         except Exception as e:
             logger.exception("An unexpected error occurred in PopularMoviesAPIView.")
             return Response({"error": "인기 영화 목록 조회 중 오류 발생"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
\ No newline at end of file
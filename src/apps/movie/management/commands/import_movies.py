@@ -0,0 +1,164 @@
+import collections
+import itertools
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DatabaseError
+
+from src.apps.movie.containers import MovieContainer
+from src.apps.movie.infrastructure.importing.catalog_records import (
+    read_jsonl_records, read_csv_records, validate_chunk
+)
+
+READERS = {
+    'jsonl': read_jsonl_records,
+    'csv': read_csv_records,
+}
+
+
+class _InProcessExecutor:
+    """--workers 0일 때 프로세스 풀 대신 현재 프로세스에서 검증한다. (디버깅/테스트용)"""
+
+    class _Done:
+        def __init__(self, value):
+            self._value = value
+
+        def result(self):
+            return self._value
+
+    def submit(self, fn, *args):
+        return self._Done(fn(*args))
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        pass
+
+
+class Command(BaseCommand):
+    help = (
+        "JSONL/CSV 영화 카탈로그 파일을 스트리밍으로 읽어, 프로세스 풀에서 Movie 애그리거트로 검증한 뒤 "
+        "배치 트랜잭션(MovieRepository.save_many)으로 적재합니다. 배치마다 체크포인트를 남겨 --resume으로 이어서 실행할 수 있습니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help="가져올 파일 경로 (.jsonl 또는 .csv)")
+        parser.add_argument('--format', choices=sorted(READERS), default=None, help="파일 형식 (기본값: 확장자로 판단)")
+        parser.add_argument('--batch-size', type=int, default=500, help="한 트랜잭션에 저장할 영화 수")
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                            help="검증용 프로세스 수 (0이면 현재 프로세스에서 검증)")
+        parser.add_argument('--checkpoint', default=None, help="체크포인트 파일 경로 (기본값: <path>.checkpoint)")
+        parser.add_argument('--errors', default=None, help="오류 행 기록 파일 경로 (기본값: <path>.errors.jsonl)")
+        parser.add_argument('--resume', action='store_true', help="체크포인트 이후 줄부터 이어서 가져옵니다.")
+
+    def handle(self, *args, **options):
+        path = options['path']
+        if not os.path.isfile(path):
+            raise CommandError(f"파일을 찾을 수 없습니다: {path}")
+        file_format = options['format'] or os.path.splitext(path)[1].lstrip('.').lower()
+        if file_format not in READERS:
+            raise CommandError(f"지원하지 않는 형식입니다: {file_format} (jsonl, csv 중 하나를 --format으로 지정하세요)")
+        if options['batch_size'] < 1:
+            raise CommandError("--batch-size는 1 이상이어야 합니다.")
+
+        checkpoint_path = options['checkpoint'] or f"{path}.checkpoint"
+        errors_path = options['errors'] or f"{path}.errors.jsonl"
+        resume_after = self._read_checkpoint(checkpoint_path, path) if options['resume'] else 0
+        if resume_after:
+            self.stdout.write(f"체크포인트에서 이어서 가져옵니다. {resume_after}번째 줄 이후부터 처리합니다.")
+
+        repository = MovieContainer.movie_repository()
+        workers = options['workers']
+        executor = ProcessPoolExecutor(max_workers=workers) if workers > 0 else _InProcessExecutor()
+        stats = collections.Counter()
+        started_at = time.monotonic()
+
+        with open(path, encoding='utf-8', newline='') as source, \
+                open(errors_path, 'a' if options['resume'] else 'w', encoding='utf-8') as error_file:
+            records = (
+                (line_no, record) for line_no, record in READERS[file_format](source) if line_no > resume_after
+            )
+            chunks = iter(lambda: list(itertools.islice(records, options['batch_size'])), [])
+            try:
+                for results in self._validate_in_order(executor, chunks, max(workers, 1) * 2):
+                    self._write_batch(repository, results, error_file, stats)
+                    self._write_checkpoint(checkpoint_path, path, results[-1][0])
+                    self._report_progress(stats, started_at)
+            finally:
+                executor.shutdown(wait=True, cancel_futures=True)
+
+        elapsed = time.monotonic() - started_at
+        self.stdout.write(self.style.SUCCESS(
+            f"가져오기 완료: 저장 {stats['saved']}건, 오류 {stats['failed']}건, {elapsed:.1f}초"
+        ))
+        if stats['failed']:
+            self.stdout.write(self.style.WARNING(f"오류 행은 {errors_path}에 기록했습니다."))
+
+    def _validate_in_order(self, executor, chunks, max_in_flight):
+        """
+        입력 순서를 유지하면서 최대 max_in_flight개의 배치만 워커에 미리 넘긴다.
+        (executor.map은 입력 전체를 한 번에 제출하므로 스트리밍이 깨진다)
+        """
+        in_flight = collections.deque()
+        for chunk in chunks:
+            in_flight.append(executor.submit(validate_chunk, chunk))
+            if len(in_flight) >= max_in_flight:
+                yield in_flight.popleft().result()
+        while in_flight:
+            yield in_flight.popleft().result()
+
+    def _write_batch(self, repository, results, error_file, stats):
+        movies = [(line_no, movie) for line_no, movie, _ in results if movie is not None]
+        for line_no, _, error in results:
+            if error is not None:
+                self._write_error(error_file, line_no, error)
+        saved = 0
+        if movies:
+            try:
+                repository.save_many([movie for _, movie in movies])
+                saved = len(movies)
+            except DatabaseError as e:
+                # 배치 트랜잭션은 롤백되었으므로, 문제 행을 찾기 위해 이 배치만 한 건씩 다시 저장한다.
+                self.stderr.write(f"배치 저장 실패, 한 건씩 다시 저장합니다. ({movies[0][0]}~{movies[-1][0]}번째 줄): {e}")
+                saved = self._write_one_by_one(repository, movies, error_file)
+        error_file.flush()
+        stats['saved'] += saved
+        stats['failed'] += len(results) - saved
+
+    def _write_one_by_one(self, repository, movies, error_file):
+        saved = 0
+        for line_no, movie in movies:
+            try:
+                repository.save_many([movie])
+                saved += 1
+            except DatabaseError as e:
+                self._write_error(error_file, line_no, f"저장 실패: {e}")
+        return saved
+
+    @staticmethod
+    def _write_error(error_file, line_no, error):
+        error_file.write(json.dumps({'line': line_no, 'error': error}, ensure_ascii=False) + "\n")
+
+    def _report_progress(self, stats, started_at):
+        processed = stats['saved'] + stats['failed']
+        elapsed = max(time.monotonic() - started_at, 1e-6)
+        self.stdout.write(
+            f"처리 {processed}건 (저장 {stats['saved']}, 오류 {stats['failed']}), {processed / elapsed:.0f}건/초"
+        )
+
+    def _read_checkpoint(self, checkpoint_path, source_path):
+        if not os.path.exists(checkpoint_path):
+            return 0
+        with open(checkpoint_path, encoding='utf-8') as f:
+            checkpoint = json.load(f)
+        if checkpoint.get('source') != os.path.abspath(source_path):
+            raise CommandError(f"체크포인트가 다른 파일의 것입니다: {checkpoint.get('source')}")
+        return checkpoint.get('line', 0)
+
+    def _write_checkpoint(self, checkpoint_path, source_path, line_no):
+        # 배치 커밋 후에만 기록하므로, 중단되더라도 체크포인트 이전 줄은 모두 저장된 상태다.
+        temp_path = f"{checkpoint_path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({'source': os.path.abspath(source_path), 'line': line_no}, f)
+        os.replace(temp_path, checkpoint_path)
@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from src.apps.movie.infrastructure.persistence.rating_projection import MovieRatingProjection
+from src.apps.movie.infrastructure.search.fulltext import SqliteMovieFullTextIndex
+from src.apps.movie.infrastructure.search.ngram_index import KoreanNgramIndex
+
+
+class Command(BaseCommand):
+    help = "영화 키워드 검색용 FTS5 인덱스(movie_search_fts), 한글 n-gram/초성 색인, 평점 정렬 프로젝션을 전체 데이터로 다시 만듭니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500, help="한 번에 색인할 영화 수")
+
+    def handle(self, *args, **options):
+        full_text_index = SqliteMovieFullTextIndex()
+        try:
+            indexed_count = full_text_index.rebuild(batch_size=options['batch_size'])
+        except RuntimeError as e:
+            raise CommandError(str(e))
+        self.stdout.write(self.style.SUCCESS(f"영화 {indexed_count}건의 검색 인덱스를 다시 만들었습니다."))
+
+        movie_count, person_count = KoreanNgramIndex().rebuild(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(
+            f"영화 {movie_count}건, 인물 {person_count}명의 한글 n-gram 색인을 다시 만들었습니다."
+        ))
+
+        rating_count = MovieRatingProjection().rebuild(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f"평점 {rating_count}건의 정렬 프로젝션을 다시 만들었습니다."))
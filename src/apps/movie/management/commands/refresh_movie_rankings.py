@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from src.apps.movie.containers import MovieContainer
+
+
+class Command(BaseCommand):
+    help = "평점, 댓글 활동, 최신성으로 인기/최신 고평점 영화 순위(전체 및 장르별)를 다시 계산합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--list-size', type=int, default=None, help="목록별로 저장할 최대 영화 수")
+
+    def handle(self, *args, **options):
+        list_count, row_count = MovieContainer.movie_ranking_materializer(list_size=options['list_size']).refresh()
+        self.stdout.write(self.style.SUCCESS(f"순위 목록 {list_count}개, 항목 {row_count}건을 다시 계산했습니다."))
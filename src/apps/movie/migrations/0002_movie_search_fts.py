@@ -0,0 +1,44 @@
+from django.db import migrations
+
+FTS_TABLE = "movie_search_fts"
+
+
+def create_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    schema_editor.execute(
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+        "korean_title, original_title, directors, cast_names, "
+        "tokenize = 'unicode61 remove_diacritics 2')"
+    )
+    movie_model = apps.get_model('movie', 'MovieModel')
+    person_table = apps.get_model('movie', 'PersonModel')._meta.db_table
+    directors_table = movie_model.directors.through._meta.db_table
+    cast_table = apps.get_model('movie', 'MovieCastMemberModel')._meta.db_table
+    # 기존 영화 데이터를 색인한다. 이후에는 DjangoMovieRepository.save 또는 rebuild_movie_search_index 명령으로 갱신된다.
+    schema_editor.execute(
+        f"INSERT INTO {FTS_TABLE}(rowid, korean_title, original_title, directors, cast_names) "
+        "SELECT m.id, m.korean_title, COALESCE(m.original_title, ''), "
+        f"COALESCE((SELECT group_concat(p.name, ' ') FROM {directors_table} d "
+        f"JOIN {person_table} p ON p.id = d.personmodel_id WHERE d.moviemodel_id = m.id), ''), "
+        f"COALESCE((SELECT group_concat(p.name, ' ') FROM {cast_table} c "
+        f"JOIN {person_table} p ON p.id = c.actor_id WHERE c.movie_id = m.id), '') "
+        f"FROM {movie_model._meta.db_table} m"
+    )
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    schema_editor.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movie', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,110 @@
+# Generated by Django 4.2.20 on 2026-10-17 22:28
+
+import unicodedata
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+# 마이그레이션은 작성 시점의 규칙으로 고정되어야 하므로 korean_text의 함수를 임포트하지 않고 복사해 둔다.
+HANGUL_SYLLABLE_START = 0xAC00
+HANGUL_SYLLABLE_END = 0xD7A3
+SYLLABLES_PER_CHOSEONG = 588  # 중성 21개 * 종성 28개
+CHOSEONG = (
+    'ㄱ', 'ㄲ', 'ㄴ', 'ㄷ', 'ㄸ', 'ㄹ', 'ㅁ', 'ㅂ', 'ㅃ', 'ㅅ',
+    'ㅆ', 'ㅇ', 'ㅈ', 'ㅉ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ',
+)
+CHOSEONG_SET = frozenset(CHOSEONG)
+BATCH_SIZE = 1000
+
+
+def normalize(text):
+    if not text:
+        return ""
+    return "".join(unicodedata.normalize('NFC', text).casefold().split())
+
+
+def is_hangul_syllable(char):
+    return HANGUL_SYLLABLE_START <= ord(char) <= HANGUL_SYLLABLE_END
+
+
+def extract_choseong(text):
+    return "".join(
+        CHOSEONG[(ord(char) - HANGUL_SYLLABLE_START) // SYLLABLES_PER_CHOSEONG] if is_hangul_syllable(char) else char
+        for char in text
+    )
+
+
+def contains_hangul(text):
+    return any(is_hangul_syllable(char) or char in CHOSEONG_SET for char in text)
+
+
+def index_grams(text):
+    grams = set(text)
+    grams.update(text[i:i + 2] for i in range(len(text) - 1))
+    return grams
+
+
+def backfill_search_grams(apps, schema_editor):
+    # 기존 영화 제목과 인물 이름을 색인한다. 이후에는 DjangoMovieRepository.save와
+    # rebuild_movie_search_index 명령이 갱신한다.
+    # 전체 gram을 메모리에 쌓지 않도록 행을 iterator로 읽고 BATCH_SIZE 단위로 나눠 저장한다.
+    targets = [
+        (apps.get_model('movie', 'MovieModel'), 'korean_title', apps.get_model('movie', 'MovieTitleGramModel'), 'movie_id'),
+        (apps.get_model('movie', 'PersonModel'), 'name', apps.get_model('movie', 'PersonNameGramModel'), 'person_id'),
+    ]
+    for owner_model, text_field, gram_model, owner_field in targets:
+        rows = []
+        for owner_id, text in owner_model.objects.values_list('id', text_field).iterator(chunk_size=2000):
+            normalized = normalize(text)
+            for gram in index_grams(normalized):
+                rows.append(gram_model(**{owner_field: owner_id}, kind='s', gram=gram))
+            if contains_hangul(normalized):
+                for gram in index_grams(extract_choseong(normalized)):
+                    rows.append(gram_model(**{owner_field: owner_id}, kind='c', gram=gram))
+            if len(rows) >= BATCH_SIZE:
+                gram_model.objects.bulk_create(rows, batch_size=BATCH_SIZE)
+                rows = []
+        gram_model.objects.bulk_create(rows, batch_size=BATCH_SIZE)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movie', '0002_movie_search_fts'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PersonNameGramModel',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('kind', models.CharField(choices=[('s', '음절'), ('c', '초성')], max_length=1)),
+                ('gram', models.CharField(max_length=2)),
+                ('person', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='name_grams', to='movie.personmodel')),
+            ],
+            options={
+                'verbose_name': '인물 이름 검색 gram',
+                'verbose_name_plural': '인물 이름 검색 gram 목록',
+                'db_table': 'person_name_grams',
+                'indexes': [models.Index(fields=['kind', 'gram', 'person'], name='person_name_gram_lookup_idx')],
+                'unique_together': {('person', 'kind', 'gram')},
+            },
+        ),
+        migrations.CreateModel(
+            name='MovieTitleGramModel',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('kind', models.CharField(choices=[('s', '음절'), ('c', '초성')], max_length=1)),
+                ('gram', models.CharField(max_length=2)),
+                ('movie', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='title_grams', to='movie.moviemodel')),
+            ],
+            options={
+                'verbose_name': '영화 제목 검색 gram',
+                'verbose_name_plural': '영화 제목 검색 gram 목록',
+                'db_table': 'movie_title_grams',
+                'indexes': [models.Index(fields=['kind', 'gram', 'movie'], name='movie_title_gram_lookup_idx')],
+                'unique_together': {('movie', 'kind', 'gram')},
+            },
+        ),
+        migrations.RunPython(backfill_search_grams, migrations.RunPython.noop),
+    ]
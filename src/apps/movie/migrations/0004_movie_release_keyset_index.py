@@ -0,0 +1,17 @@
+# Generated by Django 4.2.20 on 2026-10-17 22:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movie', '0003_korean_search_grams'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='moviemodel',
+            index=models.Index(fields=['release_date', 'created_at', 'id'], name='movies_release_keyset_idx'),
+        ),
+    ]
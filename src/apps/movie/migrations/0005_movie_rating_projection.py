@@ -0,0 +1,45 @@
+# Generated by Django 4.2.20 on 2026-10-17 22:35
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def backfill_rating_projections(apps, schema_editor):
+    # 기존 플랫폼 평점을 복제한다. 이후에는 MovieRatingProjection.sync와
+    # rebuild_movie_search_index 명령이 갱신한다.
+    rating_model = apps.get_model('movie', 'MoviePlatformRatingModel')
+    projection_model = apps.get_model('movie', 'MovieRatingProjectionModel')
+    rows = [
+        projection_model(movie_id=movie_id, platform_name=platform_name, score=score, movie_created_at=movie_created_at)
+        for movie_id, platform_name, score, movie_created_at in rating_model.objects.values_list(
+            'movie_id', 'platform_name', 'score', 'movie__created_at').iterator()
+    ]
+    projection_model.objects.bulk_create(rows, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movie', '0004_movie_release_keyset_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MovieRatingProjectionModel',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('platform_name', models.CharField(max_length=100)),
+                ('score', models.FloatField()),
+                ('movie_created_at', models.DateTimeField()),
+                ('movie', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='rating_projections', to='movie.moviemodel')),
+            ],
+            options={
+                'verbose_name': '평점 정렬 프로젝션',
+                'verbose_name_plural': '평점 정렬 프로젝션 목록',
+                'db_table': 'movie_rating_projections',
+                'indexes': [models.Index(fields=['platform_name', 'score', 'movie_created_at', 'movie'], name='movie_rating_sort_idx')],
+                'unique_together': {('movie', 'platform_name')},
+            },
+        ),
+        migrations.RunPython(backfill_rating_projections, migrations.RunPython.noop),
+    ]
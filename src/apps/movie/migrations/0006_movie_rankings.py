@@ -0,0 +1,32 @@
+# Generated by Django 4.2.20 on 2026-10-17 22:36
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movie', '0005_movie_rating_projection'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MovieRankingModel',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('list_type', models.CharField(choices=[('popular', '인기'), ('latest_highly_rated', '최신 고평점')], max_length=30)),
+                ('genre', models.CharField(blank=True, default='', max_length=100)),
+                ('position', models.PositiveIntegerField()),
+                ('score', models.FloatField()),
+                ('computed_at', models.DateTimeField()),
+                ('movie', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='rankings', to='movie.moviemodel')),
+            ],
+            options={
+                'verbose_name': '영화 순위',
+                'verbose_name_plural': '영화 순위 목록',
+                'db_table': 'movie_rankings',
+                'unique_together': {('list_type', 'genre', 'position')},
+            },
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 4.2.20 on 2026-10-17 23:36
+
+from django.db import migrations, models
+
+
+def backfill_cast_display_order(apps, schema_editor):
+    # 지금까지는 id순이 출연진 순서였으므로 영화별 id순으로 0부터 번호를 매긴다.
+    cast_model = apps.get_model('movie', 'MovieCastMemberModel')
+    rows, current_movie_id, order = [], None, 0
+    for cast_member in cast_model.objects.order_by('movie_id', 'id').only('id', 'movie_id').iterator(chunk_size=2000):
+        if cast_member.movie_id != current_movie_id:
+            current_movie_id, order = cast_member.movie_id, 0
+        if order:
+            cast_member.display_order = order
+            rows.append(cast_member)
+        order += 1
+        if len(rows) >= 1000:
+            cast_model.objects.bulk_update(rows, ['display_order'])
+            rows = []
+    cast_model.objects.bulk_update(rows, ['display_order'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movie', '0006_movie_rankings'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='moviecastmembermodel',
+            name='display_order',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_cast_display_order, migrations.RunPython.noop),
+    ]
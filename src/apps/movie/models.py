@@ -37,6 +37,10 @@ class MovieModel(models.Model):
         db_table = "movies"
         verbose_name = "영화"
         verbose_name_plural = "영화 목록"
+        indexes = [
+            # 최신 개봉순 목록의 keyset 페이지네이션(release_date, created_at, id)용 인덱스
+            models.Index(fields=['release_date', 'created_at', 'id'], name='movies_release_keyset_idx'),
+        ]
 
     def __str__(self):
         return self.korean_title
@@ -46,6 +50,8 @@ class MovieCastMemberModel(models.Model):
     movie = models.ForeignKey(MovieModel, on_delete=models.CASCADE, related_name="cast_members")
     actor = models.ForeignKey(PersonModel, on_delete=models.CASCADE, related_name="filmography")
     role_name = models.CharField(max_length=100, null=True, blank=True)
+    # 애그리거트의 출연진 순서. (행을 지우고 다시 만들지 않고 순서만 바꿀 수 있도록 id와 분리한다)
+    display_order = models.IntegerField(default=0)
 
     class Meta:
         db_table = "movie_cast_members"
@@ -95,6 +101,29 @@ class MoviePlatformRatingModel(models.Model):
         verbose_name_plural = "플랫폼별 영화 평점 목록"
 
 
+class MovieRatingProjectionModel(models.Model):
+    """
+    평점 정렬용 비정규화 테이블. MoviePlatformRatingModel을 영화 생성 시각과 함께 복제해
+    (platform_name, score, movie_created_at, movie) 인덱스 순서 그대로 플랫폼별 평점순 목록을 읽을 수 있게 한다.
+    MovieRatingProjection.sync가 갱신하며, 직접 수정하지 않는다.
+    """
+    id = models.BigAutoField(primary_key=True)
+    movie = models.ForeignKey(MovieModel, on_delete=models.CASCADE, related_name="rating_projections")
+    platform_name = models.CharField(max_length=100)
+    score = models.FloatField()
+    movie_created_at = models.DateTimeField()
+
+    class Meta:
+        db_table = "movie_rating_projections"
+        unique_together = ('movie', 'platform_name')
+        indexes = [
+            models.Index(fields=['platform_name', 'score', 'movie_created_at', 'movie'],
+                         name='movie_rating_sort_idx'),
+        ]
+        verbose_name = "평점 정렬 프로젝션"
+        verbose_name_plural = "평점 정렬 프로젝션 목록"
+
+
 class OTTPlatformModel(models.Model):
     id = models.AutoField(primary_key=True)
     name = models.CharField(max_length=100, unique=True)
@@ -121,3 +150,61 @@ class MovieOTTAvailabilityModel(models.Model):
         verbose_name = "영화 OTT 시청 정보"
         verbose_name_plural = "영화 OTT 시청 정보 목록"
 
+
+
+class SearchGramKind(models.TextChoices):
+    SYLLABLE = 's', '음절'
+    CHOSEONG = 'c', '초성'
+
+
+class MovieTitleGramModel(models.Model):
+    id = models.BigAutoField(primary_key=True)
+    movie = models.ForeignKey(MovieModel, on_delete=models.CASCADE, related_name="title_grams")
+    kind = models.CharField(max_length=1, choices=SearchGramKind.choices)
+    gram = models.CharField(max_length=2)
+
+    class Meta:
+        db_table = "movie_title_grams"
+        unique_together = ('movie', 'kind', 'gram')
+        indexes = [models.Index(fields=['kind', 'gram', 'movie'], name='movie_title_gram_lookup_idx')]
+        verbose_name = "영화 제목 검색 gram"
+        verbose_name_plural = "영화 제목 검색 gram 목록"
+
+
+class PersonNameGramModel(models.Model):
+    id = models.BigAutoField(primary_key=True)
+    person = models.ForeignKey(PersonModel, on_delete=models.CASCADE, related_name="name_grams")
+    kind = models.CharField(max_length=1, choices=SearchGramKind.choices)
+    gram = models.CharField(max_length=2)
+
+    class Meta:
+        db_table = "person_name_grams"
+        unique_together = ('person', 'kind', 'gram')
+        indexes = [models.Index(fields=['kind', 'gram', 'person'], name='person_name_gram_lookup_idx')]
+        verbose_name = "인물 이름 검색 gram"
+        verbose_name_plural = "인물 이름 검색 gram 목록"
+
+
+class MovieRankingListType(models.TextChoices):
+    POPULAR = 'popular', '인기'
+    LATEST_HIGHLY_RATED = 'latest_highly_rated', '최신 고평점'
+
+
+class MovieRankingModel(models.Model):
+    """
+    refresh_movie_rankings 명령(또는 인프로세스 스케줄러)이 미리 계산해 둔 (목록 유형, 장르)별 영화 순위.
+    genre가 빈 문자열이면 전체 장르 목록이다. position은 1부터 시작한다.
+    """
+    id = models.BigAutoField(primary_key=True)
+    list_type = models.CharField(max_length=30, choices=MovieRankingListType.choices)
+    genre = models.CharField(max_length=100, blank=True, default='')
+    position = models.PositiveIntegerField()
+    movie = models.ForeignKey(MovieModel, on_delete=models.CASCADE, related_name="rankings")
+    score = models.FloatField()
+    computed_at = models.DateTimeField()
+
+    class Meta:
+        db_table = "movie_rankings"
+        unique_together = ('list_type', 'genre', 'position')
+        verbose_name = "영화 순위"
+        verbose_name_plural = "영화 순위 목록"
@@ -158,4 +158,67 @@ def test_get_popular_movies_creates_default_pagination(mock_repositories):
     args, kwargs = mock_search_repo.find_popular_movies.call_args
     assert isinstance(kwargs.get('pagination'), PaginationDto)
     assert kwargs.get('pagination').page_number == 1
-    assert kwargs.get('pagination').page_size == 20
\ No newline at end of file
+    assert kwargs.get('pagination').page_size == 20
+
+# --- get_movie_details 캐시 테스트 ---
+
+# 계약: 캐시에 상세 DTO가 있으면, 서비스는 리포지토리를 호출하지 않고 캐시된 DTO를 반환해야 한다.
+def test_get_movie_details_returns_cached_dto_without_repository(mock_repositories):
+    # --- 1. 준비 (Arrange) ---
+    mock_movie_repo, mock_search_repo = mock_repositories
+    mock_cache = MagicMock()
+    cached_dto = MagicMock(spec=MovieDetailDto)
+    mock_cache.get.return_value = cached_dto
+    service = MovieAppService(mock_movie_repo, mock_search_repo, movie_detail_cache=mock_cache)
+
+    # --- 2. 실행 (Act) ---
+    result = service.get_movie_details(movie_id=123)
+
+    # --- 3. 검증 (Assert) ---
+    mock_cache.get.assert_called_once_with(123)
+    mock_movie_repo.find_by_id.assert_not_called()
+    assert result is cached_dto
+
+
+# 계약: 캐시에 없으면, 서비스는 리포지토리에서 조회한 결과를 DTO로 변환해 캐시에 저장해야 한다.
+#       영화가 없을 때(None)는 캐시에 저장하지 않아야 한다.
+def test_get_movie_details_populates_cache_on_miss(mock_repositories):
+    # --- 1. 준비 (Arrange) ---
+    mock_movie_repo, mock_search_repo = mock_repositories
+    mock_cache = MagicMock()
+    mock_cache.get.return_value = None
+    service = MovieAppService(mock_movie_repo, mock_search_repo, movie_detail_cache=mock_cache)
+    service._movie_aggregate_to_detail_dto = MagicMock(return_value="detail_dto")
+
+    # --- 2. 실행 (Act) ---
+    result = service.get_movie_details(movie_id=123)
+    mock_movie_repo.find_by_id.return_value = None
+    missing = service.get_movie_details(movie_id=999)
+
+    # --- 3. 검증 (Assert) ---
+    assert result == "detail_dto"
+    assert missing is None
+    mock_cache.set.assert_called_once_with(123, "detail_dto")
+
+
+# --- get_movie_details_bulk 메서드 테스트 ---
+
+# 계약: get_movie_details_bulk는 캐시에 없는 영화만 리포지토리에서 한 번에 조회하고,
+#       요청한 순서대로(중복 제거) DTO 목록을 반환해야 한다.
+def test_get_movie_details_bulk_loads_only_cache_misses(mock_repositories):
+    # --- 1. 준비 (Arrange) ---
+    mock_movie_repo, mock_search_repo = mock_repositories
+    mock_cache = MagicMock()
+    mock_cache.get_many.return_value = {2: "cached_2"}
+    movie_1, movie_3 = MagicMock(movie_id=1), MagicMock(movie_id=3)
+    mock_movie_repo.find_by_ids.return_value = [movie_1, movie_3]
+    service = MovieAppService(mock_movie_repo, mock_search_repo, movie_detail_cache=mock_cache)
+    service._movie_aggregate_to_detail_dto = MagicMock(side_effect=lambda movie: f"loaded_{movie.movie_id}")
+
+    # --- 2. 실행 (Act) ---
+    result = service.get_movie_details_bulk([3, 2, 1, 3, 404])
+
+    # --- 3. 검증 (Assert) ---
+    mock_movie_repo.find_by_ids.assert_called_once_with([3, 1, 404])
+    mock_cache.set_many.assert_called_once_with({1: "loaded_1", 3: "loaded_3"})
+    assert result == ["loaded_3", "cached_2", "loaded_1"]
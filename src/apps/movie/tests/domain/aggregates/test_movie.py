@@ -0,0 +1,66 @@
+import unittest
+
+from src.apps.movie.domain.aggregates.movie import Movie, MoviePart
+from src.apps.movie.domain.value_objects.genre_vo import GenreVO
+from src.apps.movie.domain.value_objects.plot_vo import PlotVO
+from src.apps.movie.domain.value_objects.title_info_vo import TitleInfoVO
+
+
+def build_movie():
+    return Movie(
+        movie_id=1,
+        title_info=TitleInfoVO(korean_title="기생충", original_title="Parasite"),
+        plot=PlotVO("반지하 가족 이야기"),
+        release_date=None,
+        runtime=None,
+        poster_image=None,
+        genres=[GenreVO("드라마")],
+        directors=[],
+        cast=[],
+        still_cuts=[],
+        trailers=[],
+        platform_ratings=[],
+        ott_availability=[],
+    )
+
+
+class TestMovieChangeTracking(unittest.TestCase):
+
+    def test_new_movie_has_all_parts_changed(self):
+        # 계약: 새로 만든 애그리거트는 저장되지 않은 상태이며 모든 부분이 변경된 것으로 간주되어야 한다.
+        movie = build_movie()
+        self.assertEqual(movie.changed_parts, MoviePart.ALL)
+        self.assertFalse(movie.is_persisted)
+
+    def test_mark_clean_clears_changes(self):
+        # 계약: mark_clean 이후에는 변경 사항이 없고 저장된 상태여야 한다.
+        movie = build_movie()
+        movie.mark_clean()
+        self.assertFalse(movie.has_changes)
+        self.assertTrue(movie.is_persisted)
+
+    def test_update_plot_marks_only_details(self):
+        # 계약: 줄거리 변경은 DETAILS만 변경으로 기록해야 한다.
+        movie = build_movie()
+        movie.mark_clean()
+        movie.update_plot(PlotVO("새 줄거리"))
+        self.assertEqual(movie.changed_parts, {MoviePart.DETAILS})
+
+    def test_update_plot_with_same_plot_is_not_a_change(self):
+        # 계약: 같은 줄거리로 갱신하면 변경으로 기록하지 않아야 한다.
+        movie = build_movie()
+        movie.mark_clean()
+        movie.update_plot(PlotVO("반지하 가족 이야기"))
+        self.assertFalse(movie.has_changes)
+
+    def test_genre_changes_mark_genres(self):
+        # 계약: 장르 추가/삭제는 GENRES를 변경으로 기록하고, 이미 있는 장르 추가는 변경이 아니어야 한다.
+        movie = build_movie()
+        movie.mark_clean()
+        movie.add_genre(GenreVO("드라마"))
+        self.assertFalse(movie.has_changes)
+        movie.add_genre(GenreVO("스릴러"))
+        self.assertEqual(movie.changed_parts, {MoviePart.GENRES})
+        movie.mark_clean()
+        movie.remove_genre(GenreVO("드라마"))
+        self.assertEqual(movie.changed_parts, {MoviePart.GENRES})
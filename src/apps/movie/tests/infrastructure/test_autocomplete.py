@@ -0,0 +1,123 @@
+import threading
+import time
+
+import pytest
+
+from src.apps.movie.domain.value_objects.actor_vo import ActorVO
+from src.apps.movie.infrastructure.persistence.repositories import DjangoMovieRepository
+from src.apps.movie.infrastructure.search.autocomplete import InMemoryPrefixAutocompleteIndex
+from src.apps.movie.tests.infrastructure.test_movie_repository import build_movie
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def autocomplete_index():
+    return InMemoryPrefixAutocompleteIndex(refresh_interval_seconds=0)
+
+
+@pytest.fixture
+def repository(autocomplete_index):
+    repository = DjangoMovieRepository(autocomplete_index=autocomplete_index)
+    repository.save(build_movie(movie_id=1, korean_title="기생충", cast=[ActorVO(name="송강호")]))
+    repository.save(build_movie(movie_id=2, korean_title="살인의 추억", cast=[ActorVO(name="송강호")]))
+    repository.save(build_movie(movie_id=3, korean_title="송강호 다큐멘터리", cast=[ActorVO(name="송민호")]))
+    return repository
+
+
+def labels(suggestions):
+    return [(s.suggestion_type, s.label) for s in suggestions]
+
+
+# 계약: 접두어로 제목과 인물 이름을 찾고, 출연/연출 편수가 많은 인물이 먼저 나와야 한다.
+def test_suggest_matches_prefix_ordered_by_popularity(repository, autocomplete_index):
+    suggestions = labels(autocomplete_index.suggest("송", 10))
+    assert suggestions[0] == ("person", "송강호")
+    assert set(suggestions[1:]) == {("person", "송민호"), ("movie", "송강호 다큐멘터리")}
+    assert labels(autocomplete_index.suggest("기생", 10)) == [("movie", "기생충")]
+    assert autocomplete_index.suggest("충", 10) == []
+
+
+# 계약: 초성 접두어로도 자동완성되어야 하며, 같은 대상이 중복으로 나오지 않아야 한다.
+def test_suggest_supports_choseong_without_duplicates(repository, autocomplete_index):
+    assert labels(autocomplete_index.suggest("ㄱㅅ", 10)) == [("movie", "기생충")]
+    assert len(autocomplete_index.suggest("ㅅ", 2)) == 2
+
+
+# 계약: 커밋된 저장/삭제는 전체 재구성 없이 인덱스에 바로 반영되어야 한다.
+def test_save_and_delete_update_index_on_commit(repository, autocomplete_index, django_capture_on_commit_callbacks):
+    index = autocomplete_index
+    assert labels(index.suggest("기생", 10)) == [("movie", "기생충")]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        repository.save(build_movie(movie_id=1, korean_title="마더", cast=[ActorVO(name="김혜자")]))
+    with django_capture_on_commit_callbacks(execute=True):
+        repository.delete(2)
+
+    assert index.suggest("기생", 10) == []
+    assert labels(index.suggest("마", 10)) == [("movie", "마더")]
+    assert labels(index.suggest("김혜", 10)) == [("person", "김혜자")]
+    assert index.suggest("살인", 10) == []
+
+
+class StaticRowsAutocompleteIndex(InMemoryPrefixAutocompleteIndex):
+    """DB 대신 고정된 행으로 적재하고 재구성 횟수를 센다."""
+
+    def __init__(self, movie_rows, **kwargs):
+        super().__init__(**kwargs)
+        self.movie_rows = movie_rows
+        self.rebuild_count = 0
+        self.rebuilt = threading.Event()
+
+    def _load_movie_rows(self):
+        time.sleep(0.01)
+        return self.movie_rows
+
+    def _load_person_rows(self):
+        return []
+
+    def rebuild(self):
+        self.rebuild_count += 1
+        super().rebuild()
+        self.rebuilt.set()
+
+
+# 계약: 동기 모드에서 여러 스레드가 동시에 첫 조회를 해도 재구성은 한 번만 일어나야 한다.
+def test_concurrent_first_lookups_rebuild_once():
+    index = StaticRowsAutocompleteIndex([(1, "기생충", 0)], refresh_interval_seconds=0)
+    threads = [threading.Thread(target=index.suggest, args=("기생", 10)) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert index.rebuild_count == 1
+
+
+# 계약: 주기 모드에서는 조회 스레드가 재구성을 기다리지 않고, 백그라운드 스레드 하나가 적재해야 한다.
+def test_periodic_mode_rebuilds_in_background():
+    index = StaticRowsAutocompleteIndex([(1, "기생충", 0)], refresh_interval_seconds=3600)
+    try:
+        for _ in range(5):
+            index.suggest("기생", 10)
+        assert index.rebuilt.wait(5)
+        assert labels(index.suggest("기생", 10)) == [("movie", "기생충")]
+        assert index.rebuild_count == 1
+    finally:
+        index.stop(timeout=5)
+
+
+# 계약: 짧은 접두어도 범위 전체에서 인기순 상위 후보를 돌려줘야 하며, 미리 계산한 목록은 증분 갱신 후에도 정확해야 한다.
+def test_short_prefix_uses_precomputed_top_candidates():
+    rows = [(movie_id, f"가{movie_id:03d}", movie_id) for movie_id in range(1, 101)]
+    index = StaticRowsAutocompleteIndex(rows, refresh_interval_seconds=0, top_size=3)
+
+    assert [s.target_id for s in index.suggest("가", 3)] == [100, 99, 98]
+
+    index.remove_movie(100)
+    index.upsert_movie(99, "나099")
+    index.upsert_movie(101, "가101")
+
+    assert [s.target_id for s in index.suggest("가", 3)] == [98, 97, 96]
+    assert [s.target_id for s in index.suggest("나", 3)] == [99]
+    assert [s.target_id for s in index.suggest("가", 5)][:3] == [98, 97, 96]
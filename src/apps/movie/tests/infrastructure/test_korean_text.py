@@ -0,0 +1,31 @@
+import unittest
+
+from src.apps.movie.infrastructure.search.korean_text import (
+    normalize, extract_choseong, index_grams, query_grams, matches
+)
+
+
+class TestKoreanText(unittest.TestCase):
+
+    def test_normalize_removes_whitespace_and_folds_case(self):
+        # 계약: 정규화는 공백을 제거하고 대소문자를 구분하지 않아야 한다.
+        self.assertEqual(normalize(" 살인의 추억 Memories "), "살인의추억memories")
+
+    def test_extract_choseong_keeps_non_hangul(self):
+        # 계약: 한글 음절은 초성으로, 그 외 문자는 그대로 변환되어야 한다.
+        self.assertEqual(extract_choseong("기생충2"), "ㄱㅅㅊ2")
+        self.assertEqual(extract_choseong("쌍화점"), "ㅆㅎㅈ")
+
+    def test_grams_for_index_and_query(self):
+        # 계약: 색인은 unigram+bigram을, 검색어는 한 글자면 unigram, 그 외에는 bigram을 사용해야 한다.
+        self.assertEqual(index_grams("기생충"), {"기", "생", "충", "기생", "생충"})
+        self.assertEqual(query_grams("충"), {"충"})
+        self.assertEqual(query_grams("기생충"), {"기생", "생충"})
+
+    def test_matches_supports_substring_and_choseong(self):
+        # 계약: 부분 문자열과 초성(혼합 포함) 검색어가 일치해야 하며, 순서가 다른 초성은 일치하지 않아야 한다.
+        self.assertTrue(matches("기생충", "생충"))
+        self.assertTrue(matches("기생충", "ㄱㅅㅊ"))
+        self.assertTrue(matches("기생충", "기ㅅ충"))
+        self.assertFalse(matches("기생충", "ㅅㄱ"))
+        self.assertFalse(matches("기생충", "충기"))
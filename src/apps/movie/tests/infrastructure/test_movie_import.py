@@ -0,0 +1,85 @@
+import io
+import json
+
+import pytest
+from django.core.management import call_command
+from django.db import IntegrityError
+
+from src.apps.movie.infrastructure.persistence.repositories import DjangoMovieRepository
+from src.apps.movie.models import MovieModel
+
+pytestmark = pytest.mark.django_db
+
+
+def write_jsonl(path, records):
+    path.write_text("\n".join(r if isinstance(r, str) else json.dumps(r, ensure_ascii=False) for r in records),
+                    encoding='utf-8')
+    return path
+
+
+@pytest.fixture
+def catalog_file(tmp_path):
+    return write_jsonl(tmp_path / "catalog.jsonl", [
+        {"movie_id": 1, "korean_title": "기생충", "release_date": "2019-05-30", "genres": ["드라마"],
+         "directors": ["봉준호"], "cast": [{"name": "송강호", "role_name": "기택"}, "최우식"]},
+        {"movie_id": 2, "korean_title": "", "genres": []},
+        "{깨진 줄",
+        {"movie_id": 3, "korean_title": "마더", "runtime_minutes": 128, "directors": [{"name": "봉준호"}]},
+    ])
+
+
+# 계약: 유효한 행은 저장하고, 검증 실패/형식 오류 행은 줄 번호와 함께 오류 파일에 기록해야 한다.
+@pytest.mark.parametrize("workers", [0, 2])
+def test_import_movies_saves_valid_rows_and_reports_errors(catalog_file, workers):
+    call_command('import_movies', str(catalog_file), batch_size=2, workers=workers)
+
+    assert sorted(MovieModel.objects.values_list('id', flat=True)) == [1, 3]
+    parasite = DjangoMovieRepository().find_by_id(1)
+    assert [(a.name, a.role_name) for a in parasite.cast] == [("송강호", "기택"), ("최우식", None)]
+    errors = [json.loads(line) for line in (catalog_file.parent / "catalog.jsonl.errors.jsonl").read_text().splitlines()]
+    assert [error['line'] for error in errors] == [2, 3]
+
+
+# 계약: 배치 저장이 DB 오류로 실패하면 그 배치만 한 건씩 다시 저장하고, 실패한 행은 오류 파일과 통계에 남겨야 한다.
+def test_import_movies_retries_failed_batch_row_by_row(catalog_file, monkeypatch):
+    save_many = DjangoMovieRepository.save_many
+
+    def save_many_rejecting_mother(self, movies):
+        if any(movie.movie_id == 3 for movie in movies):
+            raise IntegrityError("UNIQUE constraint failed")
+        return save_many(self, movies)
+
+    monkeypatch.setattr(DjangoMovieRepository, 'save_many', save_many_rejecting_mother)
+
+    stdout = io.StringIO()
+    call_command('import_movies', str(catalog_file), batch_size=4, workers=0, stdout=stdout, stderr=io.StringIO())
+
+    assert list(MovieModel.objects.values_list('id', flat=True)) == [1]
+    assert "저장 1건, 오류 3건" in stdout.getvalue()
+    errors = [json.loads(line) for line in (catalog_file.parent / "catalog.jsonl.errors.jsonl").read_text().splitlines()]
+    assert [error['line'] for error in errors] == [2, 3, 4]
+    assert json.loads((catalog_file.parent / "catalog.jsonl.checkpoint").read_text())['line'] == 4
+
+
+# 계약: --resume은 체크포인트에 기록된 줄 이후부터만 가져와야 한다.
+def test_import_movies_resumes_from_checkpoint(catalog_file):
+    checkpoint = catalog_file.parent / "catalog.jsonl.checkpoint"
+    checkpoint.write_text(json.dumps({'source': str(catalog_file.resolve()), 'line': 3}))
+
+    call_command('import_movies', str(catalog_file), workers=0, resume=True)
+
+    assert list(MovieModel.objects.values_list('id', flat=True)) == [3]
+    assert json.loads(checkpoint.read_text())['line'] == 4
+
+
+# 계약: CSV는 '|'로 목록을, '이름:배역'으로 출연진을 구분해 JSONL과 같은 방식으로 가져와야 한다.
+def test_import_movies_reads_csv(tmp_path):
+    csv_file = tmp_path / "catalog.csv"
+    csv_file.write_text("movie_id,korean_title,genres,directors,cast\n"
+                        "7,살인의 추억,드라마|스릴러,봉준호,송강호:박두만|김상경:서태윤\n", encoding='utf-8')
+
+    call_command('import_movies', str(csv_file), workers=0)
+
+    movie = DjangoMovieRepository().find_by_id(7)
+    assert [g.name for g in movie.genres] == ["드라마", "스릴러"]
+    assert [(a.name, a.role_name) for a in movie.cast] == [("송강호", "박두만"), ("김상경", "서태윤")]
@@ -0,0 +1,131 @@
+import datetime
+import threading
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.utils import timezone
+
+from src.apps.movie.application.dtos import PaginationDto
+from src.apps.movie.infrastructure.persistence.repositories import DjangoMovieSearchRepository
+from src.apps.movie.infrastructure.ranking.materializer import MovieRankingMaterializer
+from src.apps.movie.infrastructure.ranking.scheduler import MovieRankingScheduler
+from src.apps.review_community.infrastructure.comment_activity import DjangoMovieCommentActivityReader
+from src.apps.movie.models import MovieModel, GenreModel, MoviePlatformRatingModel, MovieRankingModel
+from src.apps.review_community.infrastructure.comment_stats import MovieCommentStats
+from src.apps.review_community.models import CommentModel
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def catalog():
+    today = timezone.localdate()
+    drama, thriller = GenreModel.objects.create(name="드라마"), GenreModel.objects.create(name="스릴러")
+    quiet = MovieModel.objects.create(korean_title="조용한 영화", release_date=today - datetime.timedelta(days=10))
+    talked = MovieModel.objects.create(korean_title="화제작", release_date=today - datetime.timedelta(days=900))
+    fresh = MovieModel.objects.create(korean_title="신작", release_date=today - datetime.timedelta(days=5))
+    quiet.genres.set([drama])
+    talked.genres.set([drama, thriller])
+    fresh.genres.set([thriller])
+    MoviePlatformRatingModel.objects.create(movie=quiet, platform_name="IMDb", score=9.0)
+    MoviePlatformRatingModel.objects.create(movie=talked, platform_name="IMDb", score=9.5)
+    MoviePlatformRatingModel.objects.create(movie=fresh, platform_name="IMDb", score=7.0)
+
+    author = get_user_model().objects.create_user(email_address="rank@example.com", nickname="랭커")
+    for _ in range(3):
+        CommentModel.objects.create(movie=talked, author=author, content="재밌어요")
+    CommentModel.objects.create(movie=fresh, author=author, content="기대돼요")
+    MovieCommentStats().reconcile()
+    return {'quiet': quiet, 'talked': talked, 'fresh': fresh}
+
+
+def ranked_ids(list_type, genre=None, **pagination):
+    result = DjangoMovieSearchRepository().find_popular_movies(list_type, genre, PaginationDto(**pagination))
+    return [movie.movie_id for movie in result.movies]
+
+
+# 계약: 인기 목록은 댓글 활동순, 최신 고평점 목록은 최근 개봉작만 감쇠 평점순으로, 장르별 목록도 함께 계산되어야 한다.
+def test_refresh_materializes_lists_per_type_and_genre(catalog):
+    call_command('refresh_movie_rankings')
+
+    assert ranked_ids('popular') == [catalog['talked'].id, catalog['fresh'].id, catalog['quiet'].id]
+    assert ranked_ids('latest_highly_rated') == [catalog['quiet'].id, catalog['fresh'].id]
+    assert ranked_ids('popular', genre="드라마") == [catalog['talked'].id, catalog['quiet'].id]
+    assert ranked_ids('latest_highly_rated', genre="스릴러") == [catalog['fresh'].id]
+
+
+# 계약: 순위 목록은 page_number와 cursor 모드 모두 position 순으로 페이지를 나눠야 한다.
+def test_ranked_list_paginates_by_position(catalog):
+    MovieRankingMaterializer(DjangoMovieCommentActivityReader()).refresh()
+    repository = DjangoMovieSearchRepository()
+
+    first = repository.find_popular_movies('popular', None, PaginationDto(page_size=2))
+    second = repository.find_popular_movies('popular', None, PaginationDto(page_size=2, cursor=first.next_cursor))
+
+    assert (first.total_results, first.total_pages) == (3, 2)
+    assert [m.movie_id for m in first.movies + second.movies] == ranked_ids('popular', page_size=10)
+    assert ranked_ids('popular', page_number=2, page_size=2) == [m.movie_id for m in second.movies]
+
+
+# 계약: 순위가 있으면 존재 확인 쿼리 없이 페이지만 읽고, 신호를 읽는 사이에 추가된 영화는 건너뛰어야 한다.
+def test_ranked_page_skips_exists_query_and_tolerates_new_movies(catalog, django_assert_num_queries):
+    class InsertingActivityReader(DjangoMovieCommentActivityReader):
+        def comment_counts(self):
+            late = MovieModel.objects.create(korean_title="계산 중 추가된 영화")
+            CommentModel.objects.create(movie=late, author=CommentModel.objects.first().author, content="첫 댓글")
+            MovieCommentStats().reconcile()
+            return super().comment_counts()
+
+    MovieRankingMaterializer(InsertingActivityReader()).refresh()
+
+    with django_assert_num_queries(1):
+        result = DjangoMovieSearchRepository().find_popular_movies('popular', None, PaginationDto(page_size=10))
+    assert [m.movie_id for m in result.movies] == [catalog['talked'].id, catalog['fresh'].id, catalog['quiet'].id]
+
+
+# 계약: 순위 갱신 스레드는 앱 로딩 때가 아니라 순위 목록을 처음 조회할 때 프로세스마다 한 번만 시작되고, 주기가 없으면 시작하지 않아야 한다.
+def test_ranking_scheduler_starts_lazily_on_first_ranked_read(catalog):
+    class CountingMaterializer:
+        def __init__(self):
+            self.refreshed = threading.Event()
+
+        def refresh(self):
+            self.refreshed.set()
+
+    materializer = CountingMaterializer()
+    scheduler = MovieRankingScheduler(materializer, interval_seconds=3600)
+    disabled = MovieRankingScheduler(materializer)
+    assert scheduler._thread is None and not disabled.is_enabled
+
+    DjangoMovieSearchRepository(ranking_scheduler=disabled).find_popular_movies('popular', None, PaginationDto())
+    assert disabled._thread is None
+
+    repository = DjangoMovieSearchRepository(ranking_scheduler=scheduler)
+    repository.find_popular_movies('popular', None, PaginationDto())
+    started = scheduler._thread
+    repository.find_popular_movies('popular', None, PaginationDto())
+
+    assert started.is_alive() and scheduler._thread is started
+    assert materializer.refreshed.wait(5)
+    scheduler.stop(5)
+    assert not started.is_alive()
+
+
+# 계약: 순위가 계산되지 않은 목록은 최신 개봉순으로 대신하고, 알 수 없는 목록 유형은 ValueError여야 한다.
+def test_missing_rankings_fall_back_and_unknown_type_is_rejected(catalog):
+    assert not MovieRankingModel.objects.exists()
+    assert ranked_ids('popular') == ranked_ids('latest')
+
+
+# 계약: 목록 항목은 댓글 통계(댓글 수, 마지막 댓글 시각)를 함께 반환하고, 댓글이 없는 영화는 0건이어야 한다.
+def test_list_items_expose_comment_stats(catalog):
+    result = DjangoMovieSearchRepository().find_popular_movies('latest', None, PaginationDto(page_size=10))
+    items = {movie.movie_id: movie for movie in result.movies}
+
+    assert items[catalog['talked'].id].comment_count == 3
+    assert items[catalog['talked'].id].last_comment_at is not None
+    assert (items[catalog['quiet'].id].comment_count, items[catalog['quiet'].id].last_comment_at) == (0, None)
+
+    with pytest.raises(ValueError):
+        ranked_ids('most_hated')
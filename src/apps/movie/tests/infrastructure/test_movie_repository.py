@@ -0,0 +1,198 @@
+import pytest
+from unittest.mock import MagicMock
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from src.apps.movie.domain.aggregates.movie import Movie
+from src.apps.movie.domain.value_objects.actor_vo import ActorVO
+from src.apps.movie.domain.value_objects.director_vo import DirectorVO
+from src.apps.movie.domain.value_objects.genre_vo import GenreVO
+from src.apps.movie.domain.value_objects.plot_vo import PlotVO
+from src.apps.movie.domain.value_objects.title_info_vo import TitleInfoVO
+from src.apps.movie.infrastructure.cache.detail_cache import DjangoMovieDetailCache
+from src.apps.movie.infrastructure.persistence.query_guard import UnexpectedQueryError
+from src.apps.movie.infrastructure.persistence.repositories import DjangoMovieRepository
+from src.apps.movie.models import MovieModel, MovieOTTAvailabilityModel, OTTPlatformModel, MoviePlatformRatingModel, \
+    MovieCastMemberModel, PersonModel
+
+pytestmark = pytest.mark.django_db
+
+
+def build_movie(movie_id=1, korean_title="기생충", plot="반지하 가족 이야기", cast=None):
+    return Movie(
+        movie_id=movie_id,
+        title_info=TitleInfoVO(korean_title=korean_title, original_title="Parasite"),
+        plot=PlotVO(text=plot),
+        release_date=None,
+        runtime=None,
+        poster_image=None,
+        genres=[GenreVO("드라마")],
+        directors=[DirectorVO(name="봉준호")],
+        cast=cast if cast is not None else [ActorVO(name="송강호", role_name="기택")],
+        still_cuts=[],
+        trailers=[],
+        platform_ratings=[],
+        ott_availability=[],
+    )
+
+
+# 계약: save와 delete는 해당 영화의 상세 캐시를 무효화해야 한다.
+def test_save_and_delete_invalidate_detail_cache():
+    mock_cache = MagicMock()
+    repository = DjangoMovieRepository(detail_cache=mock_cache)
+
+    repository.save(build_movie(movie_id=7))
+    repository.delete(7)
+
+    assert [c.args for c in mock_cache.invalidate.call_args_list] == [(7,), (7,)]
+
+
+# 계약: DjangoMovieDetailCache는 저장한 DTO를 돌려주고, 무효화 후에는 None을 반환해야 한다.
+def test_django_detail_cache_round_trip_and_invalidate():
+    cache = DjangoMovieDetailCache()
+    cache.set(3, {"movie_id": 3})
+
+    assert cache.get(3) == {"movie_id": 3}
+    cache.invalidate(3)
+    assert cache.get(3) is None
+
+
+# 계약: find_by_id는 출연진/OTT 수와 관계없이 고정된 개수(8개)의 쿼리로 애그리거트를 만들어야 하며,
+#       strict 모드에서 매퍼는 SQL을 실행하지 않아야 한다.
+def test_find_by_id_uses_fixed_number_of_queries(settings, django_assert_num_queries):
+    repository = DjangoMovieRepository()
+    repository.save(build_movie(movie_id=5, cast=[ActorVO(name="송강호"), ActorVO(name="최우식")]))
+    for name in ["넷플릭스", "왓챠"]:
+        platform = OTTPlatformModel.objects.create(name=name)
+        MovieOTTAvailabilityModel.objects.create(movie_id=5, platform=platform)
+    MoviePlatformRatingModel.objects.create(movie_id=5, platform_name="IMDb", score=8.5)
+    settings.MOVIE_STRICT_AGGREGATE_MAPPING = True
+
+    with django_assert_num_queries(8):
+        found = repository.find_by_id(5)
+
+    assert len(found.cast) == 2
+    assert [o.platform_name for o in found.ott_availability] == ["넷플릭스", "왓챠"]
+
+
+# 계약: strict 모드에서 prefetch 없이 매핑하면 UnexpectedQueryError가 발생해야 한다.
+def test_strict_mapping_rejects_unprefetched_model(settings):
+    DjangoMovieRepository().save(build_movie(movie_id=6))
+    settings.MOVIE_STRICT_AGGREGATE_MAPPING = True
+
+    with pytest.raises(UnexpectedQueryError):
+        DjangoMovieRepository()._to_domain_object(MovieModel.objects.get(id=6))
+
+
+# 계약: find_by_ids는 영화 수와 관계없이 고정된 개수의 쿼리로 요청 순서대로 애그리거트를 반환해야 한다.
+def test_find_by_ids_hydrates_many_movies_with_constant_queries(settings, django_assert_num_queries):
+    repository = DjangoMovieRepository()
+    for movie_id in range(1, 6):
+        repository.save(build_movie(movie_id=movie_id, korean_title=f"영화{movie_id}",
+                                    cast=[ActorVO(name=f"배우{movie_id}"), ActorVO(name="공통배우")]))
+    settings.MOVIE_STRICT_AGGREGATE_MAPPING = True
+
+    with django_assert_num_queries(8):
+        movies = repository.find_by_ids([4, 999, 2, 5])
+
+    assert [movie.movie_id for movie in movies] == [4, 2, 5]
+    assert [actor.name for actor in movies[0].cast] == ["배우4", "공통배우"]
+
+
+def count_save_queries(repository, movie):
+    with CaptureQueriesContext(connection) as captured:
+        repository.save(movie)
+    return len(captured.captured_queries)
+
+
+# 계약: save의 쿼리 수는 출연진/감독 수와 무관해야 하고, 배역명이 저장되어야 한다.
+def test_save_uses_set_based_queries_and_persists_role_names():
+    repository = DjangoMovieRepository()
+    small_cast = [ActorVO(name=f"배우{i}", role_name=f"역할{i}") for i in range(2)]
+    large_cast = [ActorVO(name=f"배우{i}", role_name=f"역할{i}") for i in range(40)]
+    # 장르/인물을 미리 만들어 두 저장의 조건을 맞춘다. (새 인물 색인 비용은 인물 수에 비례한다)
+    repository.save(build_movie(movie_id=9, cast=large_cast))
+
+    small = count_save_queries(repository, build_movie(movie_id=1, cast=small_cast))
+    large = count_save_queries(repository, build_movie(movie_id=2, cast=large_cast))
+
+    assert small == large
+    assert [actor.role_name for actor in repository.find_by_id(2).cast] == [f"역할{i}" for i in range(40)]
+    assert PersonModel.objects.filter(name__startswith="배우").count() == 40
+
+
+# 계약: 출연진 변경 시 (배우, 배역)이 같은 기존 행은 순서가 바뀌어도 유지하고, 바뀐 행만 삭제/추가해야 한다.
+def test_save_diffs_cast_members():
+    repository = DjangoMovieRepository()
+    cast = [ActorVO(name="송강호", role_name="기택"), ActorVO(name="이선균", role_name="동익")]
+    repository.save(build_movie(movie_id=3, cast=cast))
+    original_ids = list(MovieCastMemberModel.objects.filter(movie_id=3).order_by('id').values_list('id', flat=True))
+
+    repository.save(build_movie(movie_id=3, cast=[ActorVO(name="조여정", role_name="연교"), *cast]))
+    prepended_ids = list(MovieCastMemberModel.objects.filter(movie_id=3).order_by('id').values_list('id', flat=True))
+    prepended_cast = [(a.name, a.role_name) for a in repository.find_by_id(3).cast]
+    repository.save(build_movie(movie_id=3, cast=[ActorVO(name="이선균", role_name="박사장"), cast[0]]))
+
+    assert prepended_ids[:2] == original_ids
+    assert prepended_cast == [("조여정", "연교"), ("송강호", "기택"), ("이선균", "동익")]
+    assert MovieCastMemberModel.objects.filter(movie_id=3).order_by('id').first().id == original_ids[0]
+    assert [(a.name, a.role_name) for a in repository.find_by_id(3).cast] == [("이선균", "박사장"), ("송강호", "기택")]
+
+
+# 계약: save_many는 영화 수와 무관한 쿼리 수로 여러 애그리거트를 저장하고, 기존 영화는 갱신해야 한다.
+def test_save_many_uses_constant_queries():
+    repository = DjangoMovieRepository()
+    repository.save_many([build_movie(movie_id=i, korean_title=f"예열{i}") for i in (90, 91)])
+
+    with CaptureQueriesContext(connection) as two:
+        repository.save_many([build_movie(movie_id=1, korean_title="영화1"), build_movie(movie_id=90)])
+    with CaptureQueriesContext(connection) as many:
+        repository.save_many([build_movie(movie_id=i, korean_title=f"영화{i}") for i in range(3, 12)] +
+                             [build_movie(movie_id=1, korean_title="바뀐 제목"), build_movie(movie_id=91)])
+
+    assert len(many.captured_queries) == len(two.captured_queries)
+    assert repository.find_by_id(1).title_info.korean_title == "바뀐 제목"
+    assert [actor.role_name for actor in repository.find_by_id(11).cast] == ["기택"]
+
+
+# 계약: 불러온 뒤 변경하지 않은 애그리거트를 저장하면 쿼리를 실행하지 않고 같은 객체를 반환해야 한다.
+def test_save_unchanged_loaded_movie_is_noop(django_assert_num_queries):
+    repository = DjangoMovieRepository()
+    repository.save(build_movie(movie_id=4))
+    movie = repository.find_by_id(4)
+
+    with django_assert_num_queries(0):
+        saved = repository.save(movie)
+
+    assert saved is movie
+
+
+# 계약: 줄거리만 바꾼 저장은 movies 행만 갱신하고 출연진/장르 행은 다시 쓰지 않아야 한다.
+def test_save_plot_change_keeps_cast_rows():
+    repository = DjangoMovieRepository()
+    repository.save(build_movie(movie_id=4, cast=[ActorVO(name="송강호", role_name="기택")]))
+    cast_ids = list(MovieCastMemberModel.objects.filter(movie_id=4).values_list('id', flat=True))
+    movie = repository.find_by_id(4)
+    movie.update_plot(PlotVO(text="새 줄거리"))
+
+    with CaptureQueriesContext(connection) as captured:
+        saved = repository.save(movie)
+
+    writes = [query['sql'] for query in captured.captured_queries if not query['sql'].startswith("SELECT")]
+    assert not any("movie_cast_members" in sql or "movies_genres" in sql for sql in writes)
+    assert not saved.has_changes
+    assert list(MovieCastMemberModel.objects.filter(movie_id=4).values_list('id', flat=True)) == cast_ids
+    assert MovieModel.objects.get(id=4).plot == "새 줄거리"
+
+
+# 계약: 불러온 뒤 행이 삭제된 애그리거트를 저장하면 조용히 넘어가지 않고 ValueError여야 한다.
+def test_save_persisted_movie_with_deleted_row_raises():
+    repository = DjangoMovieRepository()
+    repository.save(build_movie(movie_id=4))
+    movie = repository.find_by_id(4)
+    MovieModel.objects.filter(id=4).delete()
+    movie.update_plot(PlotVO(text="새 줄거리"))
+
+    with pytest.raises(ValueError):
+        repository.save(movie)
+    assert movie.has_changes
@@ -0,0 +1,263 @@
+import datetime
+
+import pytest
+from django.core.cache import caches
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from src.apps.movie.application.dtos import MovieSearchCriteriaDto, PaginationDto, SortOptionDto
+from src.apps.movie.domain.value_objects.actor_vo import ActorVO
+from src.apps.movie.infrastructure.persistence.repositories import DjangoMovieRepository, DjangoMovieSearchRepository
+from src.apps.movie.infrastructure.cache.count_cache import DjangoSearchCountCache
+from src.apps.movie.infrastructure.persistence.keyset import InvalidCursorError
+from src.apps.movie.infrastructure.persistence.rating_projection import MovieRatingProjection
+from src.apps.movie.infrastructure.search.fulltext import SqliteMovieFullTextIndex
+from src.apps.movie.models import MovieModel, MoviePlatformRatingModel, MovieRatingProjectionModel
+from src.apps.movie.tests.infrastructure.test_movie_repository import build_movie
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def saved_movies():
+    repository = DjangoMovieRepository()
+    repository.save(build_movie(movie_id=1, korean_title="기생충", cast=[ActorVO(name="송강호")]))
+    repository.save(build_movie(movie_id=2, korean_title="살인의 추억", cast=[ActorVO(name="송강호")]))
+    repository.save(build_movie(movie_id=3, korean_title="송강호 다큐멘터리", cast=[ActorVO(name="김배우")]))
+    return repository
+
+
+def search_ids(keyword):
+    result = DjangoMovieSearchRepository().search_movies(MovieSearchCriteriaDto(keyword=keyword))
+    return [movie.movie_id for movie in result.movies]
+
+
+# 계약: 키워드 검색은 FTS 인덱스를 통해 제목 접두어, 감독, 출연진 이름으로 영화를 찾아야 한다.
+def test_keyword_search_matches_titles_and_people(saved_movies):
+    assert search_ids("기생") == [1]
+    assert search_ids("PARASITE") != []
+    assert sorted(search_ids("봉준호")) == [1, 2, 3]
+
+
+# 계약: 정렬 조건이 없으면 bm25 순으로 정렬되어, 제목에 일치한 영화가 출연진에 일치한 영화보다 앞서야 한다.
+def test_keyword_search_ranks_title_matches_first(saved_movies):
+    assert search_ids("송강호")[0] == 3
+
+
+# 계약: bm25 정렬은 FTS 테이블을 한 번 조인해 계산하므로 페이지 쿼리에서 MATCH는 한 번만 실행되어야 한다.
+def test_keyword_search_joins_fts_once(saved_movies):
+    with CaptureQueriesContext(connection) as captured:
+        search_ids("송강호")
+
+    page_sql = next(query['sql'] for query in captured.captured_queries if 'bm25' in query['sql'])
+    assert page_sql.count(' MATCH ') == 1
+
+
+# 계약: FTS 연산자가 포함된 검색어도 오류 없이 일반 텍스트로 처리되어야 한다.
+def test_keyword_search_escapes_fts_syntax(saved_movies):
+    assert search_ids('기생" OR "*') == []
+
+
+# 계약: save/delete 후 인덱스가 갱신되고, rebuild 명령은 인덱스를 DB 내용으로 다시 만들어야 한다.
+def test_index_follows_save_delete_and_rebuild(saved_movies):
+    saved_movies.save(build_movie(movie_id=1, korean_title="마더"))
+    saved_movies.delete(2)
+    assert search_ids("기생") == []
+    assert search_ids("마더") == [1]
+    assert search_ids("살인") == []
+
+    MovieModel.objects.filter(id=3).update(korean_title="괴물")
+    call_command('rebuild_movie_search_index')
+    assert search_ids("괴물") == [3]
+
+
+# 계약: 검색어 토큰은 각각 인용된 접두어 질의로 변환되어야 한다.
+def test_build_match_query_quotes_each_token():
+    assert SqliteMovieFullTextIndex.build_match_query(' 기생 "충" ') == '"기생"* """충"""*'
+    assert SqliteMovieFullTextIndex.build_match_query("   ") is None
+
+
+# 계약: 한글 부분 음절과 초성 검색어로도 제목과 인물 이름을 통해 영화를 찾아야 한다.
+def test_keyword_search_supports_korean_partial_and_choseong(saved_movies):
+    assert search_ids("생충") == [1]
+    assert search_ids("ㄱㅅㅊ") == [1]
+    assert sorted(search_ids("ㅂㅈㅎ")) == [1, 2, 3]
+    assert sorted(search_ids("강호")) == [1, 2, 3]
+    assert search_ids("ㅊㄱ") == []
+
+
+# 계약: 제목이 바뀌면 save가 제목 n-gram 색인도 갱신해야 한다.
+def test_korean_index_follows_title_changes(saved_movies):
+    saved_movies.save(build_movie(movie_id=1, korean_title="마더"))
+
+    assert search_ids("ㄱㅅㅊ") == []
+    assert search_ids("ㅁㄷ") == [1]
+
+
+def walk_cursor_pages(fetch_page, page_size=2):
+    movie_ids, cursor = [], None
+    while True:
+        result = fetch_page(PaginationDto(page_size=page_size, cursor=cursor))
+        movie_ids.extend(movie.movie_id for movie in result.movies)
+        cursor = result.next_cursor
+        if cursor is None:
+            return movie_ids
+
+
+@pytest.fixture
+def dated_movies():
+    release_dates = [datetime.date(2020, 1, 1), None, datetime.date(2021, 5, 5), datetime.date(2020, 1, 1), None]
+    return [MovieModel.objects.create(korean_title=f"영화{i}", release_date=release_date)
+            for i, release_date in enumerate(release_dates)]
+
+
+# 계약: 커서 모드로 끝까지 넘기면 page_number 모드와 같은 순서로 중복/누락 없이 모든 영화를 돌려줘야 한다.
+def test_popular_movies_cursor_walk_matches_offset_order(dated_movies):
+    repository = DjangoMovieSearchRepository()
+    offset_ids = [movie.movie_id for movie in repository.find_popular_movies(
+        'latest', None, PaginationDto(page_size=10)).movies]
+
+    cursor_ids = walk_cursor_pages(lambda pagination: repository.find_popular_movies('latest', None, pagination))
+
+    assert cursor_ids == offset_ids
+    assert len(cursor_ids) == len(dated_movies)
+    assert offset_ids[0] == dated_movies[2].id
+    assert set(offset_ids[-2:]) == {dated_movies[1].id, dated_movies[4].id}
+
+
+# 계약: 다음 페이지 조회 전에 앞쪽에 영화가 추가되어도 커서 이후의 결과는 밀리지 않아야 한다.
+def test_cursor_page_is_stable_under_inserts(dated_movies):
+    repository = DjangoMovieSearchRepository()
+    first_page = repository.find_popular_movies('latest', None, PaginationDto(page_size=2))
+    expected_second = repository.find_popular_movies('latest', None, PaginationDto(page_number=2, page_size=2))
+
+    MovieModel.objects.create(korean_title="새 영화", release_date=datetime.date(2030, 1, 1))
+    second_page = repository.find_popular_movies(
+        'latest', None, PaginationDto(page_size=2, cursor=first_page.next_cursor))
+
+    assert [m.movie_id for m in second_page.movies] == [m.movie_id for m in expected_second.movies]
+    assert second_page.current_page is None
+
+
+# 계약: 정렬 조건(평점, 제목)과 검색 순위 정렬에서도 커서 모드가 동작해야 한다.
+def test_search_cursor_walk_for_each_sort(saved_movies, dated_movies):
+    repository = DjangoMovieSearchRepository()
+    sorts = [None, SortOptionDto('title', 'asc'), SortOptionDto('release_date', 'asc'),
+             SortOptionDto('rating', 'desc', rating_platform='IMDb')]
+    for keyword in [None, "송강호"]:
+        for sort_by in sorts:
+            def fetch(pagination):
+                return repository.search_movies(
+                    MovieSearchCriteriaDto(keyword=keyword, sort_by=sort_by, pagination=pagination))
+            offset_ids = [movie.movie_id for movie in fetch(PaginationDto(page_size=20)).movies]
+            assert walk_cursor_pages(fetch) == offset_ids
+
+
+# 계약: 변조되었거나 다른 정렬에서 만든 커서는 ValueError로 거부되어야 한다.
+def test_invalid_or_mismatched_cursor_is_rejected(dated_movies):
+    repository = DjangoMovieSearchRepository()
+    popular_cursor = repository.find_popular_movies('latest', None, PaginationDto(page_size=1)).next_cursor
+
+    with pytest.raises(InvalidCursorError):
+        repository.find_popular_movies('latest', None, PaginationDto(cursor="not-a-cursor"))
+    with pytest.raises(ValueError):
+        repository.search_movies(MovieSearchCriteriaDto(pagination=PaginationDto(cursor=popular_cursor)))
+
+
+# 계약: 마지막 페이지까지 읽었다면 COUNT 없이 개수를 확정하고, 중간 페이지는 COUNT 결과를 캐시해 재사용해야 한다.
+def test_counts_skip_query_on_last_page_and_are_cached(dated_movies, django_assert_num_queries):
+    caches['movie_search_count'].clear()
+    repository = DjangoMovieSearchRepository(count_cache=DjangoSearchCountCache())
+
+    with django_assert_num_queries(1):
+        result = repository.find_popular_movies('latest', None, PaginationDto(page_size=10))
+    assert (result.total_results, result.is_total_exact) == (5, True)
+
+    with django_assert_num_queries(2):
+        repository.find_popular_movies('latest', None, PaginationDto(page_size=2))
+    with django_assert_num_queries(1):
+        result = repository.find_popular_movies('latest', None, PaginationDto(page_number=2, page_size=2))
+    assert (result.total_results, result.total_pages) == (5, 3)
+
+
+# 계약: 개수 캐시 키는 검색과 같은 공백 토큰화를 따라야 한다. (대소문자/여분 공백만 다르면 같은 키, 띄어쓰기가 다르면 다른 키)
+def test_count_cache_key_follows_search_tokenization():
+    key = DjangoMovieSearchRepository._keyword_count_key
+
+    assert key(" Harry  POTTER ") == key("harry potter")
+    assert key("해리 포터") != key("해리포터")
+    assert key("   ") is None
+
+
+# 계약: estimated 모드는 상한을 넘는 개수를 상한값과 is_total_exact=False로 돌려줘야 한다.
+def test_estimated_count_is_capped(dated_movies, settings):
+    settings.MOVIE_SEARCH_COUNT_ESTIMATE_CAP = 3
+    repository = DjangoMovieSearchRepository()
+
+    estimated = repository.search_movies(
+        MovieSearchCriteriaDto(pagination=PaginationDto(page_size=1, count_mode='estimated')))
+    exact = repository.search_movies(MovieSearchCriteriaDto(pagination=PaginationDto(page_size=1)))
+
+    assert (estimated.total_results, estimated.is_total_exact) == (3, False)
+    assert (exact.total_results, exact.is_total_exact) == (5, True)
+
+
+def rating_sorted_ids(direction, platform='IMDb'):
+    result = DjangoMovieSearchRepository().search_movies(
+        MovieSearchCriteriaDto(sort_by=SortOptionDto('rating', direction, rating_platform=platform)))
+    return [(movie.movie_id, movie.rating) for movie in result.movies]
+
+
+# 계약: 평점 정렬은 비정규화 프로젝션을 사용하고, 해당 플랫폼 평점이 없는 영화는 방향과 무관하게 맨 뒤에 와야 한다.
+def test_rating_sort_uses_projection_and_puts_unrated_last(dated_movies):
+    first, second, unrated = dated_movies[0], dated_movies[1], dated_movies[2]
+    MoviePlatformRatingModel.objects.create(movie=first, platform_name='IMDb', score=7.5)
+    MoviePlatformRatingModel.objects.create(movie=second, platform_name='IMDb', score=8.8)
+    MoviePlatformRatingModel.objects.create(movie=unrated, platform_name='Watcha', score=9.9)
+    MovieRatingProjection().sync([movie.id for movie in dated_movies])
+
+    with CaptureQueriesContext(connection) as captured:
+        descending = rating_sorted_ids('desc')
+    ascending = rating_sorted_ids('asc')
+
+    assert descending[:2] == [(second.id, 8.8), (first.id, 7.5)]
+    assert ascending[:2] == [(first.id, 7.5), (second.id, 8.8)]
+    assert (unrated.id, 0.0) in descending[2:] and (unrated.id, 0.0) in ascending[2:]
+    page_sql = captured.captured_queries[0]['sql']
+    assert 'movie_rating_projections' in page_sql and 'movie_platform_ratings' not in page_sql
+
+
+# 계약: 평점 없는 영화는 평점 있는 영화 뒤에 등록순(최근 등록 먼저)으로 이어지고, 두 부분에 걸친 페이지도 커서/페이지 번호 모드가 같아야 한다.
+def test_rating_sort_pages_across_rated_and_unrated(dated_movies):
+    for movie, score in zip(dated_movies[:3], [7.5, 8.8, 6.0]):
+        MoviePlatformRatingModel.objects.create(movie=movie, platform_name='IMDb', score=score)
+    MovieRatingProjection().sync([movie.id for movie in dated_movies])
+    repository = DjangoMovieSearchRepository()
+
+    def fetch(pagination):
+        return repository.search_movies(MovieSearchCriteriaDto(
+            sort_by=SortOptionDto('rating', 'desc', rating_platform='IMDb'), pagination=pagination))
+
+    expected = [dated_movies[1].id, dated_movies[0].id, dated_movies[2].id, dated_movies[4].id, dated_movies[3].id]
+    assert [m.movie_id for m in fetch(PaginationDto(page_size=10)).movies] == expected
+    assert walk_cursor_pages(fetch) == expected
+    third_page = fetch(PaginationDto(page_number=3, page_size=2))
+    assert [m.movie_id for m in third_page.movies] == expected[4:]
+    assert (third_page.total_results, third_page.is_total_exact) == (5, True)
+
+
+# 계약: sync는 평점 변경/삭제를 반영하고, rebuild 명령은 프로젝션을 원본 평점으로 다시 만들어야 한다.
+def test_rating_projection_sync_and_rebuild(dated_movies):
+    movie = dated_movies[0]
+    rating = MoviePlatformRatingModel.objects.create(movie=movie, platform_name='IMDb', score=6.0)
+    MovieRatingProjection().sync([movie.id])
+    assert list(MovieRatingProjectionModel.objects.values_list('score', 'movie_created_at')) == [(6.0, movie.created_at)]
+
+    rating.delete()
+    MovieRatingProjection().sync([movie.id])
+    assert not MovieRatingProjectionModel.objects.exists()
+
+    MoviePlatformRatingModel.objects.create(movie=movie, platform_name='IMDb', score=9.0)
+    call_command('rebuild_movie_search_index')
+    assert rating_sorted_ids('desc')[0] == (movie.id, 9.0)
@@ -5,9 +5,9 @@ from django.urls import reverse
 from rest_framework.test import APIClient
 from rest_framework import status
 
-from apps.movie.application.dtos import MovieDetailDto, SearchedMovieItemDto, MovieSearchResultDto, TitleInfoDisplayDto, \
-    PlotDisplayDto
-from apps.movie.containers import MovieContainer
+from src.apps.movie.application.dtos import MovieDetailDto, SearchedMovieItemDto, MovieSearchResultDto, TitleInfoDisplayDto, \
+    PlotDisplayDto, AutocompleteSuggestionDto
+from src.apps.movie.containers import MovieContainer
 
 pytestmark = pytest.mark.django_db
 
@@ -97,4 +97,70 @@ def test_movie_search_view_success(api_client, mock_movie_service):
 
     # --- 검증 (Assert) ---
     assert response.status_code == status.HTTP_200_OK
-    mock_movie_service.search_movies.assert_called_once()
\ No newline at end of file
+    mock_movie_service.search_movies.assert_called_once()
+
+def test_popular_movies_view_passes_cursor_and_returns_next_cursor(api_client, mock_movie_service):
+    mock_movie_service.get_popular_movies.return_value = MovieSearchResultDto(
+        movies=[], total_results=3, current_page=None, total_pages=2, next_cursor="next-token")
+
+    response = api_client.get(f"{reverse('popular_movies')}?page_size=2&cursor=prev-token")
+
+    assert response.status_code == status.HTTP_200_OK
+    pagination = mock_movie_service.get_popular_movies.call_args.kwargs['pagination_dto']
+    assert (pagination.cursor, pagination.page_size) == ("prev-token", 2)
+    assert response.data['next_cursor'] == "next-token"
+    assert response.data['current_page'] is None
+
+
+def test_movie_batch_detail_view_reports_missing_ids(api_client, mock_movie_service):
+    # --- 준비 (Arrange) ---
+    mock_dto = MagicMock(spec=MovieDetailDto)
+    mock_dto.movie_id = 1
+    mock_dto.title_info = MagicMock(spec=TitleInfoDisplayDto, korean_title="배치 영화", original_title=None)
+    mock_dto.plot = MagicMock(spec=PlotDisplayDto, text=None)
+    mock_dto.release_date_str = "정보 없음"
+    mock_dto.runtime_minutes = 0
+    mock_dto.poster_image_url = ""
+    mock_dto.genres = mock_dto.directors = mock_dto.cast = []
+    mock_dto.still_cuts = mock_dto.trailers = mock_dto.platform_ratings = mock_dto.ott_availability = []
+    mock_dto.created_at_str = "2025-01-01T00:00:00"
+    mock_dto.updated_at_str = None
+    mock_movie_service.get_movie_details_bulk.return_value = [mock_dto]
+
+    # --- 실행 (Act) ---
+    response = api_client.get(f"{reverse('movie_batch_detail')}?ids=1,2,1")
+
+    # --- 검증 (Assert) ---
+    assert response.status_code == status.HTTP_200_OK
+    mock_movie_service.get_movie_details_bulk.assert_called_once_with(movie_ids=[1, 2])
+    assert [movie['movie_id'] for movie in response.data['movies']] == [1]
+    assert response.data['missing_ids'] == [2]
+
+
+def test_movie_batch_detail_view_rejects_invalid_ids(api_client, mock_movie_service):
+    url = reverse('movie_batch_detail')
+    too_many_ids = ",".join(str(i) for i in range(1, 52))
+
+    assert api_client.get(f"{url}?ids=1,abc").status_code == status.HTTP_400_BAD_REQUEST
+    assert api_client.get(f"{url}?ids={too_many_ids}").status_code == status.HTTP_400_BAD_REQUEST
+    mock_movie_service.get_movie_details_bulk.assert_not_called()
+
+
+def test_movie_autocomplete_view_returns_suggestions(api_client, mock_movie_service):
+    mock_movie_service.get_autocomplete_suggestions.return_value = [
+        AutocompleteSuggestionDto(suggestion_type="movie", target_id=1, label="기생충"),
+    ]
+
+    response = api_client.get(f"{reverse('movie_autocomplete')}?q=기생&limit=5")
+
+    assert response.status_code == status.HTTP_200_OK
+    mock_movie_service.get_autocomplete_suggestions.assert_called_once_with(query="기생", limit=5)
+    assert response.data['suggestions'] == [{'suggestion_type': 'movie', 'target_id': 1, 'label': '기생충'}]
+
+
+def test_movie_autocomplete_view_requires_query(api_client, mock_movie_service):
+    url = reverse('movie_autocomplete')
+
+    assert api_client.get(url).status_code == status.HTTP_400_BAD_REQUEST
+    assert api_client.get(f"{url}?q=a&limit=100").status_code == status.HTTP_400_BAD_REQUEST
+    mock_movie_service.get_autocomplete_suggestions.assert_not_called()
@@ -40,18 +40,46 @@ class CommentListDto:
                  comments, 
                  total_count, 
                  page, 
-                 page_size):
+                 page_size,
+                 next_cursor=None,
+                 since_cursor=None,
+                 last_comment_at=None):
         self.comments = comments
         self.total_count = total_count
         self.page = page
         self.page_size = page_size
-        self.total_pages = (total_count + page_size - 1) // page_size if page_size > 0 else 0
+        self.next_cursor = next_cursor
+        self.since_cursor = since_cursor
+        self.last_comment_at = last_comment_at
+        if page is None:
+            self.total_pages = None  # 커서 모드에는 페이지 번호가 없다.
+        else:
+            self.total_pages = (total_count + page_size - 1) // page_size if page_size > 0 else 0
 
 class PaginationInfoRequestDto: 
-    def __init__(self, page = 1, page_size = 10):
+    def __init__(self, page = 1, page_size = 10, cursor = None, since = None):
         if not isinstance(page, int) or page < 1:
             raise ValueError("페이지 번호는 1 이상의 정수여야 합니다.")
         if not isinstance(page_size, int) or not (1 <= page_size <= 50):
             raise ValueError("페이지 크기는 1에서 50 사이의 정수여야 합니다.")
+        if cursor and since:
+            raise ValueError("cursor와 since는 함께 사용할 수 없습니다.")
         self.page = page
-        self.page_size = page_size
\ No newline at end of file
+        self.page_size = page_size
+        self.cursor = cursor or None
+        self.since = since or None
+
+    @property
+    def is_cursor_mode(self):
+        return self.cursor is not None or self.since is not None
+
+class CommentEventDto:
+    CREATED = "comment.created"
+    UPDATED = "comment.updated"
+    DELETED = "comment.deleted"
+
+    def __init__(self, event_type, movie_id, comment_id, comment=None):
+        self.event_type = event_type
+        self.movie_id = movie_id
+        self.comment_id = comment_id
+        self.comment = comment  # CommentDto. 삭제 이벤트에는 없다.
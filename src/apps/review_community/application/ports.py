@@ -0,0 +1,10 @@
+import abc
+
+
+class CommentEventPublisher(abc.ABC):
+    """댓글 생성/수정/삭제를 실시간 구독자(SSE 스트림)에게 알린다."""
+
+    @abc.abstractmethod
+    def publish(self, event):
+        """CommentEventDto를 발행한다. 저장이 커밋된 뒤에만 전달되어야 한다."""
+        raise NotImplementedError
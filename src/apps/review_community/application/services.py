@@ -1,18 +1,25 @@
-from django.core.paginator import Paginator
 from django.contrib.auth import get_user_model
 
 from src.apps.review_community.domain.aggregates.comment_thread import CommentThread
 from src.apps.review_community.domain.value_objects.comment_id_vo import CommentIdVO
 from src.apps.review_community.domain.value_objects.comment_content_vo import CommentContentVO
 from src.apps.review_community.domain.value_objects.author_profile_vo import AuthorProfileVO
-from src.apps.review_community.application.dtos import CommentDto, CommentAuthorDto, CommentListDto
+from src.apps.review_community.application.dtos import CommentDto, CommentAuthorDto, CommentListDto, CommentEventDto
 
 User = get_user_model()
 
 class CommentAppService:
     def __init__(self, 
-                 comment_thread_repository):
+                 comment_thread_repository,
+                 comment_query_repository,
+                 comment_event_publisher=None):
         self.comment_thread_repository = comment_thread_repository
+        self.comment_query_repository = comment_query_repository
+        self.comment_event_publisher = comment_event_publisher
+
+    def _publish(self, event_type, movie_id, comment_id, comment_dto=None):
+        if self.comment_event_publisher:
+            self.comment_event_publisher.publish(CommentEventDto(event_type, movie_id, comment_id, comment_dto))
 
     def _map_comment_entity_to_dto_with_movie_id(self, comment_entity, movie_id):
         author_dto = CommentAuthorDto(
@@ -29,7 +36,8 @@ class CommentAppService:
         )
 
     def add_comment_to_movie(self, author_user_instance, request_dto):
-        comment_thread = self.comment_thread_repository.find_by_movie_id(request_dto.movie_id)
+        # 새 댓글 추가에는 기존 댓글이 필요 없으므로 댓글 없이 스레드만 가져온다.
+        comment_thread = self.comment_thread_repository.find_by_movie_id(request_dto.movie_id, comment_ids=[])
         if not comment_thread:
             comment_thread = CommentThread(movie_id=request_dto.movie_id)
 
@@ -42,47 +50,60 @@ class CommentAppService:
         new_comment_entity = comment_thread.add_comment(author=author_vo, content=content_vo)
         self.comment_thread_repository.save(comment_thread)
         
-        return self._map_comment_entity_to_dto_with_movie_id(new_comment_entity, request_dto.movie_id)
+        comment_dto = self._map_comment_entity_to_dto_with_movie_id(new_comment_entity, request_dto.movie_id)
+        self._publish(CommentEventDto.CREATED, request_dto.movie_id, comment_dto.comment_id, comment_dto)
+        return comment_dto
 
     def get_comments_for_movie(self, movie_id, pagination_request_dto):
-        comment_thread = self.comment_thread_repository.find_by_movie_id(movie_id)
-        if not comment_thread:
-            return CommentListDto(comments=[], total_count=0, page=pagination_request_dto.page, page_size=pagination_request_dto.page_size)
+        # 정렬과 LIMIT/OFFSET은 DB에서 처리하고, 반환된 페이지의 댓글만 도메인 객체로 변환한다.
+        if pagination_request_dto.is_cursor_mode:
+            comment_page = self.comment_query_repository.feed_for_movie(
+                movie_id, pagination_request_dto.page_size,
+                cursor=pagination_request_dto.cursor, since=pagination_request_dto.since
+            )
+        else:
+            comment_page = self.comment_query_repository.page_for_movie(
+                movie_id, pagination_request_dto.page, pagination_request_dto.page_size
+            )
+        comment_dtos = [self._map_comment_entity_to_dto_with_movie_id(comment_entity, movie_id) for comment_entity in comment_page.comments]
 
-        all_comments = sorted(comment_thread.comments, key=lambda c: c.created_at, reverse=True)
-        
-        paginator = Paginator(all_comments, pagination_request_dto.page_size)
-        page_obj = paginator.get_page(pagination_request_dto.page)
-        
-        comment_dtos = [self._map_comment_entity_to_dto_with_movie_id(comment_entity, movie_id) for comment_entity in page_obj.object_list]
-        
         return CommentListDto(
             comments=comment_dtos,
-            total_count=paginator.count,
-            page=page_obj.number,
-            page_size=pagination_request_dto.page_size
+            total_count=comment_page.total_count,
+            page=comment_page.page,
+            page_size=pagination_request_dto.page_size,
+            next_cursor=comment_page.next_cursor,
+            since_cursor=comment_page.since_cursor,
+            last_comment_at=comment_page.last_comment_at
         )
 
     def update_comment(self, movie_id, comment_id_str, author_account_id, request_dto):
-        comment_thread = self.comment_thread_repository.find_by_movie_id(movie_id)
+        comment_id_vo = CommentIdVO(comment_id_str)
+        comment_thread = self.comment_thread_repository.find_by_movie_id(movie_id, comment_ids=[comment_id_vo])
         if not comment_thread:
             raise ValueError("해당 영화의 댓글 스레드를 찾을 수 없습니다.")
 
-        comment_id_vo = CommentIdVO(comment_id_str)
         new_content_vo = CommentContentVO(request_dto.content)
         
         comment_thread.update_comment_content(comment_id_vo, new_content_vo, author_account_id)
+        is_edited = comment_thread.has_pending_changes
         self.comment_thread_repository.save(comment_thread)
         updated_comment_entity = comment_thread.find_comment_by_id(comment_id_vo)
         if updated_comment_entity:
-            return self._map_comment_entity_to_dto_with_movie_id(updated_comment_entity, movie_id)
+            comment_dto = self._map_comment_entity_to_dto_with_movie_id(updated_comment_entity, movie_id)
+            if is_edited:
+                self._publish(CommentEventDto.UPDATED, movie_id, comment_dto.comment_id, comment_dto)
+            return comment_dto
         return None
 
     def delete_comment(self, movie_id, comment_id_str, author_account_id):
-        comment_thread = self.comment_thread_repository.find_by_movie_id(movie_id)
+        comment_id_vo = CommentIdVO(comment_id_str)
+        comment_thread = self.comment_thread_repository.find_by_movie_id(movie_id, comment_ids=[comment_id_vo])
         if not comment_thread:
             return 
 
-        comment_id_vo = CommentIdVO(comment_id_str)
         comment_thread.delete_comment(comment_id_vo, author_account_id)
-        self.comment_thread_repository.save(comment_thread)
\ No newline at end of file
+        is_deleted = comment_id_vo in comment_thread.removed_comment_ids
+        self.comment_thread_repository.save(comment_thread)
+        if is_deleted:
+            self._publish(CommentEventDto.DELETED, movie_id, comment_id_vo.value)
\ No newline at end of file
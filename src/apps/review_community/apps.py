@@ -1,7 +1,18 @@
 from django.apps import AppConfig
+from django.conf import settings
+from django.db.models.signals import pre_delete
+
 
 class ReviewCommunityConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'src.apps.review_community'
     # verbose_name = "리뷰 및 커뮤니티" # 선택 사항
-    label = 'review_community'
\ No newline at end of file
+    label = 'review_community'
+
+    def ready(self):
+        # 계정 삭제(Users.delete)는 댓글을 cascade로 지우므로, 댓글 쓰기 경로를 거치지 않는 이 삭제도 통계에 반영한다.
+        from src.apps.review_community.infrastructure.comment_stats import discount_deleted_author_comments
+        pre_delete.connect(
+            discount_deleted_author_comments, sender=settings.AUTH_USER_MODEL,
+            dispatch_uid='review_community.discount_deleted_author_comments'
+        )
@@ -17,6 +17,11 @@ class CommentThread:
                     raise TypeError("댓글 목록에는 Comment 엔티티만 포함될 수 있습니다.")
                 self._comments.append(comment_entity)
 
+        # 저장소가 마지막으로 불러오거나 저장한 뒤의 변경 사항. 저장소는 이 변경분만 DB에 반영한다.
+        self._added_comments = {}
+        self._edited_comments = {}
+        self._removed_comment_ids = []
+
     @property
     def movie_id(self):
         return self._movie_id
@@ -25,6 +30,28 @@ class CommentThread:
     def comments(self):
         return list(self._comments)
 
+    @property
+    def added_comments(self):
+        return list(self._added_comments.values())
+
+    @property
+    def edited_comments(self):
+        return list(self._edited_comments.values())
+
+    @property
+    def removed_comment_ids(self):
+        return list(self._removed_comment_ids)
+
+    @property
+    def has_pending_changes(self):
+        return bool(self._added_comments or self._edited_comments or self._removed_comment_ids)
+
+    def clear_pending_changes(self):
+        """저장소가 변경 사항을 반영한 뒤 호출한다."""
+        self._added_comments.clear()
+        self._edited_comments.clear()
+        self._removed_comment_ids.clear()
+
     def add_comment(self, author, content):
         new_comment_id = CommentIdVO.generate()
         now = datetime.now()
@@ -36,6 +63,7 @@ class CommentThread:
             created_at=now
         )
         self._comments.append(new_comment)
+        self._added_comments[new_comment_id] = new_comment
         return new_comment
 
     def find_comment_by_id(self, comment_id_to_find):
@@ -54,7 +82,12 @@ class CommentThread:
         if comment_to_update.author.account_id != author_id_making_change:
             raise PermissionError("자신이 작성한 댓글만 수정할 수 있습니다.")
             
+        if comment_to_update.content == new_content:
+            return
         comment_to_update.update_content(new_content)
+        # 아직 저장되지 않은 댓글은 INSERT 시점의 내용이 반영되므로 수정으로 따로 기록하지 않는다.
+        if comment_to_update.comment_id not in self._added_comments:
+            self._edited_comments[comment_to_update.comment_id] = comment_to_update
 
     def delete_comment(self, comment_id_to_delete, author_id_making_change):
         comment_to_delete = self.find_comment_by_id(comment_id_to_delete)
@@ -65,6 +98,10 @@ class CommentThread:
             raise PermissionError("자신이 작성한 댓글만 삭제할 수 있습니다.")
             
         self._comments.remove(comment_to_delete)
+        comment_id = comment_to_delete.comment_id
+        if self._added_comments.pop(comment_id, None) is None:
+            self._edited_comments.pop(comment_id, None)
+            self._removed_comment_ids.append(comment_id)
 
     def get_comment_count(self):
         return len(self._comments)
@@ -4,9 +4,52 @@ from .value_objects.comment_id_vo import CommentIdVO
 
 class CommentThreadRepository(abc.ABC):
     @abc.abstractmethod
-    def find_by_movie_id(self, movie_id):
+    def find_by_movie_id(self, movie_id, comment_ids=None):
+        """
+        comment_ids(CommentIdVO 목록)를 주면 해당 댓글만 담은 부분 스레드를 반환한다. (빈 목록이면 댓글을 조회하지 않는다)
+        쓰기 작업은 대상 댓글만 있으면 되므로 스레드 전체를 불러오지 않는다.
+        """
         raise NotImplementedError
 
     @abc.abstractmethod
     def save(self, comment_thread):
-        raise NotImplementedError
\ No newline at end of file
+        """스레드에 기록된 변경 사항(추가/수정/삭제된 댓글)만 반영한다."""
+        raise NotImplementedError
+
+
+class CommentPage:
+    """
+    next_cursor: 이 결과 다음(더 오래된) 댓글을 cursor 모드로 이어서 조회할 커서. 더 없으면 None.
+    since_cursor: 결과에 포함된 가장 최신 댓글보다 새로운 댓글만 조회할 때 since로 넘기는 커서.
+                  첫 페이지와 since 조회 결과에만 채워진다.
+    커서 모드에서는 page가 None이다.
+    """
+    def __init__(self, comments, total_count, page, next_cursor=None, since_cursor=None, last_comment_at=None):
+        self.comments = comments
+        self.total_count = total_count
+        self.page = page
+        self.last_comment_at = last_comment_at
+        self.next_cursor = next_cursor
+        self.since_cursor = since_cursor
+
+
+class CommentQueryRepository(abc.ABC):
+    """목록 조회 전용 포트. CommentThread 전체를 불러오지 않고 요청한 페이지의 댓글만 조회한다."""
+
+    @abc.abstractmethod
+    def page_for_movie(self, movie_id, page, page_size):
+        """
+        최신순 page번째 페이지의 CommentPage를 반환한다.
+        page가 마지막 페이지를 넘으면 마지막 페이지를 반환한다. (Paginator.get_page와 같은 동작)
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def feed_for_movie(self, movie_id, page_size, cursor=None, since=None):
+        """
+        (created_at, id) 기준 커서 조회.
+        - cursor: 최신순으로, cursor 댓글보다 오래된 댓글 page_size개
+        - since: 오래된 순으로, since 댓글보다 새로운 댓글 page_size개 (폴링용 변경분)
+        잘못된 커서는 ValueError를 발생시킨다.
+        """
+        raise NotImplementedError
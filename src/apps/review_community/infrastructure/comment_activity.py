@@ -0,0 +1,15 @@
+from django.db.models import Count
+
+from src.apps.movie.application.ports.comment_activity import MovieCommentActivityReader
+from src.apps.review_community.models import CommentModel, MovieCommentStatsModel
+
+
+class DjangoMovieCommentActivityReader(MovieCommentActivityReader):
+    """전체 댓글 수는 댓글 쓰기 경로가 유지하는 MovieCommentStatsModel에서, 최근 댓글 수는 CommentModel에서 읽는다."""
+
+    def comment_counts(self):
+        return dict(MovieCommentStatsModel.objects.values_list('movie_id', 'comment_count'))
+
+    def recent_comment_counts(self, since):
+        return dict(CommentModel.objects.filter(created_at__gte=since).values_list(
+            'movie_id').annotate(n=Count('id')).order_by())
@@ -0,0 +1,129 @@
+import abc
+import asyncio
+import collections
+import functools
+import logging
+import threading
+
+from django.conf import settings
+from django.db import transaction
+from django.utils.module_loading import import_string
+
+from src.apps.review_community.application.ports import CommentEventPublisher
+
+logger = logging.getLogger(__name__)
+
+
+class CommentEventBackend(abc.ABC):
+    """
+    영화별 댓글 이벤트 pub/sub. publish는 어느 스레드에서든 호출할 수 있고,
+    subscribe는 이벤트 루프 안에서 호출해 CommentSubscription을 받는다.
+    여러 프로세스로 배포할 때는 Redis pub/sub 등으로 구현한 백엔드를 settings.COMMENT_EVENT_BACKEND에 지정한다.
+    """
+
+    @abc.abstractmethod
+    def publish(self, event):
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def subscribe(self, movie_id):
+        raise NotImplementedError
+
+
+class CommentSubscription:
+    """
+    구독자 한 명의 이벤트 큐. 큐가 가득 차면 가장 오래된 이벤트를 버리고 overflowed를 표시하므로,
+    스트림은 클라이언트에게 since 조회로 다시 맞추라고 알릴 수 있다.
+    """
+
+    def __init__(self, movie_id, loop, max_size, on_close):
+        self.movie_id = movie_id
+        self.loop = loop
+        self.overflowed = False
+        self._events = collections.deque()
+        self._max_size = max_size
+        self._ready = asyncio.Event()
+        self._on_close = on_close
+
+    def _deliver(self, event):
+        # 구독자의 이벤트 루프 스레드에서만 실행된다.
+        if len(self._events) >= self._max_size:
+            self._events.popleft()
+            self.overflowed = True
+        self._events.append(event)
+        self._ready.set()
+
+    async def get(self, timeout):
+        """다음 이벤트를 반환한다. timeout초 안에 이벤트가 없으면 None."""
+        if not self._events:
+            self._ready.clear()
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout)
+            except asyncio.TimeoutError:
+                return None
+        return self._events.popleft()
+
+    def close(self):
+        self._on_close(self)
+
+
+class InProcessCommentEventBackend(CommentEventBackend):
+    """같은 프로세스의 구독자에게만 전달하는 기본 백엔드. (단일 ASGI 워커 배포용)"""
+
+    def __init__(self, max_queue_size=None):
+        self.max_queue_size = max_queue_size or getattr(settings, 'COMMENT_STREAM_QUEUE_SIZE', 100)
+        self._subscriptions = collections.defaultdict(set)
+        self._lock = threading.Lock()
+
+    def subscribe(self, movie_id):
+        subscription = CommentSubscription(movie_id, asyncio.get_running_loop(), self.max_queue_size, self._unsubscribe)
+        with self._lock:
+            self._subscriptions[movie_id].add(subscription)
+        return subscription
+
+    def _unsubscribe(self, subscription):
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.movie_id)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self._subscriptions[subscription.movie_id]
+
+    def subscriber_count(self, movie_id):
+        with self._lock:
+            return len(self._subscriptions.get(movie_id, ()))
+
+    def publish(self, event):
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(event.movie_id, ()))
+        for subscription in subscriptions:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription._deliver, event)
+            except RuntimeError:
+                # 이벤트 루프가 이미 닫힌 구독자는 정리한다.
+                self._unsubscribe(subscription)
+
+
+@functools.lru_cache(maxsize=None)
+def get_comment_event_backend():
+    backend_class = import_string(getattr(
+        settings, 'COMMENT_EVENT_BACKEND',
+        'src.apps.review_community.infrastructure.comment_events.InProcessCommentEventBackend'
+    ))
+    return backend_class()
+
+
+class TransactionalCommentEventPublisher(CommentEventPublisher):
+    """트랜잭션이 커밋된 뒤에 백엔드로 발행한다. 롤백된 변경은 구독자에게 전달되지 않는다."""
+
+    def __init__(self, backend=None):
+        self.backend = backend or get_comment_event_backend()
+
+    def publish(self, event):
+        transaction.on_commit(functools.partial(self._publish, event))
+
+    def _publish(self, event):
+        try:
+            self.backend.publish(event)
+        except Exception:
+            logger.exception(f"댓글 이벤트 발행 중 오류 발생. Movie ID: {event.movie_id}, Type: {event.event_type}")
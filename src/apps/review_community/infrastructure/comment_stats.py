@@ -0,0 +1,82 @@
+import logging
+
+from django.db import transaction
+from django.db.models import Count, F, Max, OuterRef, Subquery
+
+from src.apps.review_community.models import CommentModel, MovieCommentStatsModel
+
+logger = logging.getLogger(__name__)
+
+
+class MovieCommentStats:
+    """
+    MovieCommentStatsModel(영화별 댓글 수, 마지막 댓글 시각)을 유지한다.
+    apply는 댓글 쓰기와 같은 트랜잭션 안에서 호출해야 하며, rebuild는 전체를 CommentModel에서 다시 계산한다.
+    """
+
+    def get(self, movie_id):
+        """(댓글 수, 마지막 댓글 시각)을 반환한다. 통계가 없으면 (0, None)."""
+        stats = MovieCommentStatsModel.objects.filter(movie_id=movie_id).values_list(
+            'comment_count', 'last_comment_at').first()
+        return stats or (0, None)
+
+    def apply(self, movie_id, added_count, removed_count, last_added_at=None):
+        if not added_count and not removed_count:
+            return
+        MovieCommentStatsModel.objects.get_or_create(movie_id=movie_id)
+        updates = {'comment_count': F('comment_count') + added_count - removed_count}
+        if removed_count:
+            # 가장 최근 댓글이 삭제됐을 수 있으므로 (movie, created_at) 인덱스로 다시 읽는다.
+            updates['last_comment_at'] = Subquery(
+                CommentModel.objects.filter(movie_id=OuterRef('movie_id')).order_by('-created_at').values('created_at')[:1]
+            )
+        elif last_added_at:
+            updates['last_comment_at'] = last_added_at
+        MovieCommentStatsModel.objects.filter(movie_id=movie_id).update(**updates)
+
+    def discount_author(self, author_id):
+        """
+        author_id 사용자의 댓글을 영화별 통계에서 뺀다. 계정 삭제로 댓글이 cascade 삭제되기 직전에 호출한다.
+        마지막 댓글 시각은 그 사용자의 댓글을 제외한 나머지 중 가장 최근 값으로 다시 읽는다.
+        """
+        authored = CommentModel.objects.filter(movie_id=OuterRef('movie_id'), author_id=author_id)
+        MovieCommentStatsModel.objects.filter(
+            movie_id__in=CommentModel.objects.filter(author_id=author_id).values('movie_id')
+        ).update(
+            comment_count=F('comment_count') - Subquery(
+                authored.order_by().values('movie_id').annotate(removed=Count('id')).values('removed')[:1]
+            ),
+            last_comment_at=Subquery(
+                CommentModel.objects.filter(movie_id=OuterRef('movie_id')).exclude(author_id=author_id)
+                .order_by('-created_at').values('created_at')[:1]
+            ),
+        )
+
+    def reconcile(self, batch_size=1000):
+        """CommentModel에서 통계를 다시 계산해 통째로 교체하고, (영화 수, 값이 달랐던 영화 수)를 반환한다."""
+        with transaction.atomic():
+            expected = {
+                movie_id: (comment_count, last_comment_at)
+                for movie_id, comment_count, last_comment_at in CommentModel.objects.values_list('movie_id').annotate(
+                    comment_count=Count('id'), last_comment_at=Max('created_at')).order_by()
+            }
+            current = {
+                movie_id: (comment_count, last_comment_at)
+                for movie_id, comment_count, last_comment_at in MovieCommentStatsModel.objects.values_list(
+                    'movie_id', 'comment_count', 'last_comment_at')
+                if comment_count  # 댓글이 모두 삭제된 영화의 0건 행은 없는 것과 같다.
+            }
+            mismatched = sum(1 for movie_id in expected.keys() | current.keys()
+                             if expected.get(movie_id) != current.get(movie_id))
+            MovieCommentStatsModel.objects.all().delete()
+            MovieCommentStatsModel.objects.bulk_create([
+                MovieCommentStatsModel(movie_id=movie_id, comment_count=comment_count, last_comment_at=last_comment_at)
+                for movie_id, (comment_count, last_comment_at) in expected.items()
+            ], batch_size=batch_size)
+        logger.info(f"영화 댓글 통계를 다시 계산했습니다. 영화 수: {len(expected)}, 수정: {mismatched}")
+        return len(expected), mismatched
+
+
+def discount_deleted_author_comments(sender, instance, **kwargs):
+    """사용자 pre_delete 수신기. cascade로 지워질 댓글을 통계에서 먼저 뺀다. (같은 삭제 트랜잭션 안에서 실행된다)"""
+    MovieCommentStats().discount_author(instance.pk)
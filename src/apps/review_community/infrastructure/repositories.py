@@ -1,5 +1,5 @@
 from django.db import transaction
-from django.contrib.auth import get_user_model
+from django.utils import timezone
 import uuid
 
 from src.apps.review_community.domain.aggregates.comment_thread import CommentThread
@@ -7,57 +7,147 @@ from src.apps.review_community.domain.aggregates.comment import Comment
 from src.apps.review_community.domain.value_objects.comment_id_vo import CommentIdVO
 from src.apps.review_community.domain.value_objects.comment_content_vo import CommentContentVO
 from src.apps.review_community.domain.value_objects.author_profile_vo import AuthorProfileVO
-from src.apps.review_community.domain.repositories import CommentThreadRepository
+from src.apps.movie.infrastructure.persistence.keyset import KeysetField, KeysetOrdering
+from src.apps.review_community.domain.repositories import CommentThreadRepository, CommentQueryRepository, CommentPage
+from src.apps.review_community.infrastructure.comment_stats import MovieCommentStats
 from src.apps.review_community.models import CommentModel
 
-User = get_user_model()
+
+def _to_comment_entity(comment_model):
+    author_vo = AuthorProfileVO(
+        account_id=comment_model.author.pk,
+        nickname=getattr(comment_model.author, 'nickname', str(comment_model.author))
+    )
+    return Comment(
+        comment_id=CommentIdVO(str(comment_model.id)),
+        content=CommentContentVO(comment_model.content),
+        author=author_vo,
+        created_at=comment_model.created_at,
+        modified_at=comment_model.modified_at
+    )
 
 
 class DjangoCommentThreadRepository(CommentThreadRepository):
+    def __init__(self, comment_stats=None):
+        self.comment_stats = comment_stats or MovieCommentStats()
+
     def _to_comment_entity(self, comment_model):
-        author_vo = AuthorProfileVO(
-            account_id=comment_model.author.pk,
-            nickname=getattr(comment_model.author, 'nickname', str(comment_model.author))
-        )
-        return Comment(
-            comment_id=CommentIdVO(str(comment_model.id)),
-            content=CommentContentVO(comment_model.content),
-            author=author_vo,
-            created_at=comment_model.created_at,
-            modified_at=comment_model.modified_at
-        )
+        return _to_comment_entity(comment_model)
 
-    def find_by_movie_id(self, movie_id):
+    def find_by_movie_id(self, movie_id, comment_ids=None):
+        if comment_ids is not None and not comment_ids:
+            return CommentThread(movie_id=movie_id)
         comment_models = CommentModel.objects.filter(movie_id=movie_id).select_related('author').order_by('created_at')
-        
+        if comment_ids is not None:
+            comment_models = comment_models.filter(id__in=[uuid.UUID(comment_id.value) for comment_id in comment_ids])
+
         comments_entities = [self._to_comment_entity(cm) for cm in comment_models]
         return CommentThread(movie_id=movie_id, comments=comments_entities)
 
     @transaction.atomic
     def save(self, comment_thread):
-        existing_comment_ids_in_db = set(
-            CommentModel.objects.filter(movie_id=comment_thread.movie_id).values_list('id', flat=True)
+        movie_id = comment_thread.movie_id
+        added = comment_thread.added_comments
+        added_models = []
+        if added:
+            # created_at/modified_at은 auto_now_add/auto_now로 INSERT 시각이 저장된다.
+            added_models = CommentModel.objects.bulk_create([
+                CommentModel(
+                    id=uuid.UUID(comment.comment_id.value),
+                    movie_id=movie_id,
+                    author_id=comment.author.account_id,
+                    content=comment.content.text,
+                )
+                for comment in added
+            ])
+
+        now = timezone.now()
+        for comment in comment_thread.edited_comments:
+            CommentModel.objects.filter(id=uuid.UUID(comment.comment_id.value), movie_id=movie_id).update(
+                content=comment.content.text, modified_at=now
+            )
+
+        removed_ids = [uuid.UUID(comment_id.value) for comment_id in comment_thread.removed_comment_ids]
+        removed_count = 0
+        if removed_ids:
+            removed_count, _ = CommentModel.objects.filter(id__in=removed_ids, movie_id=movie_id).delete()
+
+        self.comment_stats.apply(
+            movie_id, len(added_models), removed_count,
+            last_added_at=max((cm.created_at for cm in added_models), default=None)
         )
-        
-        current_comment_ids_in_aggregate = set()
-
-        for comment_entity in comment_thread.comments:
-            comment_id_uuid = uuid.UUID(comment_entity.comment_id.value)
-            current_comment_ids_in_aggregate.add(comment_id_uuid)
-            
-            author_instance = User.objects.get(pk=comment_entity.author.account_id)
-
-            CommentModel.objects.update_or_create(
-                id=comment_id_uuid,
-                movie_id=comment_thread.movie_id,
-                defaults={
-                    'author': author_instance,
-                    'content': comment_entity.content.text,
-                    'created_at': comment_entity.created_at,
-                    'modified_at': comment_entity.modified_at
-                }
+
+        comment_thread.clear_pending_changes()
+
+
+class DjangoCommentQueryRepository(CommentQueryRepository):
+    # created_at이 같은 댓글도 페이지 사이에서 순서가 흔들리지 않도록 id를 보조 정렬 키로 쓴다.
+    # 두 정렬 모두 movie_comments의 (movie, created_at, id) 인덱스를 그대로 탄다.
+    LATEST_FIRST = KeysetOrdering(KeysetField('created_at', descending=True), KeysetField('id', descending=True))
+    OLDEST_FIRST = KeysetOrdering(KeysetField('created_at'), KeysetField('id'))
+
+    def __init__(self, comment_stats=None):
+        self.comment_stats = comment_stats or MovieCommentStats()
+
+    def page_for_movie(self, movie_id, page, page_size):
+        comments = CommentModel.objects.filter(movie_id=movie_id).select_related('author')
+        # 전체 개수는 COUNT 대신 쓰기 경로가 유지하는 통계 행에서 읽는다.
+        # 통계는 표시용으로만 쓰고, 페이지 유무와 다음 페이지 여부는 실제 행을 한 건 더 읽어 판단한다.
+        total_count, last_comment_at = self.comment_stats.get(movie_id)
+        page_models = self._read_page(comments, page, page_size)
+        if not page_models and page > 1:
+            # 요청한 페이지가 실제 데이터 범위를 넘은 경우에만 COUNT로 마지막 페이지를 구해 다시 읽는다.
+            page = max((comments.count() + page_size - 1) // page_size, 1)
+            page_models = self._read_page(comments, page, page_size)
+
+        has_next = len(page_models) > page_size
+        page_models = page_models[:page_size]
+        seen_count = (page - 1) * page_size + len(page_models)
+        # 마지막 페이지에서는 실제 개수를 알 수 있으므로 통계가 어긋나 있어도 그 값을 쓴다.
+        total_count = max(total_count, seen_count + 1) if has_next else seen_count
+        return CommentPage(
+            comments=[_to_comment_entity(cm) for cm in page_models],
+            total_count=total_count,
+            page=page,
+            last_comment_at=last_comment_at,
+            # 첫 요청은 페이지 모드로 받고 이후는 커서로 이어갈 수 있도록 커서도 함께 내려준다.
+            next_cursor=self.LATEST_FIRST.encode_cursor(page_models[-1]) if has_next else None,
+            since_cursor=self.OLDEST_FIRST.encode_cursor(page_models[0]) if page == 1 and page_models else None
+        )
+
+    def _read_page(self, comments, page, page_size):
+        offset = (page - 1) * page_size
+        return list(self.LATEST_FIRST.apply(comments)[offset:offset + page_size + 1])
+
+    def feed_for_movie(self, movie_id, page_size, cursor=None, since=None):
+        if cursor and since:
+            raise ValueError("cursor와 since는 함께 사용할 수 없습니다.")
+        comments = CommentModel.objects.filter(movie_id=movie_id).select_related('author')
+        total_count, last_comment_at = self.comment_stats.get(movie_id)
+
+        if since:
+            comments = self.OLDEST_FIRST.filter_after(comments, since)
+            page_models = list(self.OLDEST_FIRST.apply(comments)[:page_size])
+            newest = page_models[-1] if page_models else None
+            return CommentPage(
+                comments=[_to_comment_entity(cm) for cm in page_models],
+                total_count=total_count,
+                page=None,
+                last_comment_at=last_comment_at,
+                since_cursor=self.OLDEST_FIRST.encode_cursor(newest) if newest else since
             )
-        
-        ids_to_delete = existing_comment_ids_in_db - current_comment_ids_in_aggregate
-        if ids_to_delete:
-            CommentModel.objects.filter(id__in=ids_to_delete, movie_id=comment_thread.movie_id).delete()
\ No newline at end of file
+
+        if cursor:
+            comments = self.LATEST_FIRST.filter_after(comments, cursor)
+        # 한 건을 더 읽어 다음 페이지가 있는지 확인한다.
+        page_models = list(self.LATEST_FIRST.apply(comments)[:page_size + 1])
+        has_next = len(page_models) > page_size
+        page_models = page_models[:page_size]
+        return CommentPage(
+            comments=[_to_comment_entity(cm) for cm in page_models],
+            total_count=total_count,
+            page=None,
+            last_comment_at=last_comment_at,
+            next_cursor=self.LATEST_FIRST.encode_cursor(page_models[-1]) if has_next else None,
+            since_cursor=self.OLDEST_FIRST.encode_cursor(page_models[0]) if page_models and not cursor else None
+        )
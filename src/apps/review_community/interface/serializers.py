@@ -20,11 +20,21 @@ class UpdateCommentRequestSerializer(serializers.Serializer):
 
 class CommentListResponseSerializer(serializers.Serializer):
     comments = CommentResponseSerializer(many=True, read_only=True)
-    total_count = serializers.IntegerField(read_only=True)
-    page = serializers.IntegerField(read_only=True)
+    total_count = serializers.IntegerField(read_only=True, allow_null=True)
+    page = serializers.IntegerField(read_only=True, allow_null=True)
     page_size = serializers.IntegerField(read_only=True)
-    total_pages = serializers.IntegerField(read_only=True)
+    total_pages = serializers.IntegerField(read_only=True, allow_null=True)
+    next_cursor = serializers.CharField(read_only=True, allow_null=True)
+    since_cursor = serializers.CharField(read_only=True, allow_null=True)
+    last_comment_at = serializers.DateTimeField(read_only=True, allow_null=True)
 
 class PaginationInfoRequestSerializer(serializers.Serializer):
     page_number = serializers.IntegerField(default=1, min_value=1)
-    page_size = serializers.IntegerField(default=10, min_value=1, max_value=50)
\ No newline at end of file
+    page_size = serializers.IntegerField(default=10, min_value=1, max_value=50)
+    cursor = serializers.CharField(required=False, allow_blank=True, max_length=512)
+    since = serializers.CharField(required=False, allow_blank=True, max_length=512)
+
+    def validate(self, data):
+        if data.get('cursor') and data.get('since'):
+            raise serializers.ValidationError("cursor와 since는 함께 사용할 수 없습니다.")
+        return data
\ No newline at end of file
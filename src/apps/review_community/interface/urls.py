@@ -1,7 +1,8 @@
 from django.urls import path
-from .views import MovieCommentListCreateAPIView, MovieCommentDetailAPIView
+from .views import MovieCommentListCreateAPIView, MovieCommentDetailAPIView, movie_comment_stream
 
 urlpatterns = [
     path('<int:movie_id>/comments/', MovieCommentListCreateAPIView.as_view(), name='movie_comment_list_create'),
+    path('<int:movie_id>/comments/stream/', movie_comment_stream, name='movie_comment_stream'),
     path('<int:movie_id>/comments/<uuid:comment_id_str>/', MovieCommentDetailAPIView.as_view(), name='movie_comment_detail'),
 ]
\ No newline at end of file
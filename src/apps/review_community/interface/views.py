@@ -1,3 +1,9 @@
+import json
+import time
+
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.http import HttpResponseNotAllowed, JsonResponse, StreamingHttpResponse
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
@@ -11,13 +17,19 @@ from .serializers import (
 from ..application.dtos import (
     CreateCommentRequestDto, UpdateCommentRequestDto, PaginationInfoRequestDto
 )
+from ..infrastructure.comment_events import TransactionalCommentEventPublisher, get_comment_event_backend
 from ..application.services import CommentAppService
-from ..infrastructure.repositories import DjangoCommentThreadRepository
+from ..infrastructure.repositories import DjangoCommentThreadRepository, DjangoCommentQueryRepository
 
 
 def get_comment_app_service():
     comment_thread_repo = DjangoCommentThreadRepository()
-    return CommentAppService(comment_thread_repository=comment_thread_repo)
+    comment_query_repo = DjangoCommentQueryRepository()
+    return CommentAppService(
+        comment_thread_repository=comment_thread_repo,
+        comment_query_repository=comment_query_repo,
+        comment_event_publisher=TransactionalCommentEventPublisher(get_comment_event_backend())
+    )
 
 
 class MovieCommentListCreateAPIView(APIView):
@@ -31,13 +43,21 @@ class MovieCommentListCreateAPIView(APIView):
         if not pagination_serializer.is_valid():
             return Response(pagination_serializer.errors, status=status.HTTP_400_BAD_REQUEST)
         
-        pagination_dto = PaginationInfoRequestDto(**pagination_serializer.validated_data)
+        validated = pagination_serializer.validated_data
+        pagination_dto = PaginationInfoRequestDto(
+            page=validated['page_number'],
+            page_size=validated['page_size'],
+            cursor=validated.get('cursor'),
+            since=validated.get('since')
+        )
         service = get_comment_app_service()
         
         try:
             comment_list_dto = service.get_comments_for_movie(movie_id, pagination_dto)
             response_serializer = CommentListResponseSerializer(comment_list_dto)
             return Response(response_serializer.data)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
         except Exception as e:
             return Response({"error": "댓글 목록 조회 중 오류 발생"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
@@ -97,4 +117,52 @@ class MovieCommentDetailAPIView(APIView):
         except ValueError as e: 
              return Response({"error": str(e)}, status=status.HTTP_404_NOT_FOUND)
         except Exception as e:
-            return Response({"error": "댓글 삭제 중 오류 발생"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
\ No newline at end of file
+            return Response({"error": "댓글 삭제 중 오류 발생"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+def _format_sse(event):
+    payload = {
+        "type": event.event_type,
+        "movie_id": event.movie_id,
+        "comment_id": str(event.comment_id),
+        "comment": CommentResponseSerializer(event.comment).data if event.comment else None,
+    }
+    return f"event: {event.event_type}\ndata: {json.dumps(payload, ensure_ascii=False)}\n\n"
+
+
+async def movie_comment_stream(request, movie_id):
+    """
+    영화의 댓글 생성/수정/삭제를 Server-Sent Events로 전달한다. ASGI 서버(asgi.py)에서만 스트리밍된다.
+    - 구독 전/재연결 사이에 놓친 댓글은 목록 API의 since 조회로 받는다.
+    - 큐가 넘쳐 이벤트를 버렸다면 resync 이벤트를 보내 since 조회로 다시 맞추게 한다.
+    - 연결이 끊겨도 서버가 알 수 없는 경우를 대비해 COMMENT_STREAM_MAX_SECONDS 후 스트림을 닫고, 클라이언트가 다시 연결한다.
+    """
+    if request.method != 'GET':
+        return HttpResponseNotAllowed(['GET'])
+    if not isinstance(request, ASGIRequest):
+        # WSGI에서는 Django가 비동기 제너레이터를 끝까지 읽은 뒤에야 응답을 보내므로 스트림이 되지 않는다.
+        return JsonResponse({"error": "댓글 스트림은 ASGI 서버(uvicorn 등)에서만 제공됩니다."}, status=501)
+
+    heartbeat_seconds = getattr(settings, 'COMMENT_STREAM_HEARTBEAT_SECONDS', 15)
+    max_seconds = getattr(settings, 'COMMENT_STREAM_MAX_SECONDS', 300)
+
+    async def event_stream():
+        # 동기 미들웨어가 있으면 뷰 본문은 별도 이벤트 루프에서 실행되므로,
+        # 구독은 응답을 실제로 전송하는 루프(이 제너레이터)에서 만든다.
+        subscription = get_comment_event_backend().subscribe(movie_id)
+        deadline = time.monotonic() + max_seconds
+        try:
+            yield "retry: 3000\n\n"
+            while (remaining := deadline - time.monotonic()) > 0:
+                event = await subscription.get(timeout=min(heartbeat_seconds, remaining))
+                if subscription.overflowed:
+                    subscription.overflowed = False
+                    yield "event: resync\ndata: {}\n\n"
+                yield _format_sse(event) if event else ": keep-alive\n\n"
+        finally:
+            subscription.close()
+
+    response = StreamingHttpResponse(event_stream(), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'  # 프록시(nginx) 버퍼링을 끈다.
+    return response
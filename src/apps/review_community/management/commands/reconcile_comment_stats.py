@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from src.apps.review_community.infrastructure.comment_stats import MovieCommentStats
+
+
+class Command(BaseCommand):
+    help = "영화별 댓글 수와 마지막 댓글 시각(movie_comment_stats)을 댓글 테이블에서 다시 계산해 맞춥니다."
+
+    def handle(self, *args, **options):
+        movie_count, mismatched = MovieCommentStats().reconcile()
+        self.stdout.write(self.style.SUCCESS(
+            f"영화 {movie_count}편의 댓글 통계를 다시 계산했습니다. 값이 달랐던 영화: {mismatched}편"
+        ))
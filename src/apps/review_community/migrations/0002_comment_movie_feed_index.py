@@ -0,0 +1,17 @@
+# Generated by Django 4.2.20 on 2026-10-17 22:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('review_community', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='commentmodel',
+            index=models.Index(fields=['movie', 'created_at', 'id'], name='comment_movie_feed_idx'),
+        ),
+    ]
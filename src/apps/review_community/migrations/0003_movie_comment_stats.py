@@ -0,0 +1,42 @@
+# Generated by Django 4.2.20 on 2026-10-17 22:48
+
+from django.db import migrations, models
+import django.db.models.deletion
+from django.db.models import Count, Max
+
+
+def backfill_comment_stats(apps, schema_editor):
+    # 기존 댓글로 통계를 채운다. 이후에는 댓글 저장 경로와 reconcile_comment_stats 명령이 갱신한다.
+    comment_model = apps.get_model('review_community', 'CommentModel')
+    stats_model = apps.get_model('review_community', 'MovieCommentStatsModel')
+    rows = [
+        stats_model(movie_id=movie_id, comment_count=comment_count, last_comment_at=last_comment_at)
+        for movie_id, comment_count, last_comment_at in comment_model.objects.values_list('movie_id').annotate(
+            comment_count=Count('id'), last_comment_at=Max('created_at')).order_by()
+    ]
+    stats_model.objects.bulk_create(rows, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movie', '0006_movie_rankings'),
+        ('review_community', '0002_comment_movie_feed_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MovieCommentStatsModel',
+            fields=[
+                ('movie', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='comment_stats', serialize=False, to='movie.moviemodel')),
+                ('comment_count', models.PositiveIntegerField(default=0)),
+                ('last_comment_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'verbose_name': '영화 댓글 통계',
+                'verbose_name_plural': '영화 댓글 통계 목록',
+                'db_table': 'movie_comment_stats',
+            },
+        ),
+        migrations.RunPython(backfill_comment_stats, migrations.RunPython.noop),
+    ]
@@ -27,6 +27,10 @@ class CommentModel(models.Model):
     class Meta:
         db_table = "movie_comments"
         ordering = ['-created_at']
+        indexes = [
+            # 영화별 댓글 목록(최신순/오래된 순)과 커서/since 조회용
+            models.Index(fields=['movie', 'created_at', 'id'], name='comment_movie_feed_idx'),
+        ]
         verbose_name = "영화 댓글"
         verbose_name_plural = "영화 댓글 목록"
 
@@ -41,4 +45,26 @@ class CommentModel(models.Model):
         if hasattr(self.movie, 'korean_title'): # MovieModel에 korean_title 필드가 있다고 가정
             movie_title = self.movie.korean_title
             
-        return f"Comment by {author_display} on movie '{movie_title}': {self.content[:30]}"
\ No newline at end of file
+        return f"Comment by {author_display} on movie '{movie_title}': {self.content[:30]}"
+
+class MovieCommentStatsModel(models.Model):
+    """
+    영화별 댓글 수와 마지막 댓글 작성 시각. 댓글 저장 경로(DjangoCommentThreadRepository.save)가
+    같은 트랜잭션에서 갱신하고, 어긋나면 reconcile_comment_stats 명령으로 다시 맞춘다.
+    """
+    movie = models.OneToOneField(
+        'movie.MovieModel',
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="comment_stats"
+    )
+    comment_count = models.PositiveIntegerField(default=0)
+    last_comment_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = "movie_comment_stats"
+        verbose_name = "영화 댓글 통계"
+        verbose_name_plural = "영화 댓글 통계 목록"
+
+    def __str__(self):
+        return f"Movie {self.movie_id}: {self.comment_count} comments"
@@ -7,10 +7,11 @@ from datetime import datetime, timedelta
 from src.apps.review_community.application.services import CommentAppService
 from src.apps.review_community.application.dtos import (
     CreateCommentRequestDto, UpdateCommentRequestDto,
-    CommentDto, PaginationInfoRequestDto
+    CommentDto, PaginationInfoRequestDto, CommentEventDto
 )
 from src.apps.review_community.domain.aggregates.comment_thread import CommentThread
 from src.apps.review_community.domain.aggregates.comment import Comment
+from src.apps.review_community.domain.repositories import CommentPage
 from src.apps.review_community.domain.value_objects.comment_id_vo import CommentIdVO
 from src.apps.review_community.domain.value_objects.comment_content_vo import CommentContentVO
 from src.apps.review_community.domain.value_objects.author_profile_vo import AuthorProfileVO
@@ -23,8 +24,10 @@ class TestCommentAppService(unittest.TestCase):
 
     def setUp(self):
         self.mock_comment_thread_repository = Mock()
+        self.mock_comment_query_repository = Mock()
         self.comment_app_service = CommentAppService(
-            comment_thread_repository=self.mock_comment_thread_repository
+            comment_thread_repository=self.mock_comment_thread_repository,
+            comment_query_repository=self.mock_comment_query_repository
         )
         self.movie_id = 1
         self.author_id = 100
@@ -47,7 +50,7 @@ class TestCommentAppService(unittest.TestCase):
             author_user_instance=self.mock_author_user,
             request_dto=request_dto
         )
-        self.mock_comment_thread_repository.find_by_movie_id.assert_called_once_with(self.movie_id)
+        self.mock_comment_thread_repository.find_by_movie_id.assert_called_once_with(self.movie_id, comment_ids=[])
         self.mock_comment_thread_repository.save.assert_called_once()
         saved_thread_arg = self.mock_comment_thread_repository.save.call_args[0][0]
         self.assertIsInstance(saved_thread_arg, CommentThread)
@@ -80,54 +83,56 @@ class TestCommentAppService(unittest.TestCase):
 
     def test_get_comments_for_movie_no_comments(self):
         # 계약: 댓글이 없는 영화에 대해 댓글 목록 조회 시, 빈 리스트와 올바른 페이지 정보를 반환해야 한다.
-        self.mock_comment_thread_repository.find_by_movie_id.return_value = CommentThread(movie_id=self.movie_id, comments=[])
+        self.mock_comment_query_repository.page_for_movie.return_value = CommentPage(comments=[], total_count=0, page=1)
         pagination_dto = PaginationInfoRequestDto(page=1, page_size=10)
         result_list_dto = self.comment_app_service.get_comments_for_movie(self.movie_id, pagination_dto)
         self.assertEqual(len(result_list_dto.comments), 0)
         self.assertEqual(result_list_dto.total_count, 0)
 
     def test_get_comments_for_movie_with_pagination(self):
-        # 계약: 댓글 목록 조회 시 페이지네이션이 올바르게 적용되어야 한다. (최신순 정렬)
-        comments_entities = []
+        # 계약: 댓글 목록 조회는 스레드 전체를 불러오지 않고 조회 포트에 페이지를 위임해야 하며,
+        #       포트가 반환한 페이지의 댓글과 페이지 정보를 그대로 DTO로 변환해야 한다.
         base_time = datetime.now()
-        for i in range(15): # 15개의 댓글 생성 (0~14)
-            comment_id = CommentIdVO.generate()
-            # 댓글 내용에 순번을 넣어 구분, 최신 댓글이 내용 "댓글 내용 15"가 되도록
-            content = CommentContentVO(f"댓글 내용 {15-i}") 
-            author = AuthorProfileVO(account_id=i+1, nickname=f"작성자{i+1}")
-            # 최신 댓글이 created_at 값이 가장 크도록 생성 (가장 나중에 생성)
-            comments_entities.append(Comment(comment_id, content, author, base_time + timedelta(minutes=i)))
-        
-        # 서비스는 내부적으로 created_at으로 역순 정렬하므로,
-        # comments_entities를 그대로 전달해도 서비스에서 정렬됨.
-        # 또는 테스트에서 미리 역순 정렬된 리스트를 만들어 전달할 수도 있음.
-        # 여기서는 서비스의 정렬 로직을 믿고 그대로 전달.
-        mock_thread = CommentThread(movie_id=self.movie_id, comments=comments_entities)
-        self.mock_comment_thread_repository.find_by_movie_id.return_value = mock_thread
-
-        pagination_dto_page1 = PaginationInfoRequestDto(page=1, page_size=5)
-        result_page1 = self.comment_app_service.get_comments_for_movie(self.movie_id, pagination_dto_page1)
-        
-        self.assertEqual(len(result_page1.comments), 5)
-        self.assertEqual(result_page1.total_count, 15)
-        self.assertEqual(result_page1.page, 1)
-        self.assertEqual(result_page1.total_pages, 3)
-        # 서비스에서 created_at 역순 정렬하므로, 가장 최근에 만들어진 댓글이 첫 번째
-        # base_time + timedelta(minutes=14)가 가장 최근 댓글 (내용은 "댓글 내용 1")
-        # base_time + timedelta(minutes=0)이 가장 오래된 댓글 (내용은 "댓글 내용 15")
-        # 서비스 로직: sorted(comment_thread.comments, key=lambda c: c.created_at, reverse=True)
-        # 따라서, result_page1.comments[0]은 comments_entities[14] (내용: "댓글 내용 1") 이어야 함
-        self.assertEqual(result_page1.comments[0].content, "댓글 내용 1") 
-        self.assertEqual(result_page1.comments[4].content, "댓글 내용 5")
-
+        page_comments = [
+            Comment(CommentIdVO.generate(), CommentContentVO(f"댓글 내용 {i}"),
+                    AuthorProfileVO(account_id=i, nickname=f"작성자{i}"), base_time - timedelta(minutes=i))
+            for i in range(11, 16)
+        ]
+        self.mock_comment_query_repository.page_for_movie.return_value = CommentPage(
+            comments=page_comments, total_count=15, page=3
+        )
 
         pagination_dto_page3 = PaginationInfoRequestDto(page=3, page_size=5)
         result_page3 = self.comment_app_service.get_comments_for_movie(self.movie_id, pagination_dto_page3)
+
+        self.mock_comment_query_repository.page_for_movie.assert_called_once_with(self.movie_id, 3, 5)
+        self.mock_comment_thread_repository.find_by_movie_id.assert_not_called()
         self.assertEqual(len(result_page3.comments), 5)
-        # 3페이지의 첫번째 댓글은 comments_entities[4] (내용: "댓글 내용 11")
+        self.assertEqual(result_page3.total_count, 15)
+        self.assertEqual(result_page3.page, 3)
+        self.assertEqual(result_page3.total_pages, 3)
         self.assertEqual(result_page3.comments[0].content, "댓글 내용 11")
         self.assertEqual(result_page3.comments[4].content, "댓글 내용 15")
+        self.assertEqual(result_page3.comments[0].movie_id, self.movie_id)
+
 
+    def test_get_comments_for_movie_with_since_uses_feed(self):
+        # 계약: cursor/since가 있으면 feed_for_movie로 조회하고, 전체 개수 없이 커서를 그대로 전달해야 한다.
+        self.mock_comment_query_repository.feed_for_movie.return_value = CommentPage(
+            comments=[], total_count=None, page=None, since_cursor="다음-since"
+        )
+
+        result = self.comment_app_service.get_comments_for_movie(
+            self.movie_id, PaginationInfoRequestDto(page_size=20, since="이전-since")
+        )
+
+        self.mock_comment_query_repository.feed_for_movie.assert_called_once_with(
+            self.movie_id, 20, cursor=None, since="이전-since"
+        )
+        self.mock_comment_query_repository.page_for_movie.assert_not_called()
+        self.assertIsNone(result.total_count)
+        self.assertIsNone(result.total_pages)
+        self.assertEqual(result.since_cursor, "다음-since")
 
     def test_update_own_comment_successfully(self):
         # 계약: 사용자는 자신이 작성한 댓글의 내용을 성공적으로 수정할 수 있어야 한다.
@@ -147,6 +152,9 @@ class TestCommentAppService(unittest.TestCase):
             author_account_id=self.author_id,
             request_dto=update_request_dto
         )
+        self.mock_comment_thread_repository.find_by_movie_id.assert_called_once_with(
+            self.movie_id, comment_ids=[comment_id_vo]
+        )
         self.mock_comment_thread_repository.save.assert_called_once_with(mock_thread)
         self.assertIsNotNone(result_dto)
         self.assertEqual(result_dto.content, "수정된 댓글입니다.")
@@ -212,5 +220,32 @@ class TestCommentAppService(unittest.TestCase):
                 author_account_id=other_author_id
             )
 
+    def test_comment_changes_publish_events(self):
+        # 계약: 댓글 추가/삭제가 저장되면 이벤트 발행 포트로 생성/삭제 이벤트를 발행해야 하고,
+        #       실제로 삭제된 댓글이 없으면 발행하지 않아야 한다.
+        publisher = Mock()
+        service = CommentAppService(
+            comment_thread_repository=self.mock_comment_thread_repository,
+            comment_query_repository=self.mock_comment_query_repository,
+            comment_event_publisher=publisher
+        )
+        self.mock_comment_thread_repository.find_by_movie_id.return_value = CommentThread(movie_id=self.movie_id)
+        created = service.add_comment_to_movie(self.mock_author_user, CreateCommentRequestDto(self.movie_id, "실시간"))
+
+        comment_id_vo = CommentIdVO(created.comment_id)
+        own_comment = Comment(comment_id_vo, CommentContentVO("실시간"),
+                              AuthorProfileVO(self.author_id, self.author_nickname), datetime.now())
+        self.mock_comment_thread_repository.find_by_movie_id.return_value = CommentThread(
+            movie_id=self.movie_id, comments=[own_comment])
+        service.delete_comment(self.movie_id, created.comment_id, self.author_id)
+        self.mock_comment_thread_repository.find_by_movie_id.return_value = CommentThread(movie_id=self.movie_id)
+        service.delete_comment(self.movie_id, created.comment_id, self.author_id)
+
+        events = [c.args[0] for c in publisher.publish.call_args_list]
+        self.assertEqual([e.event_type for e in events], [CommentEventDto.CREATED, CommentEventDto.DELETED])
+        self.assertEqual(events[0].comment.content, "실시간")
+        self.assertEqual({e.comment_id for e in events}, {created.comment_id})
+        self.assertIsNone(events[1].comment)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -129,6 +129,42 @@ class TestCommentThreadAggregate(unittest.TestCase):
         except Exception as e:
             self.fail(f"존재하지 않는 댓글 삭제 시 예외 발생: {e}")
 
+    def test_pending_changes_record_added_edited_and_removed_comments(self):
+        # 계약: 스레드는 불러온 뒤 추가/수정/삭제된 댓글을 변경 사항으로 기록해야 하며,
+        #       clear_pending_changes 이후에는 변경 사항이 없어야 한다.
+        loaded1 = Comment(CommentIdVO.generate(), self.content_vo1, self.author1, datetime.now())
+        loaded2 = Comment(CommentIdVO.generate(), self.content_vo2, self.author2, datetime.now())
+        thread = CommentThread(movie_id=self.movie_id, comments=[loaded1, loaded2])
+        self.assertFalse(thread.has_pending_changes)
+
+        added = thread.add_comment(author=self.author1, content=self.content_vo1)
+        thread.update_comment_content(loaded1.comment_id, CommentContentVO("수정"), self.author1.account_id)
+        thread.delete_comment(loaded2.comment_id, self.author2.account_id)
+
+        self.assertEqual(thread.added_comments, [added])
+        self.assertEqual(thread.edited_comments, [loaded1])
+        self.assertEqual(thread.removed_comment_ids, [loaded2.comment_id])
+        thread.clear_pending_changes()
+        self.assertFalse(thread.has_pending_changes)
+
+    def test_pending_changes_collapse_within_one_unit_of_work(self):
+        # 계약: 같은 변경 단위에서 추가 후 수정한 댓글은 추가로만, 추가 후 삭제한 댓글은 아무 변경도 아닌 것으로,
+        #       수정 후 삭제한 댓글은 삭제로만 기록해야 한다. 같은 내용으로의 수정은 변경이 아니다.
+        loaded = Comment(CommentIdVO.generate(), self.content_vo1, self.author1, datetime.now())
+        thread = CommentThread(movie_id=self.movie_id, comments=[loaded])
+        kept = thread.add_comment(author=self.author1, content=self.content_vo1)
+        thread.update_comment_content(kept.comment_id, CommentContentVO("바로 수정"), self.author1.account_id)
+        dropped = thread.add_comment(author=self.author1, content=self.content_vo2)
+        thread.delete_comment(dropped.comment_id, self.author1.account_id)
+        thread.update_comment_content(loaded.comment_id, self.content_vo1, self.author1.account_id)
+        self.assertEqual(thread.edited_comments, [])
+        thread.update_comment_content(loaded.comment_id, CommentContentVO("수정"), self.author1.account_id)
+        thread.delete_comment(loaded.comment_id, self.author1.account_id)
+
+        self.assertEqual(thread.added_comments, [kept])
+        self.assertEqual(thread.edited_comments, [])
+        self.assertEqual(thread.removed_comment_ids, [loaded.comment_id])
+
     def test_comment_thread_equality(self):
         # 계약: 두 CommentThread 애그리게이트는 movie_id가 같으면 동등해야 한다.
         thread1 = CommentThread(movie_id=123)
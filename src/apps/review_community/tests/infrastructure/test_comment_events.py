@@ -0,0 +1,64 @@
+import asyncio
+import threading
+
+from src.apps.review_community.application.dtos import CommentEventDto
+from src.apps.review_community.infrastructure.comment_events import InProcessCommentEventBackend
+
+
+def created_event(movie_id, comment_id="c1"):
+    return CommentEventDto(CommentEventDto.CREATED, movie_id, comment_id)
+
+
+# 계약: 다른 스레드에서 발행한 이벤트는 같은 영화의 구독자에게만 전달되어야 한다.
+def test_publish_from_other_thread_reaches_movie_subscribers():
+    backend = InProcessCommentEventBackend(max_queue_size=10)
+
+    async def scenario():
+        subscription = backend.subscribe(1)
+        other_movie = backend.subscribe(2)
+        publisher = threading.Thread(target=backend.publish, args=(created_event(1),))
+        publisher.start()
+        publisher.join()
+        event = await subscription.get(timeout=1)
+        nothing = await other_movie.get(timeout=0.01)
+        subscription.close()
+        other_movie.close()
+        return event, nothing
+
+    event, nothing = asyncio.run(scenario())
+
+    assert (event.event_type, event.movie_id) == (CommentEventDto.CREATED, 1)
+    assert nothing is None
+    assert backend.subscriber_count(1) == 0
+
+
+# 계약: 큐가 가득 차면 가장 오래된 이벤트를 버리고 overflowed를 표시해야 한다.
+def test_full_queue_drops_oldest_and_marks_overflow():
+    backend = InProcessCommentEventBackend(max_queue_size=2)
+
+    async def scenario():
+        subscription = backend.subscribe(1)
+        for comment_id in ("c1", "c2", "c3"):
+            backend.publish(created_event(1, comment_id))
+        await asyncio.sleep(0)
+        received = [(await subscription.get(timeout=1)).comment_id for _ in range(2)]
+        subscription.close()
+        return received, subscription.overflowed
+
+    received, overflowed = asyncio.run(scenario())
+
+    assert received == ["c2", "c3"]
+    assert overflowed
+
+
+# 계약: 이벤트 루프가 닫힌 구독자에게 발행하면 오류 없이 구독이 정리되어야 한다.
+def test_publish_to_closed_loop_unsubscribes():
+    backend = InProcessCommentEventBackend()
+
+    async def scenario():
+        backend.subscribe(1)
+
+    asyncio.run(scenario())
+    backend.publish(created_event(1))
+
+    assert backend.subscriber_count(1) == 0
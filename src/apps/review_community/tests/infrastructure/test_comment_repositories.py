@@ -0,0 +1,184 @@
+import pytest
+from django.contrib.auth import get_user_model
+
+from src.apps.movie.models import MovieModel
+from src.apps.review_community.domain.value_objects.author_profile_vo import AuthorProfileVO
+from src.apps.review_community.domain.value_objects.comment_content_vo import CommentContentVO
+from src.apps.review_community.domain.value_objects.comment_id_vo import CommentIdVO
+from src.apps.review_community.infrastructure.repositories import DjangoCommentQueryRepository, \
+    DjangoCommentThreadRepository
+from src.apps.review_community.infrastructure.comment_stats import MovieCommentStats
+from src.apps.review_community.models import CommentModel, MovieCommentStatsModel
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def movie_with_comments():
+    movie = MovieModel.objects.create(korean_title="기생충")
+    author = get_user_model().objects.create_user(email_address="comment@example.com", nickname="댓글러")
+    for i in range(12):
+        CommentModel.objects.create(movie=movie, author=author, content=f"댓글 {i}")
+    MovieCommentStats().reconcile()
+    return movie
+
+
+# 계약: page_for_movie는 최신순으로 요청한 페이지의 댓글만 반환하고, 전체 개수를 함께 알려야 한다.
+def test_page_for_movie_returns_latest_first(movie_with_comments):
+    page = DjangoCommentQueryRepository().page_for_movie(movie_with_comments.id, page=1, page_size=5)
+
+    assert page.total_count == 12
+    assert page.page == 1
+    assert [c.content.text for c in page.comments] == [f"댓글 {i}" for i in range(11, 6, -1)]
+    assert page.comments[0].author.nickname == "댓글러"
+
+
+# 계약: 마지막 페이지를 넘는 요청은 마지막 페이지를 반환해야 한다.
+def test_page_for_movie_clamps_to_last_page(movie_with_comments):
+    page = DjangoCommentQueryRepository().page_for_movie(movie_with_comments.id, page=9, page_size=5)
+
+    assert page.page == 3
+    assert [c.content.text for c in page.comments] == ["댓글 1", "댓글 0"]
+
+
+# 계약: 조회 쿼리 수는 댓글 수와 무관해야 한다. (통계 1회 + 페이지 1회)
+def test_page_for_movie_uses_two_queries(movie_with_comments, django_assert_num_queries):
+    with django_assert_num_queries(2):
+        DjangoCommentQueryRepository().page_for_movie(movie_with_comments.id, page=2, page_size=5)
+
+
+# 계약: 댓글이 없는 영화는 빈 첫 페이지를 반환해야 한다.
+def test_page_for_movie_without_comments():
+    movie = MovieModel.objects.create(korean_title="조용한 영화")
+
+    page = DjangoCommentQueryRepository().page_for_movie(movie.id, page=1, page_size=10)
+
+    assert (page.comments, page.total_count, page.page) == ([], 0, 1)
+
+
+# 계약: 댓글 추가는 기존 댓글 수와 무관하게 INSERT 한 번과 통계 갱신만으로 저장되어야 한다.
+def test_save_inserts_only_added_comment(movie_with_comments, django_assert_num_queries):
+    repository = DjangoCommentThreadRepository()
+    author = get_user_model().objects.get(nickname="댓글러")
+    thread = repository.find_by_movie_id(movie_with_comments.id, comment_ids=[])
+    added = thread.add_comment(AuthorProfileVO(account_id=author.pk, nickname="댓글러"), CommentContentVO("새 댓글"))
+
+    with django_assert_num_queries(5):  # SAVEPOINT, INSERT, 통계 행 확인, 통계 UPDATE, RELEASE
+        repository.save(thread)
+
+    assert CommentModel.objects.filter(movie=movie_with_comments).count() == 13
+    assert MovieCommentStats().get(movie_with_comments.id) == (13, CommentModel.objects.get(id=added.comment_id.value).created_at)
+    assert CommentModel.objects.get(id=added.comment_id.value).content == "새 댓글"
+    assert not thread.has_pending_changes
+
+
+# 계약: 부분 스레드로 수정/삭제하면 대상 댓글만 UPDATE/DELETE되고 나머지 댓글은 그대로여야 한다.
+def test_save_applies_edits_and_removals_on_partial_thread(movie_with_comments):
+    repository = DjangoCommentThreadRepository()
+    first, second = CommentModel.objects.filter(movie=movie_with_comments).order_by('created_at')[:2]
+    ids = [CommentIdVO(str(first.id)), CommentIdVO(str(second.id))]
+    thread = repository.find_by_movie_id(movie_with_comments.id, comment_ids=ids)
+    assert thread.get_comment_count() == 2
+
+    thread.update_comment_content(ids[0], CommentContentVO("수정된 댓글"), first.author_id)
+    thread.delete_comment(ids[1], second.author_id)
+    repository.save(thread)
+
+    assert CommentModel.objects.get(id=first.id).content == "수정된 댓글"
+    assert not CommentModel.objects.filter(id=second.id).exists()
+    assert CommentModel.objects.filter(movie=movie_with_comments).count() == 11
+
+
+# 계약: cursor 조회는 최신순으로 이어지며, 페이지를 모두 이으면 전체 댓글을 중복 없이 한 번씩 돌려줘야 한다.
+def test_feed_for_movie_cursor_walks_all_comments(movie_with_comments):
+    repository = DjangoCommentQueryRepository()
+    seen, cursor = [], None
+    while True:
+        page = repository.feed_for_movie(movie_with_comments.id, page_size=5, cursor=cursor)
+        assert page.total_count == 12
+        assert page.page is None
+        seen += [c.content.text for c in page.comments]
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert seen == [f"댓글 {i}" for i in range(11, -1, -1)]
+
+
+# 계약: since 조회는 since 커서 이후에 작성된 댓글만 오래된 순으로 돌려주고, 다음 폴링용 since_cursor를 갱신해야 한다.
+def test_feed_for_movie_since_returns_only_newer_comments(movie_with_comments):
+    repository = DjangoCommentQueryRepository()
+    first_page = repository.feed_for_movie(movie_with_comments.id, page_size=5)
+    author = get_user_model().objects.get(nickname="댓글러")
+    for i in range(12, 14):
+        CommentModel.objects.create(movie=movie_with_comments, author=author, content=f"댓글 {i}")
+
+    delta = repository.feed_for_movie(movie_with_comments.id, page_size=10, since=first_page.since_cursor)
+    idle = repository.feed_for_movie(movie_with_comments.id, page_size=10, since=delta.since_cursor)
+
+    assert [c.content.text for c in delta.comments] == ["댓글 12", "댓글 13"]
+    assert idle.comments == []
+    assert idle.since_cursor == delta.since_cursor
+
+
+# 계약: 정렬이 다른 커서나 손상된 커서는 ValueError로 거부해야 한다.
+def test_feed_for_movie_rejects_invalid_cursor(movie_with_comments):
+    repository = DjangoCommentQueryRepository()
+    first_page = repository.feed_for_movie(movie_with_comments.id, page_size=5)
+
+    with pytest.raises(ValueError):
+        repository.feed_for_movie(movie_with_comments.id, page_size=5, cursor=first_page.since_cursor)
+    with pytest.raises(ValueError):
+        repository.feed_for_movie(movie_with_comments.id, page_size=5, since="손상된커서")
+
+
+# 계약: 삭제 후 통계의 댓글 수는 줄어들고, 마지막 댓글 시각은 남은 댓글 중 가장 최근 값이어야 한다.
+def test_save_removal_updates_stats(movie_with_comments):
+    repository = DjangoCommentThreadRepository()
+    latest = CommentModel.objects.filter(movie=movie_with_comments).order_by('-created_at')[:2]
+    latest_id, remaining_latest = CommentIdVO(str(latest[0].id)), latest[1]
+    thread = repository.find_by_movie_id(movie_with_comments.id, comment_ids=[latest_id])
+
+    thread.delete_comment(latest_id, remaining_latest.author_id)
+    repository.save(thread)
+
+    assert MovieCommentStats().get(movie_with_comments.id) == (11, remaining_latest.created_at)
+
+
+# 계약: reconcile은 어긋난 통계를 댓글 테이블 기준으로 바로잡고, 바로잡은 영화 수를 알려야 한다.
+def test_reconcile_repairs_drifted_stats(movie_with_comments):
+    MovieCommentStatsModel.objects.filter(movie=movie_with_comments).update(comment_count=99)
+
+    assert MovieCommentStats().reconcile() == (1, 1)
+    assert MovieCommentStats().get(movie_with_comments.id)[0] == 12
+    assert MovieCommentStats().reconcile() == (1, 0)
+
+
+# 계약: 계정 삭제로 댓글이 cascade 삭제되면 통계의 댓글 수와 마지막 댓글 시각도 남은 댓글 기준으로 줄어야 한다.
+def test_deleting_author_discounts_stats(movie_with_comments):
+    other = get_user_model().objects.create_user(email_address="leaving@example.com", nickname="탈퇴예정")
+    CommentModel.objects.create(movie=movie_with_comments, author=other, content="곧 사라질 댓글")
+    MovieCommentStats().reconcile()
+    remaining_latest = CommentModel.objects.filter(movie=movie_with_comments).exclude(author=other).first()
+
+    other.delete()
+
+    assert MovieCommentStats().get(movie_with_comments.id) == (12, remaining_latest.created_at)
+    assert MovieCommentStats().reconcile() == (1, 0)
+
+
+# 계약: 통계가 실제보다 적거나 많아도 페이지 조회는 실제 댓글을 기준으로 반환하고, 마지막 페이지에서는 실제 개수를 알려야 한다.
+def test_page_for_movie_does_not_trust_drifted_stats(movie_with_comments):
+    repository = DjangoCommentQueryRepository()
+    MovieCommentStatsModel.objects.filter(movie=movie_with_comments).delete()
+
+    first = repository.page_for_movie(movie_with_comments.id, page=1, page_size=5)
+
+    assert len(first.comments) == 5 and first.next_cursor is not None
+
+    MovieCommentStatsModel.objects.create(movie=movie_with_comments, comment_count=40)
+    past_end = repository.page_for_movie(movie_with_comments.id, page=6, page_size=5)
+
+    assert past_end.page == 3
+    assert [c.content.text for c in past_end.comments] == ["댓글 1", "댓글 0"]
+    assert (past_end.total_count, past_end.next_cursor) == (12, None)
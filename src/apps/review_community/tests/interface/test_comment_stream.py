@@ -0,0 +1,54 @@
+import asyncio
+import datetime
+
+import pytest
+from django.test import AsyncClient
+from django.urls import reverse
+
+from src.apps.review_community.application.dtos import CommentEventDto, CommentDto, CommentAuthorDto
+# 뷰와 같은 'src.apps.' 경로로 임포트해야 같은 백엔드 싱글턴을 쓴다.
+from src.apps.review_community.infrastructure.comment_events import get_comment_event_backend
+
+
+async def next_chunk(response):
+    chunk = await asyncio.wait_for(response.streaming_content.__anext__(), timeout=1)
+    return chunk.decode() if isinstance(chunk, bytes) else chunk
+
+
+# 계약: 스트림은 text/event-stream으로 응답하고, 발행된 댓글 이벤트를 SSE 형식으로 전달해야 한다.
+@pytest.mark.django_db
+def test_comment_stream_delivers_published_events(settings):
+    settings.COMMENT_STREAM_HEARTBEAT_SECONDS = 0.05
+    url = reverse('movie_comment_stream', kwargs={'movie_id': 7})
+    comment = CommentDto(
+        comment_id="4b5a3c1e-1111-4c2b-9a51-2d2f5f0c7e01", movie_id=7,
+        author=CommentAuthorDto(account_id=1, nickname="댓글러"), content="실시간 댓글",
+        created_at=datetime.datetime(2026, 10, 17, 12, 0), modified_at=datetime.datetime(2026, 10, 17, 12, 0)
+    )
+
+    async def scenario():
+        response = await AsyncClient().get(url)
+        chunks = [await next_chunk(response)]
+        get_comment_event_backend().publish(CommentEventDto(CommentEventDto.CREATED, 7, comment.comment_id, comment))
+        chunks.append(await next_chunk(response))
+        chunks.append(await next_chunk(response))  # 이벤트가 없으면 keep-alive
+        await response.streaming_content.aclose()
+        return response, chunks
+
+    response, chunks = asyncio.run(scenario())
+
+    assert response['Content-Type'] == 'text/event-stream'
+    assert chunks[0].startswith("retry:")
+    assert chunks[1].startswith("event: comment.created\n")
+    assert '"content": "실시간 댓글"' in chunks[1]
+    assert chunks[2] == ": keep-alive\n\n"
+    assert get_comment_event_backend().subscriber_count(7) == 0
+
+
+# 계약: WSGI로 요청되면 응답을 모아 보내는 대신 501로 ASGI 서버가 필요함을 알려야 한다.
+@pytest.mark.django_db
+def test_comment_stream_requires_asgi(client):
+    response = client.get(reverse('movie_comment_stream', kwargs={'movie_id': 7}))
+
+    assert response.status_code == 501
+    assert get_comment_event_backend().subscriber_count(7) == 0
@@ -0,0 +1,73 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from src.apps.movie.models import MovieModel
+from src.apps.review_community.infrastructure.comment_stats import MovieCommentStats
+from src.apps.review_community.models import CommentModel
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+
+@pytest.fixture
+def movie():
+    movie = MovieModel.objects.create(korean_title="기생충")
+    author = get_user_model().objects.create_user(email_address="view@example.com", nickname="댓글러")
+    for i in range(3):
+        CommentModel.objects.create(movie=movie, author=author, content=f"댓글 {i}")
+    MovieCommentStats().reconcile()
+    return movie
+
+
+# 계약: 페이지 모드는 page_number/page_size로 조회하고 전체 개수와 폴링용 since_cursor를 반환해야 한다.
+def test_comment_list_page_mode(api_client, movie):
+    url = reverse('movie_comment_list_create', kwargs={'movie_id': movie.id})
+    response = api_client.get(url, {'page_number': 1, 'page_size': 2})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [c['content'] for c in response.data['comments']] == ["댓글 2", "댓글 1"]
+    assert response.data['total_count'] == 3
+    assert response.data['total_pages'] == 2
+    assert response.data['since_cursor']
+
+
+# 계약: 첫 페이지의 next_cursor로 cursor 모드를 이어가고, since_cursor로 새 댓글만 받아올 수 있어야 한다.
+def test_comment_list_cursor_and_since_modes(api_client, movie):
+    url = reverse('movie_comment_list_create', kwargs={'movie_id': movie.id})
+    first = api_client.get(url, {'page_size': 2})
+
+    rest = api_client.get(url, {'page_size': 2, 'cursor': first.data['next_cursor']})
+    assert rest.status_code == status.HTTP_200_OK
+    assert [c['content'] for c in rest.data['comments']] == ["댓글 0"]
+    assert rest.data['total_count'] == 3
+    assert rest.data['total_pages'] is None
+    assert rest.data['next_cursor'] is None
+
+    CommentModel.objects.create(movie=movie, author=get_user_model().objects.get(nickname="댓글러"), content="새 댓글")
+    delta = api_client.get(url, {'since': first.data['since_cursor']})
+    assert [c['content'] for c in delta.data['comments']] == ["새 댓글"]
+
+
+# 계약: 잘못된 커서는 400을 반환해야 한다.
+def test_comment_list_rejects_invalid_cursor(api_client, movie):
+    url = reverse('movie_comment_list_create', kwargs={'movie_id': movie.id})
+    first = api_client.get(url, {'page_size': 2})
+
+    response = api_client.get(url, {'cursor': first.data['since_cursor']})
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+# 계약: cursor와 since를 함께 보내면 400을 반환해야 한다.
+def test_comment_list_rejects_cursor_with_since(api_client, movie):
+    url = reverse('movie_comment_list_create', kwargs={'movie_id': movie.id})
+    response = api_client.get(url, {'cursor': 'a', 'since': 'b'})
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST